@@ -0,0 +1,96 @@
+# benchmarks/bench_asset_load.py
+# วัดเวลาโหลดรูปทั้งหมดที่เกมใช้ (ResourceManager ใหม่ทุกรอบ = cold cache ของเกม)
+#   - png       : decode PNG ต้นฉบับ + smoothscale
+#   - prescaled : ไฟล์ .rgba ที่ย่อไว้แล้ว (build_assets.py)
+#   - pack      : asset pack ไฟล์เดียวแบบ mmap (pack_assets.py)
+#
+# ต้องสร้าง cache ก่อน:
+#   python build_assets.py && python pack_assets.py pack
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python benchmarks/bench_asset_load.py --prefix enemy/ --repeat 3
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from build_assets import _iter_sources, _scales_for
+from config.settings import RESOURCE_SCALES
+from core.resource_manager import ResourceManager
+
+
+def _make_manager(mode: str) -> ResourceManager:
+    rm = ResourceManager(use_prescaled=(mode != "png"), **RESOURCE_SCALES)
+    if mode == "prescaled" and rm.pack is not None:
+        rm.pack.close()
+        rm.pack = None
+    return rm
+
+
+def _time(mode: str, requests: list[tuple[str, float]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        rm = _make_manager(mode)
+        t0 = time.perf_counter()
+        for rel_path, scale in requests:
+            rm.load_image(rel_path, scale_override=scale)
+        best = min(best, time.perf_counter() - t0)
+        if rm.pack is not None:
+            rm.pack.close()
+    return best
+
+
+def run(prefix: str, repeat: int) -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    graphics_dir = os.path.join("assets", "graphics")
+    probe = ResourceManager(**RESOURCE_SCALES)
+    # (path, scale) ตามที่เกมขอจริง (เช่น enemy ใช้ scale จาก ENEMY_CONFIG)
+    requests = [
+        (rel, scale)
+        for rel, _ in _iter_sources(graphics_dir)
+        if rel.startswith(prefix)
+        for scale in sorted(_scales_for(probe, rel, include_unscaled=True))
+    ]
+
+    modes = ["png"]
+    if probe.use_prescaled:
+        modes.append("prescaled")
+    else:
+        print("[WARN] ไม่มี prescaled cache (รัน build_assets.py ก่อน)")
+    if probe.pack is not None:
+        modes.append("pack")
+        probe.pack.close()
+    else:
+        print("[WARN] ไม่มี asset pack (รัน pack_assets.py pack ก่อน)")
+
+    results = {mode: _time(mode, requests, repeat) for mode in modes}
+
+    base = results["png"]
+    print(f"{len(requests)} images (prefix={prefix!r}), best of {repeat}")
+    print(f"{'mode':>10} | {'total ms':>9} | {'ms/image':>9} | {'speedup':>8}")
+    print("-" * 46)
+    for name, t in results.items():
+        print(f"{name:>10} | {t * 1000:>9.1f} | {t * 1000 / max(len(requests), 1):>9.3f} | {base / t:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark image loading: PNG vs prescaled vs asset pack")
+    parser.add_argument("--prefix", default="", help="only images whose path starts with this (e.g. enemy/)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.prefix, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+# benchmarks/bench_crowd_scenarios.py
+# วัดเวลา GameScene.update / GameScene.draw แยกกัน บนด่านจริง (collision map จริง) กับฝูงศัตรูสังเคราะห์
+#   - crowd     : ศัตรู N ตัวรุมรอบผู้เล่น (separation หนัก)
+#   - storm     : ศัตรู N ตัวทั่วแมพ + ลูกธนู (มี comet trail) ค้างในจอ M ลูกตลอดเวลา
+#   - sword     : รุมรอบผู้เล่น + ฟัน sword_all_direction ทุกครั้งที่ cooldown หมด
+#   - lightning : ศัตรู N ตัวทั่วแมพ + magic_lightning_2 (ฟ้าผ่าทุกตัว) ทุกครั้งที่ cooldown หมด
+#
+# ผู้เล่น / ศัตรูตั้ง HP ไว้สูงมาก -> จำนวน sprite คงที่ตลอดการวัด เทียบข้าม commit ได้
+# ผลเขียนเป็น JSON (--out) และเทียบกับผลเก่าได้ (--compare)
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python benchmarks/bench_crowd_scenarios.py
+#   python benchmarks/bench_crowd_scenarios.py --scenarios crowd storm --enemies 10 500 2000 --out after.json
+#   python benchmarks/bench_crowd_scenarios.py --out after.json --compare before.json
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from combat.damage_system import DamagePacket
+from config.settings import FPS, SIM_HZ
+from core.game_app import GameApp
+from entities.enemy_node import EnemyNode
+from entities.projectile_node import ProjectileNode
+from scenes.game_scene import GameScene
+
+SCENARIOS = {
+    # name: (วางศัตรูแบบไหน, อาวุธของผู้เล่น, ใช้ลูกธนูค้างจอไหม)
+    "crowd": ("cluster", None, False),
+    "storm": ("spread", None, True),
+    "sword": ("cluster", "sword_all_direction", False),
+    "lightning": ("spread", "magic_lightning_2", False),
+}
+
+# จำนวนศัตรูสูงสุดต่อ scenario (ข้ามขนาดที่เกินถ้าไม่ใส่ --no-limit)
+# lightning: LightningEffectNode วาด 5 เฟรมขนาด bounding box ผู้เล่น->เป้าต่อเป้า 1 ตัว
+# บนแมพเต็มจอ ~500 เป้าก็ใช้ RAM เกิน 5 GB แล้ว
+MAX_ENEMIES = {"lightning": 300}
+
+IMMORTAL_HP = 1e12
+STORM_TRAIL_THEMES = ("plasma", "holy", "storm")
+
+
+# ---------------------------------------------------------------------------
+# World setup
+# ---------------------------------------------------------------------------
+def _make_immortal(stats) -> None:
+    stats.max_hp = IMMORTAL_HP
+    stats.hp = IMMORTAL_HP
+
+
+def _free_point(scene: GameScene, rng, center: pygame.Vector2 | None, radius: float) -> tuple[int, int]:
+    """สุ่มจุดที่ไม่ทับ collision rect ของ tilemap (center=None = ทั้งแมพ)"""
+    walls = scene.tilemap.collision_rects
+    probe = pygame.Rect(0, 0, 48, 48)
+    width, height = scene.tilemap.pixel_width, scene.tilemap.pixel_height
+    for _ in range(50):
+        if center is None:
+            x, y = rng.uniform(0, width), rng.uniform(0, height)
+        else:
+            a = rng.uniform(0, math.tau)
+            r = radius * math.sqrt(rng.random())
+            x, y = center.x + math.cos(a) * r, center.y + math.sin(a) * r
+        x = min(max(x, 24), width - 24)
+        y = min(max(y, 24), height - 24)
+        probe.center = (round(x), round(y))
+        if probe.collidelist(walls) < 0:
+            break
+    return probe.center
+
+
+def build_world(game: GameApp, level_id: str, scenario: str, enemies: int, seed: int) -> GameScene:
+    """
+    GameScene ของด่านจริงที่ไม่มี spawn wave: ใส่ศัตรู N ตัวเอง (ชนิดตาม enemy_spawns ของด่าน)
+    แล้วติดอาวุธให้ผู้เล่นตาม scenario
+    """
+    placement, weapon, _ = SCENARIOS[scenario]
+    game.rng.reseed(seed)
+    scene = GameScene(game, level_id=level_id)
+    game.scene_manager.set_scene(scene)
+    # ไม่ให้ wave เดิมของด่านมาเพิ่มศัตรู / ไม่ให้ stage clear
+    if hasattr(scene, "spawn_manager"):
+        del scene.spawn_manager
+    for enemy in list(scene.enemies):
+        enemy.kill()
+
+    rng = game.rng.stream("bench")
+    player = scene.player
+    _make_immortal(player.stats)
+    enemy_ids = scene.manifest.enemy_ids or ["goblin"]
+    center = pygame.Vector2(player.rect.center)
+    # รัศมีฝูงโตตาม sqrt(N) ให้ความหนาแน่นพอ ๆ กันทุกขนาด (ทับกันพอให้ separation ทำงานหนัก)
+    radius = 40.0 * math.sqrt(enemies) + 120.0
+    for i in range(enemies):
+        pos = _free_point(scene, rng, center if placement == "cluster" else None, radius)
+        enemy = EnemyNode(game, pos, scene.all_sprites, scene.enemies, enemy_id=enemy_ids[i % len(enemy_ids)])
+        _make_immortal(enemy.stats)
+
+    if weapon:
+        # buff อาวุธชั่วคราวแบบยาวพอสำหรับทั้งรอบวัด
+        if weapon.startswith("magic_lightning"):
+            player.activate_magic_lightning(weapon, duration=1e6)
+        else:
+            player.activate_sword_all_direction(weapon, duration=1e6)
+    return scene
+
+
+def _refill_projectiles(scene: GameScene, target: int, rng) -> None:
+    """
+    เติมลูกธนูให้มี target ลูกเสมอ: เกิดที่จุดสุ่มในจอรอบผู้เล่น ทิศสุ่ม มี comet trail ทุกลูก
+    ให้ศัตรูเป็นเจ้าของ (ชนได้แค่ผู้เล่น) -> ลูกส่วนใหญ่บินจนหมดอายุ
+    (ถ้าเป็นลูกของผู้เล่นในฝูงหนาแน่น จะชนแทบทันที แล้ว HitEffectNode / DamageNumberNode ท่วมจนวัดอย่างอื่นไม่ได้)
+    """
+    missing = target - len(scene.enemy_projectiles)
+    owners = scene.enemies.sprites()
+    if missing <= 0 or not owners:
+        return
+    view = pygame.Rect(0, 0, scene.camera.screen_width, scene.camera.screen_height)
+    view.center = scene.player.rect.center
+    packet = DamagePacket(base=1.0, damage_type="physical", scaling_attack=0.0)
+    for _ in range(missing):
+        direction = pygame.Vector2(1, 0).rotate(rng.uniform(0, 360))
+        ProjectileNode.spawn(
+            rng.choice(owners),
+            (rng.uniform(view.left, view.right), rng.uniform(view.top, view.bottom)),
+            direction,
+            650,
+            packet,
+            "arrow",
+            rng.uniform(0.5, 1.5),
+            scene.enemy_projectiles,
+            scene.all_sprites,
+            trail_theme=rng.choice(STORM_TRAIL_THEMES),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+def _summary(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "mean": round(sum(ordered) / n, 4),
+        "p50": round(ordered[n // 2], 4),
+        "p99": round(ordered[min(n - 1, int(n * 0.99))], 4),
+        "max": round(ordered[-1], 4),
+    }
+
+
+def run_scenario(
+    game: GameApp,
+    level_id: str,
+    scenario: str,
+    enemies: int,
+    projectiles: int,
+    frames: int,
+    warmup: int,
+    seed: int,
+) -> dict:
+    """
+    เดินเฟรมแบบเดียวกับ GameApp.run (sim step ละ sim_dt, วาดเฟรมละครั้ง)
+    คืน ms ต่อ sim step ของ update และ ms ต่อเฟรมของ draw (+ เวลาแต่ละ stage จาก game.profiler)
+    """
+    scene = build_world(game, level_id, scenario, enemies, seed)
+    storm = SCENARIOS[scenario][2]
+    rng = game.rng.stream("bench")
+    steps_per_frame = max(1, round(SIM_HZ / FPS))
+    dt = game.sim_dt
+    screen = game.screen
+    player = scene.player
+    shoots = SCENARIOS[scenario][1] is not None
+
+    prof = game.profiler
+    update_ms: list[float] = []
+    draw_ms: list[float] = []
+    for frame in range(warmup + frames):
+        if frame == warmup:
+            prof.set_enabled(True)
+        measuring = frame >= warmup
+        for _ in range(steps_per_frame):
+            if storm:
+                _refill_projectiles(scene, projectiles, rng)
+            if shoots:
+                player.shoot()
+            t0 = time.perf_counter_ns()
+            scene.update(dt)
+            if measuring:
+                update_ms.append((time.perf_counter_ns() - t0) / 1e6)
+        t0 = time.perf_counter_ns()
+        scene.draw(screen)
+        if measuring:
+            draw_ms.append((time.perf_counter_ns() - t0) / 1e6)
+        prof.end_frame()
+
+    stages = {s.name: round(s.avg_ms, 4) for s in prof.stats()}
+    prof.set_enabled(False)
+    return {
+        "scenario": scenario,
+        "level": level_id,
+        "enemies": len(scene.enemies),
+        "projectiles": len(scene.projectiles) + len(scene.enemy_projectiles),
+        "sprites": len(scene.all_sprites),
+        "update_ms": _summary(update_ms),
+        "draw_ms": _summary(draw_ms),
+        "stages_ms": stages,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _key(result: dict) -> tuple:
+    return (result["scenario"], result["level"], result["enemies"])
+
+
+def print_compare(results: list[dict], baseline_path: str) -> None:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {_key(r): r for r in json.load(f)["results"]}
+    print(f"\nvs {baseline_path} (mean ms, + = ช้าลง)")
+    print(f"{'scenario':>10} | {'enemies':>7} | {'update':>16} | {'draw':>16}")
+    print("-" * 60)
+    for r in results:
+        old = baseline.get(_key(r))
+        if old is None:
+            continue
+        cells = []
+        for field in ("update_ms", "draw_ms"):
+            a, b = old[field]["mean"], r[field]["mean"]
+            pct = (b - a) / a * 100 if a > 0 else 0.0
+            cells.append(f"{b:7.3f} ({pct:+5.1f}%)")
+        print(f"{r['scenario']:>10} | {r['enemies']:>7} | {cells[0]:>16} | {cells[1]:>16}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark GameScene update/draw with synthetic crowds")
+    parser.add_argument("--level", default="level01")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--enemies", type=int, nargs="+", default=[10, 200, 1000, 2000])
+    parser.add_argument("--projectiles", type=int, default=300, help="จำนวนลูกธนูค้างจอใน scenario storm")
+    parser.add_argument("--frames", type=int, default=120, help="เฟรมที่วัด (แต่ละเฟรม = SIM_HZ/FPS sim step + draw 1 ครั้ง)")
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--no-limit", action="store_true", help="ไม่ข้ามขนาดที่เกิน MAX_ENEMIES")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--player", default="hero", help="player_type")
+    parser.add_argument("--out", default=None, help="เขียนผลเป็น JSON")
+    parser.add_argument("--compare", default=None, help="JSON ผลเก่าที่จะเทียบ")
+    args = parser.parse_args()
+
+    game = GameApp(headless=True, seed=args.seed)
+    game.selected_player_type = args.player
+
+    results = []
+    print(f"{'scenario':>10} | {'enemies':>7} | {'sprites':>7} | {'update mean/p99':>17} | {'draw mean/p99':>17}")
+    print("-" * 72)
+    for scenario in args.scenarios:
+        for count in args.enemies:
+            limit = MAX_ENEMIES.get(scenario)
+            if limit is not None and count > limit and not args.no_limit:
+                print(f"{scenario:>10} | {count:>7} | skipped (> {limit}, ใช้ --no-limit ถ้าจะวัดจริง)")
+                continue
+            r = run_scenario(game, args.level, scenario, count, args.projectiles, args.frames, args.warmup, args.seed)
+            results.append(r)
+            u, d = r["update_ms"], r["draw_ms"]
+            print(
+                f"{scenario:>10} | {r['enemies']:>7} | {r['sprites']:>7} | "
+                f"{u['mean']:7.3f} / {u['p99']:7.3f} | {d['mean']:7.3f} / {d['p99']:7.3f}"
+            )
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "sim_hz": SIM_HZ,
+        "fps": FPS,
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"[bench] wrote {args.out}")
+    if args.compare:
+        print_compare(results, args.compare)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# benchmarks/bench_enemy_separation.py
+# เทียบเวลา enemy separation แบบเดิม (วนทุกคู่ O(n²)) กับแบบใช้ SpatialHashGrid
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python benchmarks/bench_enemy_separation.py
+#   python benchmarks/bench_enemy_separation.py --counts 50 200 1000 --frames 30
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from combat.spatial_grid import SpatialHashGrid
+from scenes.game_scene import GameScene
+
+
+class _Body(pygame.sprite.Sprite):
+    """ตัวแทน EnemyNode แบบเบา ๆ (มีแค่ field ที่ separation ใช้)"""
+
+    def __init__(self, x: float, y: float, *groups) -> None:
+        super().__init__(*groups)
+        self.pos = pygame.Vector2(x, y)
+        self.radius = 40.0
+        self.is_dead = False
+        self.rect = pygame.Rect(0, 0, 32, 32)
+        self.rect.center = (round(x), round(y))
+
+
+class _SceneStub:
+    """มีแค่ attribute ที่ GameScene._rebuild_enemy_index / _handle_enemy_separation ต้องใช้"""
+
+    _separate_pair = staticmethod(GameScene._separate_pair)
+
+    def __init__(self, enemies: pygame.sprite.Group) -> None:
+        self.enemies = enemies
+        self.enemy_index = SpatialHashGrid(cell_size=GameScene.ENEMY_GRID_CELL_SIZE)
+
+    def separate(self) -> None:
+        GameScene._rebuild_enemy_index(self)
+        GameScene._handle_enemy_separation(self)
+
+
+def _brute_force(enemies: pygame.sprite.Group) -> None:
+    # พฤติกรรมเดิมก่อนมี grid: ตรวจทุกคู่ (i, j)
+    enemies_list = list(enemies.sprites())
+    for i in range(len(enemies_list)):
+        for j in range(i + 1, len(enemies_list)):
+            e1 = enemies_list[i]
+            e2 = enemies_list[j]
+            if e1.is_dead or e2.is_dead:
+                continue
+            GameScene._separate_pair(e1, e2)
+
+
+def _make_world(count: int, seed: int) -> list[tuple[float, float]]:
+    # ให้ความหนาแน่นคงที่ (~150x150 px ต่อศัตรู 1 ตัว) แต่มีฝูงกระจุกด้วย
+    rng = random.Random(seed)
+    side = (count ** 0.5) * 150.0
+    pts: list[tuple[float, float]] = []
+    for _ in range(count):
+        if rng.random() < 0.3:
+            # 30% อยู่ในฝูงกลางแมพ (กรณี separation หนัก)
+            cx, cy = side * 0.5, side * 0.5
+            pts.append((cx + rng.gauss(0, 120), cy + rng.gauss(0, 120)))
+        else:
+            pts.append((rng.uniform(0, side), rng.uniform(0, side)))
+    return pts
+
+
+def _time_it(fn, enemies: pygame.sprite.Group, start: list[tuple[float, float]], frames: int) -> float:
+    bodies = enemies.sprites()
+    for body, (x, y) in zip(bodies, start):
+        body.pos.update(x, y)
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        fn()
+    return (time.perf_counter() - t0) / frames
+
+
+def run(counts: list[int], frames: int, seed: int) -> None:
+    print(f"{'enemies':>8} | {'brute (ms)':>11} | {'grid (ms)':>10} | {'speedup':>8}")
+    print("-" * 48)
+    for count in counts:
+        start = _make_world(count, seed)
+        enemies = pygame.sprite.Group()
+        for x, y in start:
+            _Body(x, y, enemies)
+        scene = _SceneStub(enemies)
+
+        brute = _time_it(lambda: _brute_force(enemies), enemies, start, frames)
+        grid = _time_it(scene.separate, enemies, start, frames)
+
+        speedup = brute / grid if grid > 0 else float("inf")
+        print(f"{count:>8} | {brute * 1000:>11.3f} | {grid * 1000:>10.3f} | {speedup:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark enemy separation (brute force vs spatial grid)")
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--frames", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+    run(args.counts, args.frames, args.seed)
+
+
+if __name__ == "__main__":
+    main()
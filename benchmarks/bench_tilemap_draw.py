@@ -0,0 +1,107 @@
+# benchmarks/bench_tilemap_draw.py
+# วัดเวลาต่อเฟรมของ TileMap.draw ที่ขนาดจอเกม
+#   - subsurface : แบบเดิม (สร้าง Rect + tileset.subsurface ทุก tile ทุกเฟรม)
+#   - table      : lookup จาก tile table ที่หั่นไว้แล้ว (use_chunk_cache=False)
+#   - chunks     : วาดจาก chunk ที่ bake ไว้ (ค่าเริ่มต้นของ TileMap)
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python benchmarks/bench_tilemap_draw.py --level level01 --frames 200
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from config.settings import SCREEN_HEIGHT, SCREEN_WIDTH
+from core.resource_manager import ResourceManager
+from world.level_data import load_level
+from world.tilemap import TileMap
+
+
+def _draw_subsurface(tilemap: TileMap, surface: pygame.Surface, offset: pygame.Vector2) -> None:
+    """จำลอง TileMap.draw แบบเดิม (ก่อนมี tile table)"""
+    tile_size = tilemap.tile_size
+    screen_w, screen_h = surface.get_size()
+    for layer_name in tilemap.draw_order:
+        grid = tilemap.layers.get(layer_name)
+        if not grid:
+            continue
+        map_height = len(grid)
+        map_width = len(grid[0]) if map_height > 0 else 0
+        start_x = max(int(offset.x // tile_size), 0)
+        start_y = max(int(offset.y // tile_size), 0)
+        end_x = min(int((offset.x + screen_w) // tile_size) + 1, map_width)
+        end_y = min(int((offset.y + screen_h) // tile_size) + 1, map_height)
+        for y in range(start_y, end_y):
+            row = grid[y]
+            for x in range(start_x, end_x):
+                value = row[x]
+                if value < 0:
+                    continue
+                if value >= tilemap.num_tiles:
+                    value = 0
+                col = value % tilemap.tiles_per_row
+                row_i = value // tilemap.tiles_per_row
+                rect = pygame.Rect(col * tile_size, row_i * tile_size, tile_size, tile_size)
+                surface.blit(
+                    tilemap.tileset.subsurface(rect),
+                    (x * tile_size - offset.x, y * tile_size - offset.y),
+                )
+
+
+def _time(draw, frames: int, offsets: list[pygame.Vector2]) -> float:
+    t0 = time.perf_counter()
+    for i in range(frames):
+        draw(offsets[i % len(offsets)])
+    return (time.perf_counter() - t0) / frames
+
+
+def run(level: str, frames: int) -> None:
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    screen = pygame.display.get_surface()
+
+    resources = ResourceManager()
+    table_map = TileMap(load_level(level), resources, use_chunk_cache=False)
+    chunk_map = TileMap(load_level(level), resources)
+
+    # กล้องเลื่อนไปเรื่อย ๆ (ให้ chunk cache ได้ทั้ง hit และ bake ใหม่)
+    max_x = max(table_map.pixel_width - SCREEN_WIDTH, 0)
+    max_y = max(table_map.pixel_height - SCREEN_HEIGHT, 0)
+    offsets = [
+        pygame.Vector2(round(max_x * i / frames), round(max_y * i / frames))
+        for i in range(frames)
+    ]
+
+    results = {
+        "subsurface": _time(lambda o: _draw_subsurface(table_map, screen, o), frames, offsets),
+        "table": _time(lambda o: table_map.draw(screen, camera_offset=o), frames, offsets),
+        "chunks": _time(lambda o: chunk_map.draw(screen, camera_offset=o), frames, offsets),
+    }
+
+    base = results["subsurface"]
+    print(f"{level}: {table_map.width}x{table_map.height} tiles, layers={table_map.draw_order}")
+    print(f"{'mode':>11} | {'ms/frame':>9} | {'speedup':>8}")
+    print("-" * 34)
+    for name, t in results.items():
+        print(f"{name:>11} | {t * 1000:>9.3f} | {base / t:>7.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark TileMap.draw")
+    parser.add_argument("--level", default="level01")
+    parser.add_argument("--frames", type=int, default=200)
+    args = parser.parse_args()
+    run(args.level, args.frames)
+
+
+if __name__ == "__main__":
+    main()
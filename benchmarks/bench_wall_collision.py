@@ -0,0 +1,103 @@
+# benchmarks/bench_wall_collision.py
+# เทียบเวลาแก้ชนกำแพง (circle vs segment) ของศัตรูทั้งฝูง
+#   - scalar : วนทีละตัวด้วย circle_segment_mtv + TileMap.segments_near (แบบ EnemyNode เดิม)
+#   - batch  : CircleWallResolver (numpy) ทีเดียวทั้งฝูง
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python benchmarks/bench_wall_collision.py --level level01 --counts 50 200 1000
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import numpy as np
+import pygame
+
+from combat.wall_collision import CircleWallResolver, circle_segment_mtv
+from core.resource_manager import ResourceManager
+from world.level_data import load_level
+from world.tilemap import TileMap
+
+
+def _scalar(tilemap: TileMap, centers: list[pygame.Vector2], radius: float) -> list[pygame.Vector2]:
+    out = []
+    for c in centers:
+        new_pos = pygame.Vector2(c)
+        for _ in range(4):
+            moved = False
+            for a, b in tilemap.segments_near(new_pos, radius):
+                mtv = circle_segment_mtv(new_pos, radius, a, b)
+                if mtv is not None:
+                    new_pos += mtv
+                    moved = True
+            if not moved:
+                break
+        out.append(new_pos)
+    return out
+
+
+def run(level: str, counts: list[int], frames: int, seed: int) -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    tilemap = TileMap(load_level(level), ResourceManager())
+    resolver = CircleWallResolver.from_tilemap(tilemap)
+    radius = 40.0
+
+    # เลือกจุดเริ่มที่อยู่ใกล้กำแพง (กรณีที่ต้องแก้ชนจริง)
+    rng = random.Random(seed)
+    segs = tilemap.collision_segments
+
+    print(f"{level}: {len(segs)} segments")
+    print(f"{'enemies':>8} | {'scalar (ms)':>12} | {'batch (ms)':>11} | {'speedup':>8} | {'max diff (px)':>13}")
+    print("-" * 66)
+    for count in counts:
+        # จุดเริ่ม: วางใกล้กำแพงแล้วแก้ชนให้อยู่ในตำแหน่งที่ถูกต้องก่อน
+        # จากนั้นขยับ 1 เฟรม (~6 px) ไปทิศสุ่ม เหมือนศัตรูที่เดินชนกำแพง
+        centers = []
+        for _ in range(count):
+            a, b = segs[rng.randrange(len(segs))]
+            p = a.lerp(b, rng.random())
+            centers.append(p + pygame.Vector2(rng.uniform(-45, 45), rng.uniform(-45, 45)))
+        centers = _scalar(tilemap, centers, radius)
+        centers = [c + pygame.Vector2(6, 0).rotate(rng.uniform(0, 360)) for c in centers]
+        arr = np.array([(c.x, c.y) for c in centers])
+        radii = np.full(count, radius)
+
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            scalar = _scalar(tilemap, centers, radius)
+        t_scalar = (time.perf_counter() - t0) / frames
+
+        t0 = time.perf_counter()
+        for _ in range(frames):
+            batch = resolver.resolve_arrays(arr, radii)
+        t_batch = (time.perf_counter() - t0) / frames
+
+        diff = np.abs(np.array([(p.x, p.y) for p in scalar]) - batch).max()
+        speedup = t_scalar / t_batch if t_batch > 0 else float("inf")
+        print(
+            f"{count:>8} | {t_scalar * 1000:>12.3f} | {t_batch * 1000:>11.3f} | "
+            f"{speedup:>7.1f}x | {diff:>13.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark wall collision (scalar vs numpy batch)")
+    parser.add_argument("--level", default="level01")
+    parser.add_argument("--counts", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=1234)
+    args = parser.parse_args()
+    run(args.level, args.counts, args.frames, args.seed)
+
+
+if __name__ == "__main__":
+    main()
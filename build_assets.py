@@ -0,0 +1,134 @@
+# build_assets.py
+# สร้างรูปที่ scale ไว้ล่วงหน้าลง assets/.cache/prescaled/ (ดู core/asset_cache.py)
+#
+# ResourceManager จะโหลดจาก cache นี้แทนการ decode PNG ขนาดเต็มแล้ว smoothscale ตอนเล่น
+# ถ้ารูปต้นฉบับถูกแก้ (เนื้อไฟล์เปลี่ยน) เกมจะกลับไปใช้ต้นฉบับเองจนกว่าจะรันสคริปต์นี้ใหม่
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python build_assets.py            # สร้างเฉพาะไฟล์ที่ยังไม่มี / ล้าสมัย
+#   python build_assets.py --force    # สร้างใหม่ทั้งหมด
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from config.enemy_config import ENEMY_CONFIG
+from config.player_config import PLAYER_CONFIG
+from config.settings import RESOURCE_SCALES
+from core import asset_cache
+from core.resource_manager import ResourceManager
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg")
+
+
+def _iter_sources(graphics_dir: str):
+    """
+    คืน (path แบบที่เกมส่งให้ load_image, path ไฟล์จริง)
+    - graphics/images/<x>  -> "<x>"          (เช่น "enemy/orc/idle/idle_down_01.png")
+    - graphics/tiles/<x>   -> "tiles/<x>"
+    """
+    for sub, prefix in (("images", ""), ("tiles", "tiles/")):
+        root = os.path.join(graphics_dir, sub)
+        for dirpath, _, filenames in os.walk(root):
+            for name in sorted(filenames):
+                if not name.lower().endswith(IMAGE_EXTS):
+                    continue
+                full = os.path.join(dirpath, name)
+                rel = os.path.relpath(full, root).replace(os.sep, "/")
+                yield prefix + rel, full
+
+
+def _scales_for(rm: ResourceManager, rel_path: str, include_unscaled: bool = False) -> set[float]:
+    """
+    scale ทั้งหมดที่เกมอาจขอสำหรับรูปนี้
+    include_unscaled = False : ตัด 1.0 ออก (prescaled cache ไม่ต้องเก็บรูปที่ไม่ได้ย่อ)
+    """
+    parts = rel_path.split("/")
+    scales: set[float] = set()
+
+    # enemy/<sprite_id>/... : EnemyNode ใช้ scale จาก ENEMY_CONFIG (ไม่มี = sprite_scale)
+    if parts[0] == "enemy" and len(parts) > 2:
+        for enemy_id, cfg in ENEMY_CONFIG.items():
+            if cfg.get("sprite_id", enemy_id) == parts[1]:
+                scales.add(rm.image_scale(rel_path, cfg.get("scale")))
+
+    # player/<player_type>/... : PlayerNode ย่อเฟรมด้วย sprite_scale x scale ของ player_type
+    elif parts[0] == "player" and len(parts) > 2:
+        cfg = PLAYER_CONFIG.get(parts[1], PLAYER_CONFIG.get("default", {}))
+        scales.add(rm.sprite_scale * cfg.get("scale", 1.0))
+
+    if not scales:
+        scales.add(rm.image_scale(rel_path))
+
+    if not include_unscaled:
+        scales.discard(1.0)
+    return scales
+
+
+def build(base_path: str = "assets", force: bool = False, clean: bool = True) -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    rm = ResourceManager(base_path=base_path, use_prescaled=False, **RESOURCE_SCALES)
+    graphics_dir = os.path.join(base_path, "graphics")
+    cache_dir = rm.prescaled_dir
+
+    expected: set[str] = set()
+    written = skipped = 0
+    bytes_in = bytes_out = 0
+    t0 = time.perf_counter()
+
+    for rel_path, full_path in _iter_sources(graphics_dir):
+        scales = _scales_for(rm, rel_path)
+        if not scales:
+            continue
+
+        source = None
+        for scale in sorted(scales):
+            target = asset_cache.prescaled_path(cache_dir, graphics_dir, full_path, scale)
+            expected.add(os.path.normpath(target))
+            if not force and os.path.exists(target):
+                skipped += 1
+                continue
+
+            if source is None:
+                source = pygame.image.load(full_path).convert_alpha()
+                bytes_in += os.path.getsize(full_path)
+            asset_cache.save_surface(rm._scale_surface(source, scale), target)
+            bytes_out += os.path.getsize(target)
+            written += 1
+
+    removed = 0
+    if clean and os.path.isdir(cache_dir):
+        # ลบไฟล์เก่า (ต้นฉบับถูกแก้ / scale เปลี่ยน / รูปถูกลบ)
+        for dirpath, _, filenames in os.walk(cache_dir):
+            for name in filenames:
+                path = os.path.normpath(os.path.join(dirpath, name))
+                if path not in expected:
+                    os.remove(path)
+                    removed += 1
+
+    print(
+        f"[build_assets] wrote {written}, up-to-date {skipped}, removed {removed} "
+        f"({bytes_in / 1e6:.1f} MB source -> {bytes_out / 1e6:.1f} MB cache) "
+        f"in {time.perf_counter() - t0:.1f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-scale game images into assets/.cache/prescaled")
+    parser.add_argument("--base-path", default="assets")
+    parser.add_argument("--force", action="store_true", help="rebuild every file")
+    parser.add_argument("--no-clean", action="store_true", help="keep stale cache files")
+    args = parser.parse_args()
+    build(args.base_path, force=args.force, clean=not args.no_clean)
+
+
+if __name__ == "__main__":
+    main()
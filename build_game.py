@@ -2,6 +2,8 @@ import PyInstaller.__main__
 import os
 import shutil
 
+import build_assets
+
 def build():
     # Define build arguments
     args = [
@@ -25,5 +27,8 @@ if __name__ == "__main__":
         shutil.rmtree('dist')
     if os.path.exists('build'):
         shutil.rmtree('build')
-        
+
+    # ย่อรูปล่วงหน้าลง assets/.cache/prescaled (ถูกแพ็กไปกับ --add-data=assets:assets)
+    build_assets.build()
+
     build()
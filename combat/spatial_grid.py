@@ -0,0 +1,185 @@
+# combat/spatial_grid.py
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import pygame
+
+Cell = Tuple[int, int]
+
+# เซลล์เพื่อนบ้าน "ครึ่งเดียว" (ตัวเอง + ขวา + แถวล่าง 3 ช่อง)
+# ใช้ตอนไล่คู่ เพื่อให้แต่ละคู่ถูกตรวจแค่ครั้งเดียว
+_HALF_NEIGHBOURS: tuple[Cell, ...] = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class SpatialHashGrid:
+    """
+    spatial index แบบ uniform grid (hash ด้วย (cx, cy))
+
+    - ใช้กับ object ที่มี .pos (pygame.Vector2) เช่น EnemyNode
+    - สร้างใหม่ทั้งก้อนทุกเฟรมด้วย rebuild() (O(n)) แล้วค่อย query
+    - cell_size ควร >= ระยะชนสูงสุด (เช่น radius1 + radius2)
+      เพื่อให้ candidate_pairs() ดูแค่ 3x3 ช่องรอบตัวก็ครบ
+    """
+
+    def __init__(self, cell_size: float = 96.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size ต้องมากกว่า 0")
+        self.cell_size = float(cell_size)
+        self._inv_cell = 1.0 / self.cell_size
+        self._cells: Dict[Cell, List[Any]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    # ---------- build ----------
+    def cell_of(self, pos: pygame.Vector2) -> Cell:
+        inv = self._inv_cell
+        return (math.floor(pos.x * inv), math.floor(pos.y * inv))
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._count = 0
+
+    def insert(self, obj: Any, pos: pygame.Vector2 | None = None) -> None:
+        if pos is None:
+            pos = obj.pos
+        key = self.cell_of(pos)
+        bucket = self._cells.get(key)
+        if bucket is None:
+            self._cells[key] = [obj]
+        else:
+            bucket.append(obj)
+        self._count += 1
+
+    def rebuild(self, objs: Iterable[Any]) -> None:
+        """ล้างแล้วใส่ object ทั้งหมดใหม่ตามตำแหน่ง .pos ปัจจุบัน"""
+        self.clear()
+        for obj in objs:
+            self.insert(obj)
+
+    # ---------- query ----------
+    def query_radius(self, pos: pygame.Vector2, radius: float) -> List[Any]:
+        """
+        คืน object ที่อยู่ในเซลล์ที่ทับกับวงกลม (pos, radius)
+        (broad-phase เท่านั้น: ผู้เรียกต้องเช็คระยะจริงเอง)
+        """
+        inv = self._inv_cell
+        min_cx = math.floor((pos.x - radius) * inv)
+        max_cx = math.floor((pos.x + radius) * inv)
+        min_cy = math.floor((pos.y - radius) * inv)
+        max_cy = math.floor((pos.y + radius) * inv)
+
+        cells = self._cells
+        found: List[Any] = []
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+    def candidate_pairs(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        ไล่คู่ (a, b) ที่อยู่ในเซลล์เดียวกันหรือเซลล์ติดกัน คู่ละครั้ง
+        ใช้แทนการวนทุกคู่ O(n²) ในระบบ separation
+        """
+        cells = self._cells
+        for (cx, cy), bucket in cells.items():
+            n = len(bucket)
+            # คู่ในเซลล์เดียวกัน
+            for i in range(n):
+                a = bucket[i]
+                for j in range(i + 1, n):
+                    yield a, bucket[j]
+
+            # คู่ข้ามเซลล์ (ดูแค่ครึ่งเดียวของเพื่อนบ้าน กันนับซ้ำ)
+            for dx, dy in _HALF_NEIGHBOURS:
+                other = cells.get((cx + dx, cy + dy))
+                if not other:
+                    continue
+                for a in bucket:
+                    for b in other:
+                        yield a, b
+
+
+class StaticRectGrid:
+    """
+    spatial index ของ object ที่ไม่ขยับ (เช่น DecorationNode) ตาม .rect
+
+    - object หนึ่งตัวถูกใส่ในทุกเซลล์ที่ rect ทับ (insert ครั้งเดียวตอนสร้างฉาก)
+    - query_rect() คืน object ที่อาจทับกับ rect ตามลำดับที่ insert
+      (ลำดับการวาดจึงเหมือนเดิม)
+    """
+
+    def __init__(self, cell_size: float = 256.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size ต้องมากกว่า 0")
+        self.cell_size = float(cell_size)
+        self._inv_cell = 1.0 / self.cell_size
+        self._cells: Dict[Cell, List[Any]] = {}
+        # obj -> (ลำดับที่ insert, เซลล์ที่ครอบ)
+        self._entries: Dict[Any, Tuple[int, List[Cell]]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._entries)
+
+    def _cells_of(self, rect: pygame.Rect) -> List[Cell]:
+        inv = self._inv_cell
+        min_cx = math.floor(rect.left * inv)
+        max_cx = math.floor((rect.right - 1) * inv)
+        min_cy = math.floor(rect.top * inv)
+        max_cy = math.floor((rect.bottom - 1) * inv)
+        return [
+            (cx, cy)
+            for cy in range(min_cy, max(min_cy, max_cy) + 1)
+            for cx in range(min_cx, max(min_cx, max_cx) + 1)
+        ]
+
+    def insert(self, obj: Any, rect: pygame.Rect | None = None) -> None:
+        if obj in self._entries:
+            return
+        if rect is None:
+            rect = obj.rect
+        cells = self._cells_of(rect)
+        for key in cells:
+            bucket = self._cells.get(key)
+            if bucket is None:
+                self._cells[key] = [obj]
+            else:
+                bucket.append(obj)
+        self._entries[obj] = (self._seq, cells)
+        self._seq += 1
+
+    def remove(self, obj: Any) -> None:
+        entry = self._entries.pop(obj, None)
+        if entry is None:
+            return
+        for key in entry[1]:
+            bucket = self._cells.get(key)
+            if bucket is None:
+                continue
+            bucket.remove(obj)
+            if not bucket:
+                del self._cells[key]
+
+    def query_rect(self, rect: pygame.Rect) -> List[Any]:
+        """คืน object ที่ rect ทับกับ rect ที่ถาม (เช็ค colliderect จริงแล้ว)"""
+        cells = self._cells
+        found: Dict[Any, None] = {}
+        for key in self._cells_of(rect):
+            bucket = cells.get(key)
+            if bucket:
+                for obj in bucket:
+                    found[obj] = None
+
+        entries = self._entries
+        hits = [obj for obj in found if rect.colliderect(obj.rect)]
+        hits.sort(key=lambda obj: entries[obj][0])
+        return hits
@@ -0,0 +1,262 @@
+# combat/wall_collision.py
+from __future__ import annotations
+
+import math
+from typing import Any, List, Tuple
+
+import numpy as np
+import pygame
+
+
+# helper สำหรับการชน circle + segment (ใช้ร่วมกันทั้ง PlayerNode / EnemyNode)
+def circle_segment_mtv(center: pygame.Vector2,
+                       radius: float,
+                       a: pygame.Vector2,
+                       b: pygame.Vector2) -> pygame.Vector2 | None:
+    """
+    หา minimal translation vector (MTV) ที่ต้องขยับวงกลม
+    ออกจาก segment a-b ถ้าไม่ชนให้คืน None
+    """
+    ab = b - a
+    ab_len_sq = ab.x * ab.x + ab.y * ab.y
+    if ab_len_sq == 0:
+        # segment เส้นสั้นมาก → ใช้จุด a แทน
+        to_center = center - a
+        dist_sq = to_center.length_squared()
+        if dist_sq >= radius * radius or dist_sq == 0:
+            return None
+        dist = math.sqrt(dist_sq)
+        overlap = radius - dist
+        return to_center.normalize() * overlap
+
+    # project center ลงเส้น a-b แล้ว clamp ให้อยู่ใน [0, 1]
+    t = (center - a).dot(ab) / ab_len_sq
+    if t < 0.0:
+        t = 0.0
+    elif t > 1.0:
+        t = 1.0
+    closest = a + ab * t
+
+    diff = center - closest
+    dist_sq = diff.length_squared()
+    if dist_sq >= radius * radius or dist_sq == 0:
+        return None
+
+    dist = math.sqrt(dist_sq)
+    overlap = radius - dist
+    normal = diff / dist
+
+    return normal * overlap
+
+
+class CircleWallResolver:
+    """
+    แก้การชนกำแพง (circle vs segment) ของศัตรูทั้งฝูงพร้อมกันด้วย numpy
+
+    วิธีใช้ (ต่อเฟรม):
+        - EnemyNode ขยับตัวเองตาม velocity แล้วเรียก defer(enemy) แทนการวนชนเอง
+        - GameScene เรียก resolve() ครั้งเดียวหลัง all_sprites.update()
+
+    segment_a / segment_b : np.ndarray รูป (S, 2) จาก TileMap (static)
+    bucket_size           : ขนาด cell (px) ของ grid broad-phase (สร้างครั้งเดียวตอน init)
+    iterations            : จำนวนรอบดันออก (แต่ละรอบดันออกจากเส้นที่จมลึกสุดเส้นเดียว
+                            จึงใช้มากกว่าลูป 4 รอบของ EnemyNode เดิมเล็กน้อย)
+    """
+
+    def __init__(
+        self,
+        segment_a: np.ndarray,
+        segment_b: np.ndarray,
+        iterations: int = 6,
+        bucket_size: float = 64.0,
+    ) -> None:
+        self.iterations = max(1, int(iterations))
+        self.bucket_size = float(bucket_size)
+
+        self._a = np.asarray(segment_a, dtype=np.float64).reshape(-1, 2)
+        self._b = np.asarray(segment_b, dtype=np.float64).reshape(-1, 2)
+        self._ab = self._b - self._a
+        self._len_sq = np.einsum("ij,ij->i", self._ab, self._ab)
+        # กันหารศูนย์: segment ยาว 0 จะได้ t = 0 (ใช้จุด a แทน)
+        self._inv_len_sq = np.divide(
+            1.0, self._len_sq, out=np.zeros_like(self._len_sq), where=self._len_sq > 0
+        )
+
+        self._build_grid()
+
+        self._pending: List[Any] = []
+
+    def _build_grid(self) -> None:
+        """
+        สร้าง grid แบบ dense (CSR) สำหรับ broad-phase:
+        cell_id -> segment indices ใน self._cell_segs[start:end]
+        """
+        inv = 1.0 / self.bucket_size
+        seg_min = self._seg_min = np.minimum(self._a, self._b)
+        seg_max = self._seg_max = np.maximum(self._a, self._b)
+
+        if len(self._a) == 0:
+            self._grid_w = self._grid_h = 1
+            self._cell_start = np.zeros(2, dtype=np.int64)
+            self._cell_segs = np.zeros(0, dtype=np.int64)
+            return
+
+        # segment ทั้งหมดอยู่ในแมพ (พิกัด >= 0) จึงเริ่ม grid ที่ (0, 0)
+        c0 = np.maximum(np.floor(seg_min * inv).astype(np.int64), 0)
+        c1 = np.maximum(np.floor(seg_max * inv).astype(np.int64), 0)
+        self._grid_w = int(c1[:, 0].max()) + 1
+        self._grid_h = int(c1[:, 1].max()) + 1
+
+        seg_ids, cell_ids = self._expand_cells(c0, c1)
+        order = np.argsort(cell_ids, kind="stable")
+        self._cell_segs = seg_ids[order]
+        counts = np.bincount(cell_ids, minlength=self._grid_w * self._grid_h)
+        self._cell_start = np.concatenate(([0], np.cumsum(counts)))
+
+    def _expand_cells(self, c0: np.ndarray, c1: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        c0, c1 : (N, 2) ช่วง cell (รวมปลาย) ของแต่ละรายการ
+        คืน (owner, cell_id) ของทุก cell ที่แต่ละรายการครอบ
+        """
+        nx = c1[:, 0] - c0[:, 0] + 1
+        ny = c1[:, 1] - c0[:, 1] + 1
+        per = nx * ny
+        owner = np.repeat(np.arange(len(c0)), per)
+        local = np.arange(per.sum()) - np.repeat(np.cumsum(per) - per, per)
+        cx = c0[owner, 0] + local % nx[owner]
+        cy = c0[owner, 1] + local // nx[owner]
+        return owner, cy * self._grid_w + cx
+
+    @classmethod
+    def from_tilemap(cls, tilemap, iterations: int = 6) -> "CircleWallResolver":
+        return cls(
+            tilemap.segment_a,
+            tilemap.segment_b,
+            iterations=iterations,
+            bucket_size=tilemap.SEGMENT_BUCKET_SIZE,
+        )
+
+    def defer(self, body: Any) -> None:
+        """จองให้ body (ต้องมี .pos, .radius, .rect) ถูกแก้ชนใน resolve() รอบถัดไป"""
+        self._pending.append(body)
+
+    def resolve(self) -> None:
+        """แก้ชนกำแพงให้ทุกตัวที่ defer มาในเฟรมนี้ แล้วเขียน pos/rect กลับ"""
+        bodies = self._pending
+        if not bodies:
+            return
+        self._pending = []
+
+        if len(self._a) == 0:
+            return
+
+        centers = np.array([(b.pos.x, b.pos.y) for b in bodies], dtype=np.float64)
+        radii = np.array([b.radius for b in bodies], dtype=np.float64)
+
+        resolved = self.resolve_arrays(centers, radii)
+
+        for body, (x, y) in zip(bodies, resolved.tolist()):
+            body.pos.update(x, y)
+            body.rect.center = (round(x), round(y))
+
+    def resolve_arrays(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """
+        centers : (N, 2) ตำแหน่งที่อยากไป (ก่อนชน)
+        radii   : (N,)
+        คืน centers ใหม่ (N, 2) หลังดันออกจากกำแพง
+        """
+        centers = np.array(centers, dtype=np.float64)
+        radii = np.asarray(radii, dtype=np.float64)
+        n = len(centers)
+        if n == 0 or len(self._a) == 0:
+            return centers
+
+        # ---------- broad-phase: grid (ขยายเผื่อระยะที่อาจถูกดันในรอบถัด ๆ ไป) ----------
+        reach = radii * 1.5
+        body_idx, seg_idx = self._candidate_pairs(centers, reach)
+
+        # cell เดียวกันยังหยาบไป -> กรองด้วย AABB ของ segment อีกชั้น
+        c = centers[body_idx]
+        m = reach[body_idx, None]
+        keep = np.all(
+            (c + m >= self._seg_min[seg_idx]) & (c - m <= self._seg_max[seg_idx]), axis=1
+        )
+        body_idx = body_idx[keep]
+        seg_idx = seg_idx[keep]
+        if len(body_idx) == 0:
+            return centers
+
+        a = self._a[seg_idx]
+        ab = self._ab[seg_idx]
+        inv_len_sq = self._inv_len_sq[seg_idx]
+        r = radii[body_idx]
+        r_sq = r * r
+
+        # ---------- narrow-phase: MTV ทุกคู่พร้อมกัน ----------
+        for _ in range(self.iterations):
+            c = centers[body_idx]
+            t = np.einsum("ij,ij->i", c - a, ab) * inv_len_sq
+            np.clip(t, 0.0, 1.0, out=t)
+            diff = c - (a + ab * t[:, None])
+            dist_sq = np.einsum("ij,ij->i", diff, diff)
+
+            hit = np.nonzero((dist_sq < r_sq) & (dist_sq > 0.0))[0]
+            if len(hit) == 0:
+                break
+
+            dist = np.sqrt(dist_sq[hit])
+            depth = r[hit] - dist
+            hit_body = body_idx[hit]
+
+            # ต่อ 1 ตัวดันออกจากเส้นที่จมลึกที่สุดเส้นเดียวต่อรอบ
+            # (กันดันซ้ำ 2 เท่าตรงมุมที่ 2 segment ใช้ปลายจุดเดียวกัน)
+            order = np.lexsort((-depth, hit_body))
+            sorted_body = hit_body[order]
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = sorted_body[1:] != sorted_body[:-1]
+            pick = order[first]
+
+            mtv = diff[hit[pick]] * (depth[pick] / dist[pick])[:, None]
+            centers[hit_body[pick]] += mtv
+
+        return centers
+
+    def _candidate_pairs(self, centers: np.ndarray, reach: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """คืนคู่ (body_idx, seg_idx) ที่อยู่ใน cell เดียวกัน (ไม่ซ้ำคู่)"""
+        inv = 1.0 / self.bucket_size
+        hi_x, hi_y = self._grid_w - 1, self._grid_h - 1
+        lo = np.floor((centers - reach[:, None]) * inv).astype(np.int64)
+        hi = np.floor((centers + reach[:, None]) * inv).astype(np.int64)
+
+        # ตัวที่อยู่นอก grid ทั้งตัวไม่มีทางชน segment ใด ๆ
+        inside = (hi[:, 0] >= 0) & (hi[:, 1] >= 0) & (lo[:, 0] <= hi_x) & (lo[:, 1] <= hi_y)
+        if not inside.any():
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        bodies = np.nonzero(inside)[0]
+        lo = np.clip(lo[bodies], 0, (hi_x, hi_y))
+        hi = np.clip(hi[bodies], 0, (hi_x, hi_y))
+
+        owner, cell_ids = self._expand_cells(lo, hi)
+        starts = self._cell_start[cell_ids]
+        counts = self._cell_start[cell_ids + 1] - starts
+        pair_owner = np.repeat(owner, counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_seg = self._cell_segs[np.repeat(starts, counts) + offsets]
+
+        # segment หนึ่งเส้นอาจอยู่หลาย cell -> ตัดคู่ซ้ำ
+        n_segs = len(self._a)
+        keys = np.unique(bodies[pair_owner] * n_segs + pair_seg)
+        return keys // n_segs, keys % n_segs
+
+
+def segments_to_arrays(
+    segments: List[Tuple[pygame.Vector2, pygame.Vector2]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """แปลง list[(a, b)] เป็น numpy array (S, 2) สองก้อน"""
+    if not segments:
+        empty = np.zeros((0, 2), dtype=np.float64)
+        return empty, empty.copy()
+    a = np.array([(s[0].x, s[0].y) for s in segments], dtype=np.float64)
+    b = np.array([(s[1].x, s[1].y) for s in segments], dtype=np.float64)
+    return a, b
@@ -21,4 +21,6 @@ KEY_BINDINGS = {
     "spell": pygame.K_q,
     "inventory": pygame.K_i,
     "pause": pygame.K_ESCAPE,
+    "profiler": pygame.K_F3,        # เปิด/ปิด overlay จับเวลาแต่ละส่วนของเฟรม
+    "profiler_dump": pygame.K_F4,   # เขียนสถิติ profiler ลง CSV
 }
@@ -6,6 +6,13 @@ SCREEN_HEIGHT = 800
 FULLSCREEN = True
 FPS = 60
 
+# simulation แบบ fixed timestep (แยกจาก FPS ของการวาด ดู GameApp.run)
+SIM_HZ = 120
+# sim step สูงสุดต่อเฟรม ถ้ายังตามไม่ทันให้ทิ้งเวลาที่เหลือ (กัน spiral of death)
+MAX_SIM_STEPS = 8
+# seed ของ GameApp.rng (None = สุ่มทุกครั้งที่เปิดเกม, ใส่ตัวเลขเพื่อให้เล่นซ้ำได้ผลเดิม)
+RNG_SEED = None
+
 WINDOW_TITLE = "My 2D Action RPG"
 
 # Gameplay base values
@@ -15,3 +22,30 @@ CAMERA_LERP = 0.1
 UI_FONT_PATH = "fonts/Kanit-Bold.ttf"
 UI_FONT_HUD_PATH = "fonts/GoogleSans.ttf"
 UI_SCORE_PATH = "fonts/FascinateInline-Regular.ttf"
+
+# scale ของรูปแต่ละหมวดที่ ResourceManager ใช้ (GameApp และ build_assets.py ใช้ชุดเดียวกัน)
+RESOURCE_SCALES = {
+    "sprite_scale": 0.25,      # ขนาดตัวละคร / enemy
+    "tile_scale": 1.0,         # ขนาด tile
+    "projectile_scale": 0.2,   # ลูกธนู
+    "item_scale": 0.2,         # ค่าเริ่มต้นของ items ทุกชนิด
+    "item_scale_overrides": {
+        # ทำให้ bow_power เล็กลงหน่อย (เช่น 50% ของไฟล์)
+        "items/bow_power": 0.2,
+        # ทำให้ bow_power เล็กลงหน่อย (เช่น 50% ของไฟล์)
+        "items/potion_small": 0.1,
+        "items/potion_full": 0.1,
+        # ขนาดไอเท็มโล่
+        "items/shield": 0.2,
+        # ขนาดไอเท็มฟันรอบทิศทาง
+        "items/sword_all_direction": 0.2,
+    },
+}
+
+# งบ memory ของ cache ใน ResourceManager (เกินแล้วไล่ของที่ไม่ได้ใช้นานสุดออก ยกเว้นของที่ด่านปัจจุบันใช้อยู่)
+RESOURCE_CACHE = {
+    "image_budget_mb": 192,    # รูป + tile table + atlas (ด่านหนึ่งใช้ราว 30-45 MB)
+    "sound_budget_mb": 96,
+    "max_fonts": 32,
+    "rotation_budget_mb": 32,  # เฟรม projectile ที่หมุนแล้ว (warm-up ครบทุกแบบราว 5 MB)
+}
@@ -0,0 +1,118 @@
+# core/asset_cache.py
+"""
+cache รูปที่ scale ไว้ล่วงหน้า (สร้างด้วย build_assets.py)
+
+ไฟล์ cache อยู่ที่:
+    assets/.cache/prescaled/<path ใต้ graphics/ ไม่มีนามสกุล>@<scale>_<size>-<hash>.rgba
+
+- key ด้วย scale และเนื้อไฟล์ต้นฉบับ (ขนาด + blake2b ของ byte): ถ้าแก้รูปต้นฉบับ ชื่อไฟล์จะไม่ตรง
+  ResourceManager จะ fallback ไปโหลด + ย่อจากต้นฉบับเองจนกว่าจะ build ใหม่
+- ไม่ใช้ mtime เพราะ git clone / PyInstaller (copy ไฟล์ด้วย shutil.copyfile) ไม่รักษา mtime
+  -> key เดิมยังตรงในเกมที่ build แล้ว
+- digest ของแต่ละไฟล์จำไว้ตาม (path, size, mtime) ในโปรเซส ไม่ต้อง hash ซ้ำทุกครั้งที่ถามถ้าไฟล์ไม่เปลี่ยน
+- เก็บเป็น pixel RGBA ดิบ (ไม่บีบอัด) -> โหลดด้วย frombytes ได้เลย ไม่ต้อง decode PNG
+- alpha แบบ straight (ไม่ premultiply) เพราะทุกที่ในเกม blit แบบ alpha ปกติ
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import struct
+
+import pygame
+
+# ตำแหน่งใต้ base_path ของ ResourceManager (ปกติคือ assets/)
+PRESCALED_SUBDIR = (".cache", "prescaled")
+CACHE_EXT = ".rgba"
+
+# header: magic, width, height
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"RGBA"
+
+
+# (path, size, mtime_ns) -> digest
+_digests: dict[tuple[str, int, int], str] = {}
+
+
+def source_digest(source_path: str) -> str | None:
+    """ลายนิ้วมือเนื้อไฟล์ "<size>-<blake2b 8 byte>" (None = ไม่มีไฟล์)"""
+    try:
+        st = os.stat(source_path)
+    except OSError:
+        return None
+    memo = (source_path, st.st_size, st.st_mtime_ns)
+    digest = _digests.get(memo)
+    if digest is None:
+        try:
+            with open(source_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        digest = f"{len(data)}-{hashlib.blake2b(data, digest_size=8).hexdigest()}"
+        _digests[memo] = digest
+    return digest
+
+
+def entry_key(graphics_dir: str, source_path: str, scale: float) -> str | None:
+    """
+    key ของรูป (ต้นฉบับ, scale) เช่น "images/enemy/orc/idle/idle_down_01@0.25_5123-9f86d081884c7d65"
+    ใช้ทั้งเป็นชื่อไฟล์ cache และ key ใน asset pack (None = ไม่มีไฟล์ต้นฉบับ)
+    """
+    digest = source_digest(source_path)
+    if digest is None:
+        return None
+    rel = os.path.splitext(os.path.relpath(source_path, graphics_dir))[0].replace(os.sep, "/")
+    return f"{rel}@{scale:g}_{digest}"
+
+
+def prescaled_path(cache_dir: str, graphics_dir: str, source_path: str, scale: float) -> str | None:
+    """path ของไฟล์ cache สำหรับ (ต้นฉบับ, scale) หรือ None ถ้าไม่มีไฟล์ต้นฉบับ"""
+    key = entry_key(graphics_dir, source_path, scale)
+    if key is None:
+        return None
+    return os.path.join(cache_dir, key + CACHE_EXT)
+
+
+def save_surface(surface: pygame.Surface, path: str) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    w, h = surface.get_size()
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, w, h))
+        f.write(pygame.image.tobytes(surface, "RGBA"))
+    # เขียนเสร็จค่อยเปลี่ยนชื่อ กันเกมอ่านไฟล์ครึ่ง ๆ กลาง ๆ
+    os.replace(tmp, path)
+
+
+def read_raw(path: str) -> tuple[int, int, bytes] | None:
+    """อ่าน (width, height, pixel RGBA) จากไฟล์ cache (ไม่แตะ display: เรียกจาก thread อื่นได้)"""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    if len(data) < _HEADER.size:
+        return None
+    magic, w, h = _HEADER.unpack_from(data)
+    if magic != _MAGIC or len(data) != _HEADER.size + w * h * 4:
+        return None
+    return w, h, data[_HEADER.size:]
+
+
+def load_surface(path: str) -> pygame.Surface | None:
+    raw = read_raw(path)
+    if raw is None:
+        return None
+    w, h, pixels = raw
+    surf = pygame.image.frombytes(pixels, (w, h), "RGBA")
+    return surf.convert_alpha()
+
+
+def load_prescaled(cache_dir: str, graphics_dir: str, source_path: str, scale: float) -> pygame.Surface | None:
+    """โหลดรูปที่ย่อไว้แล้ว (None = ไม่มี / ต้นฉบับเปลี่ยนไปแล้ว)"""
+    path = prescaled_path(cache_dir, graphics_dir, source_path, scale)
+    if path is None:
+        return None
+    return load_surface(path)
@@ -0,0 +1,179 @@
+# core/asset_loader.py
+"""
+decode รูปบน background thread (ThreadPoolExecutor) แล้วส่งต่อให้ ResourceManager
+
+แบ่งงานเป็น 2 ฝั่ง:
+- worker thread : อ่านไฟล์ + decode PNG + smoothscale -> pixel RGBA ดิบ
+                  (pygame/SDL ปล่อย GIL ระหว่าง decode / scale จึงใช้หลาย core ได้จริง)
+- main thread   : poll() -> frombytes + convert_alpha (ต้องทำบน thread ที่มี display)
+                  แล้ว stage_image ไว้ให้ load_image ครั้งถัดไปหยิบไปใช้
+
+ลำดับหาไฟล์เหมือน ResourceManager.load_image: asset pack -> prescaled -> ต้นฉบับ
+รองรับเฉพาะรูปที่ไม่มี colorkey (ที่เหลือ load_image โหลดเองตามปกติ)
+"""
+
+from __future__ import annotations
+
+import os
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, NamedTuple, Tuple
+
+import pygame
+
+from . import asset_cache
+from .asset_pack import surface_from_rgba
+
+if TYPE_CHECKING:
+    from .resource_manager import ResourceManager
+
+# (relative_path แบบที่ส่งให้ load_image, scale_override)
+ImageRequest = Tuple[str, "float | None"]
+
+
+class DecodedImage(NamedTuple):
+    relative_path: str
+    scale_override: float | None
+    size: Tuple[int, int]
+    pitch: int
+    pixels: "bytes | memoryview"
+
+
+def decode_image(resources: "ResourceManager", relative_path: str, scale_override: float | None = None) -> DecodedImage:
+    """decode รูปเป็น pixel RGBA ดิบ (ไม่แตะ display: เรียกจาก thread อื่นได้)"""
+    scale = resources.image_scale(relative_path, scale_override)
+    full_path = resources.image_source_path(relative_path)
+
+    # --- asset pack (ไม่ copy: ชี้เข้า mmap ตรง ๆ) ---
+    if resources.pack is not None:
+        key = asset_cache.entry_key(resources._graphics_dir, full_path, scale)
+        raw = resources.pack.read(key) if key is not None else None
+        if raw is not None:
+            w, h, pitch, pixels = raw
+            return DecodedImage(relative_path, scale_override, (w, h), pitch, pixels)
+
+    # --- ไฟล์ที่ย่อไว้แล้ว ---
+    if scale != 1.0 and resources.use_prescaled:
+        path = asset_cache.prescaled_path(resources.prescaled_dir, resources._graphics_dir, full_path, scale)
+        raw = asset_cache.read_raw(path) if path is not None else None
+        if raw is not None:
+            w, h, pixels = raw
+            return DecodedImage(relative_path, scale_override, (w, h), w * 4, pixels)
+
+    # --- ต้นฉบับ ---
+    image = pygame.image.load(full_path)
+    if image.get_bitsize() != 32:
+        # smoothscale รับแค่ 24/32 bit และ convert ทำไม่ได้ถ้าไม่มี display -> blit ลง RGBA แทน
+        rgba = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        rgba.blit(image, (0, 0))
+        image = rgba
+    image = resources._scale_surface(image, scale)
+    w, h = image.get_size()
+    return DecodedImage(relative_path, scale_override, (w, h), w * 4, pygame.image.tobytes(image, "RGBA"))
+
+
+class AssetLoader:
+    """
+    ตัวอย่างการใช้ (ใน scene):
+        loader = AssetLoader(game.resources)
+        loader.submit([("enemy/orc/idle/idle_down_01.png", 0.25), ...])
+        ...
+        def update(dt):
+            loader.poll()
+            if loader.done: ...
+    """
+
+    def __init__(self, resources: "ResourceManager", max_workers: int | None = None) -> None:
+        self.resources = resources
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="asset-loader")
+        # งานที่ decode เสร็จแล้ว รอ main thread มา convert_alpha
+        self._finished: "queue.Queue[Future]" = queue.Queue()
+        # future -> (relative_path, ขนาดไฟล์ต้นฉบับ)
+        self._pending: Dict[Future, Tuple[str, int]] = {}
+
+        self.files_total = 0
+        self.files_done = 0
+        self.bytes_total = 0
+        self.bytes_done = 0
+        self.failed: List[Tuple[str, Exception]] = []
+
+    # ---------- progress ----------
+    @property
+    def done(self) -> bool:
+        return self.files_done >= self.files_total
+
+    @property
+    def progress(self) -> float:
+        """0.0-1.0 ตามจำนวน byte ของไฟล์ต้นฉบับ"""
+        if self.bytes_total > 0:
+            return min(1.0, self.bytes_done / self.bytes_total)
+        return 1.0 if self.done else 0.0
+
+    # ---------- submit / poll ----------
+    def submit(self, requests: Iterable[ImageRequest]) -> int:
+        """ส่งรูปเข้าคิว decode (ข้ามรูปที่โหลดไว้แล้ว / ไฟล์ที่ไม่มีอยู่จริง) แล้วคืนจำนวนที่ส่ง"""
+        count = 0
+        seen = set()
+        for relative_path, scale_override in requests:
+            if (relative_path, scale_override) in seen or self.resources.has_image(relative_path, scale_override):
+                continue
+            seen.add((relative_path, scale_override))
+            try:
+                size = os.path.getsize(self.resources.image_source_path(relative_path))
+            except OSError:
+                continue
+            self.files_total += 1
+            self.bytes_total += size
+            future = self._executor.submit(decode_image, self.resources, relative_path, scale_override)
+            self._pending[future] = (relative_path, size)
+            future.add_done_callback(self._finished.put)
+            count += 1
+        return count
+
+    def poll(self, time_budget: float = 0.008) -> int:
+        """
+        (main thread) นำรูปที่ decode เสร็จแล้วไปสร้าง Surface + stage ไว้ใน ResourceManager
+        ทำไม่เกิน time_budget วินาทีต่อครั้ง (กันเฟรมหน้า loading กระตุก) แล้วคืนจำนวนที่ทำ
+        """
+        deadline = time.perf_counter() + time_budget
+        count = 0
+        while True:
+            try:
+                future = self._finished.get_nowait()
+            except queue.Empty:
+                break
+
+            relative_path, size = self._pending.pop(future)
+            self.files_done += 1
+            self.bytes_done += size
+            try:
+                decoded: DecodedImage = future.result()
+            except Exception as ex:
+                # ไม่ต้องหยุด: load_image จะลองโหลดรูปนี้เองอีกครั้งตอนใช้จริง
+                self.failed.append((relative_path, ex))
+                continue
+
+            image = surface_from_rgba(decoded.pixels, decoded.size, decoded.pitch)
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
+            else:
+                # ไม่มี display (เช่นใน test) -> copy ออกจาก buffer ของ worker / mmap
+                image = image.copy()
+            self.resources.stage_image(decoded.relative_path, image, decoded.scale_override)
+            count += 1
+
+            if time.perf_counter() >= deadline:
+                break
+        return count
+
+    def wait(self) -> None:
+        """block จนทุกงานเสร็จ (ใช้ตอนไม่มีหน้า loading เช่น test / benchmark)"""
+        while not self.done:
+            if not self.poll(time_budget=1.0):
+                time.sleep(0.001)
+
+    def shutdown(self) -> None:
+        """ยกเลิกงานที่ยังไม่เริ่ม แล้วปิด thread pool"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
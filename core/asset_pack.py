@@ -0,0 +1,151 @@
+# core/asset_pack.py
+"""
+asset pack: รวมรูปทั้งหมด (pixel RGBA ดิบ) ไว้ในไฟล์เดียว แล้วเปิดด้วย mmap
+
+โครงสร้างไฟล์ (little-endian):
+    header : magic (8 byte) | จำนวน entry (u32) | offset ของ index (u64)
+    blobs  : pixel RGBA ของแต่ละรูป (เริ่มที่ offset หาร 16 ลงตัว)
+    index  : ต่อ entry -> offset (u64) | width (u32) | height (u32) | pitch (u32) | key_len (u16) | key (utf-8)
+
+key เหมือนกับชื่อไฟล์ใน prescaled cache (core.asset_cache.entry_key)
+จึงผูกกับเนื้อไฟล์ต้นฉบับ (ไม่ใช่ mtime -> copy ไป build / clone ใหม่แล้วยังใช้ได้)
+ถ้าแก้รูป key จะไม่ตรงแล้ว ResourceManager จะ fallback เอง
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, Tuple
+
+import pygame
+
+PACK_SUBPATH = (".cache", "assets.pack")
+
+_MAGIC = b"RPGPACK1"
+_HEADER = struct.Struct("<8sIQ")
+_ENTRY = struct.Struct("<QIIIH")
+_ALIGN = 16
+
+# key -> (offset, width, height, pitch)
+Entry = Tuple[int, int, int, int]
+
+
+class AssetPack:
+    """อ่าน asset pack แบบ mmap (ไม่ decode: สร้าง Surface จาก buffer ที่ map ไว้ตรง ๆ)"""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self._file.close()
+            raise
+        self._view = memoryview(self._mm)
+        self._entries: Dict[str, Entry] = self._read_index()
+
+    def _read_index(self) -> Dict[str, Entry]:
+        mm = self._mm
+        if len(mm) < _HEADER.size:
+            raise ValueError(f"asset pack เสีย (ไฟล์สั้นเกิน): {self.path}")
+        magic, count, index_offset = _HEADER.unpack_from(mm, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"ไม่ใช่ asset pack: {self.path}")
+
+        entries: Dict[str, Entry] = {}
+        pos = index_offset
+        for _ in range(count):
+            offset, w, h, pitch, key_len = _ENTRY.unpack_from(mm, pos)
+            pos += _ENTRY.size
+            key = bytes(mm[pos:pos + key_len]).decode("utf-8")
+            pos += key_len
+            entries[key] = (offset, w, h, pitch)
+        return entries
+
+    # ---------- query ----------
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def raw_size(self, key: str) -> int:
+        _, _, h, pitch = self._entries[key]
+        return h * pitch
+
+    def read(self, key: str) -> Tuple[int, int, int, memoryview] | None:
+        """(width, height, pitch, pixel RGBA) ของ key แบบไม่ copy (ไม่แตะ display: เรียกจาก thread อื่นได้)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        offset, w, h, pitch = entry
+        return w, h, pitch, self._view[offset:offset + h * pitch]
+
+    def load(self, key: str, convert: bool = True) -> pygame.Surface | None:
+        """
+        สร้าง Surface ของ key (None = ไม่มีใน pack)
+        convert = True : convert_alpha() เป็น format ของจอ (copy ออกจาก mmap แล้ว)
+        convert = False: Surface ใช้ memory ของ mmap ตรง ๆ (ห้าม close pack ระหว่างใช้)
+        """
+        raw = self.read(key)
+        if raw is None:
+            return None
+        w, h, pitch, buf = raw
+        surf = surface_from_rgba(buf, (w, h), pitch)
+        if convert and pygame.display.get_surface() is not None:
+            return surf.convert_alpha()
+        return surf
+
+    def close(self) -> None:
+        self._entries = {}
+        self._view.release()
+        self._mm.close()
+        self._file.close()
+
+
+def surface_from_rgba(buf, size: Tuple[int, int], pitch: int) -> pygame.Surface:
+    """
+    Surface ที่ใช้ memory ของ buf (RGBA) ตรง ๆ
+    ส่ง pitch ให้ frombuffer เฉพาะตอนที่แถวมี padding: pygame 2.6 segfault เป็นระยะถ้าส่ง pitch มาเลย
+    """
+    if pitch == size[0] * 4:
+        return pygame.image.frombuffer(buf, size, "RGBA")
+    return pygame.image.frombuffer(buf, size, "RGBA", pitch)
+
+
+def write_pack(path: str, entries: Iterable[Tuple[str, pygame.Surface]]) -> int:
+    """
+    เขียน asset pack จาก (key, Surface) แล้วคืนจำนวน entry
+    เขียนลงไฟล์ชั่วคราวก่อนแล้วค่อย replace (เกมที่เปิด pack เดิมอยู่ไม่พัง)
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    index = []
+
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, 0, 0))
+        for key, surf in entries:
+            pad = (-f.tell()) % _ALIGN
+            if pad:
+                f.write(b"\0" * pad)
+            w, h = surf.get_size()
+            offset = f.tell()
+            f.write(pygame.image.tobytes(surf, "RGBA"))
+            index.append((key, offset, w, h, w * 4))
+
+        index_offset = f.tell()
+        for key, offset, w, h, pitch in index:
+            raw_key = key.encode("utf-8")
+            f.write(_ENTRY.pack(offset, w, h, pitch, len(raw_key)))
+            f.write(raw_key)
+
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, len(index), index_offset))
+
+    os.replace(tmp, path)
+    return len(index)
@@ -34,6 +34,8 @@ class Camera:
         self._pos = pygame.Vector2(0.0, 0.0)
         # offset ที่ใช้ตอนวาด (int)
         self.offset = pygame.Vector2(0.0, 0.0)
+        # offset ก่อน update ล่าสุด (ใช้ interpolate ระหว่าง sim step ดู lerp_offset)
+        self._prev_offset = pygame.Vector2(0.0, 0.0)
 
         # ความเร็วตาม (ค่ามาก = กล้องไล่เร็ว, เล็ก = หนืดนุ่ม)
         self.follow_speed = max(0.01, follow_speed)
@@ -68,6 +70,8 @@ class Camera:
         dt         : delta time (วินาที) จาก game loop
         """
 
+        self._prev_offset.update(self.offset)
+
         # ตำแหน่ง target ใน world
         target_center = pygame.Vector2(target_rect.centerx, target_rect.centery)
 
@@ -112,3 +116,17 @@ class Camera:
 
         # อัปเดต offset (ใช้ int ป้องกันวาดแล้วเบลอ/สั่น)
         self.offset.update(round(self._pos.x), round(self._pos.y))
+
+    def lerp_offset(self, alpha: float) -> pygame.Vector2:
+        """offset ระหว่าง update ก่อนหน้ากับล่าสุด (alpha = 0..1 จาก GameApp.render_alpha)"""
+        prev = self._prev_offset
+        return pygame.Vector2(
+            round(prev.x + (self.offset.x - prev.x) * alpha),
+            round(prev.y + (self.offset.y - prev.y) * alpha),
+        )
+
+    # ---------- culling ----------
+    @property
+    def view_rect(self) -> pygame.Rect:
+        """พื้นที่ของ world ที่อยู่ในจอตอนนี้ (จาก offset + ขนาดจอ)"""
+        return pygame.Rect(int(self.offset.x), int(self.offset.y), self.screen_width, self.screen_height)
@@ -7,15 +7,32 @@ import pygame
 import sys
 import os
 
-from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, WINDOW_TITLE, FULLSCREEN
+from config.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, SIM_HZ, MAX_SIM_STEPS, RNG_SEED,
+    WINDOW_TITLE, FULLSCREEN, RESOURCE_SCALES, RESOURCE_CACHE,
+)
+from config.constants import KEY_BINDINGS
 from .event_bus import EventBus
+from .node_pool import NodePool
+from .profiler import Profiler
+from .rng import RngService
 from .resource_manager import ResourceManager
 from .audio_manager import AudioManager
 from .scene_manager import SceneManager
 
 
 class GameApp:
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False, seed: int | None = RNG_SEED) -> None:
+        """
+        headless = True : ไม่เปิดหน้าต่างจริง / ไม่มีเสียง (SDL dummy driver) สำหรับ simulate.py
+                          ยัง set_mode ให้ convert_alpha ใช้ได้ แต่ไม่มีใครเรียก draw
+        seed            : seed ของ self.rng (None = สุ่มใหม่ทุกครั้งที่เปิดเกม)
+        """
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+
         # Determine if application is a script file or frozen exe
         if getattr(sys, 'frozen', False):
             # If the application is run as a bundle, the PyInstaller bootloader
@@ -33,7 +50,7 @@ class GameApp:
         # pygame.mixer.init() is handled by pygame.init() using pre_init settings
 
         flags = 0
-        if FULLSCREEN:
+        if FULLSCREEN and not headless:
             # ใช้ FULLSCREEN | SCALED เพื่อให้ปรับความละเอียดตามจอที่รองรับอัตโนมัติ
             flags = pygame.FULLSCREEN | pygame.SCALED
         
@@ -46,34 +63,32 @@ class GameApp:
         self.clock = pygame.time.Clock()
         self.running = True
 
+        # simulation เดินทีละ sim_dt คงที่ (ดู run)
+        self.sim_dt = 1.0 / SIM_HZ
+        # เวลาที่เลย sim step ล่าสุดมาแล้ว (0..1 ของ sim_dt) ให้ scene interpolate ตำแหน่งตอนวาด
+        self.render_alpha = 1.0
+        # จำนวน sim step ที่ถูกทิ้งเพราะเครื่องตามไม่ทัน
+        self.sim_steps_dropped = 0
+
         # Core systems
         self.event_bus = EventBus()
+        # ตัวสุ่มของทุกระบบ (combat / spawn / enemy_ai / vfx ...) มาจาก seed เดียว
+        self.rng = RngService(seed)
+        # จับเวลาแต่ละส่วนของเฟรม (ปิดไว้จนกด F3 ดู core/profiler.py)
+        self.profiler = Profiler()
+        # ลูกธนู / ลูกไฟ / trail ที่ถูก kill แล้วเก็บไว้ใช้ซ้ำ (ดู core/node_pool.py)
+        self.node_pool = NodePool()
         
-        # กำหนด scale สำหรับ sprite กับ tile
-        self.resources = ResourceManager(
-            base_path=base_path,
-            sprite_scale=0.25,   # ขนาดตัวละคร / enemy
-            tile_scale=1.0,      # ขนาด tile
-            projectile_scale=0.2,  # ลูกธนู
-            item_scale=0.2,        # ค่าเริ่มต้นของ items ทุกชนิด
-            item_scale_overrides={
-                # ทำให้ bow_power เล็กลงหน่อย (เช่น 50% ของไฟล์)
-                "items/bow_power": 0.2,
-                # ทำให้ bow_power เล็กลงหน่อย (เช่น 50% ของไฟล์)
-                "items/potion_small": 0.1,
-                "items/potion_full": 0.1,
-                # ขนาดไอเท็มโล่
-                "items/shield": 0.2,
-                # ขนาดไอเท็มฟันรอบทิศทาง
-                "items/sword_all_direction": 0.2,
-            },
-        )
+        # กำหนด scale สำหรับ sprite กับ tile และงบ memory ของ cache (ดู config/settings.py)
+        self.resources = ResourceManager(base_path=base_path, **RESOURCE_SCALES, **RESOURCE_CACHE)
 
         self.audio = AudioManager(self.resources)
         self.scene_manager = SceneManager(self)
 
         # Global State
         self.selected_player_type: str = "hero"
+        # ถ้าตั้งไว้ PlayerNode จะอ่านทิศเดินจาก controller.move แทนคีย์บอร์ด (ดู simulate.py)
+        self.player_controller = None
 
     def quit(self) -> None:
         self.running = False
@@ -90,26 +105,58 @@ class GameApp:
             print(f"[LOG] {text}")
 
     def run(self) -> None:
+        # fixed timestep: สะสมเวลาจริงแล้ว update ทีละ sim_dt (ผลเหมือนกันทุก frame rate)
+        # ส่วนการวาดทำเฟรมละครั้ง และ interpolate ระหว่าง step ด้วย render_alpha
+        accumulator = 0.0
+        self.clock.tick()  # ไม่นับเวลาตั้งแต่สร้าง clock (init / โหลด scene แรก) เป็นเวลาของ sim
+        prof = self.profiler
         while self.running:
             dt_ms = self.clock.tick(FPS)
-            # Cap dt to prevent "spiral of death" or huge jumps (e.g. window drag)
-            dt = min(dt_ms / 1000.0, 0.1)
+            accumulator += dt_ms / 1000.0
 
+            prof.begin("events")
             events = pygame.event.get()
             for event in events:
                 if event.type == pygame.QUIT:
                     self.running = False
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == KEY_BINDINGS["profiler"]:
+                        prof.toggle()
+                    elif event.key == KEY_BINDINGS["profiler_dump"] and prof.enabled:
+                        print(f"[PROFILE] wrote {prof.dump_csv()}")
 
             # ส่ง event ให้ AudioManager (intro->loop, pending start หลัง fade)
             self.audio.handle_events(events)
 
             # ส่ง event ให้ scene ปัจจุบัน
             self.scene_manager.handle_events(events)
-            self.scene_manager.update(dt)
-
+            prof.end("events")
+
+            prof.begin("sim")
+            steps = 0
+            while accumulator >= self.sim_dt and steps < MAX_SIM_STEPS:
+                self.scene_manager.update(self.sim_dt)
+                accumulator -= self.sim_dt
+                steps += 1
+            prof.end("sim")
+
+            # กัน spiral of death (เช่นลากหน้าต่าง / โหลดด่าน): ทิ้งเวลาที่ตามไม่ทัน แทนที่จะไล่ update ไม่จบ
+            if accumulator >= self.sim_dt:
+                dropped = int(accumulator // self.sim_dt)
+                accumulator -= dropped * self.sim_dt
+                self.sim_steps_dropped += dropped
+                print(f"[WARN] simulation fell behind: dropped {dropped} steps ({dropped * self.sim_dt * 1000:.0f} ms)")
+
+            self.render_alpha = accumulator / self.sim_dt
+
+            prof.begin("render")
             self.screen.fill((20, 20, 20))
             self.scene_manager.draw(self.screen)
+            prof.end("render")
+            prof.draw_overlay(self.screen)
 
-            pygame.display.flip()
+            with prof.scope("flip"):
+                pygame.display.flip()
+            prof.end_frame()
 
         pygame.quit()
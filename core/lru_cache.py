@@ -0,0 +1,187 @@
+# core/lru_cache.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Generic, Hashable, Iterator, Optional, Set, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class CacheStats:
+    entries: int
+    bytes: int
+    pinned_bytes: int
+    budget_bytes: Optional[int]
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class LRUCache(Generic[V]):
+    """
+    cache แบบ LRU ที่นับขนาดเป็น byte (ขนาดต่อ entry ผู้เรียกบอกเองตอน put)
+
+    - budget_bytes : เกินเมื่อไรจะไล่ entry ที่ไม่ได้ใช้นานที่สุดออก (None = ไม่จำกัด)
+    - max_entries  : จำกัดจำนวน entry ด้วย (ใช้กับของที่ขนาดเล็กแต่ไม่ควรงอกไม่สิ้นสุด เช่น font)
+    - pin tag      : ระหว่างที่ตั้ง pin_tag ไว้ ทุก entry ที่ put / get จะถูก pin ด้วย tag นั้น
+                     entry ที่ถูก pin จะไม่ถูกไล่ออก (แต่ยังนับขนาดรวมใน budget)
+                     เปลี่ยน tag (เช่นเปลี่ยนด่าน) = ปล่อย pin ของ tag เก่าทั้งหมด
+
+    - parent       : put(..., parent=key) ผูก entry ที่ใช้ pixel ร่วมกับ entry อื่น (เช่น tile table -> รูป tileset)
+                     ใช้ลูกเมื่อไร = ใช้แม่ด้วย / แม่ถูกไล่ออก = ลูกออกด้วย (ไม่มีของค้างที่ไม่ได้นับใน bytes)
+
+    ถ้าของที่ pin ไว้ใหญ่เกิน budget เอง cache จะเกิน budget ได้ (ไม่ไล่ของที่กำลังใช้ทิ้ง)
+    """
+
+    def __init__(self, budget_bytes: int | None = None, max_entries: int | None = None) -> None:
+        self.budget_bytes = budget_bytes
+        self.max_entries = max_entries
+
+        # key -> (value, nbytes) เรียงจากใช้ล่าสุดน้อยที่สุดไปมากที่สุด
+        self._entries: "OrderedDict[Hashable, Tuple[V, int]]" = OrderedDict()
+        self._pins: Dict[Hashable, Set[Hashable]] = {}
+        self._pin_tag: Hashable | None = None
+        # key ลูก -> key แม่ และ key แม่ -> ลูกทั้งหมด
+        self._parents: Dict[Hashable, Hashable] = {}
+        self._children: Dict[Hashable, Set[Hashable]] = {}
+
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- dict-like ----------
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+    def get(self, key: Hashable) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: V, nbytes: int, parent: Hashable | None = None) -> None:
+        """parent: key ของ entry ที่ value อ้างถึง (ต้องอยู่ใน cache แล้ว ไม่งั้นไม่ผูก)"""
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._unlink(key)
+        self._entries[key] = (value, nbytes)
+        self.bytes += nbytes
+        if parent is not None and parent in self._entries:
+            self._parents[key] = parent
+            self._children.setdefault(parent, set()).add(key)
+        self._touch(key)
+        self._evict()
+
+    def discard(self, key: Hashable) -> None:
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._pins.clear()
+        self._parents.clear()
+        self._children.clear()
+        self.bytes = 0
+
+    def _touch(self, key: Hashable) -> None:
+        """ย้ายไปท้ายสุด (ใช้ล่าสุด) + pin ทั้งตัวเองและแม่"""
+        parent = self._parents.get(key)
+        if parent is not None:
+            self._entries.move_to_end(parent)
+            self._pin(parent)
+        self._entries.move_to_end(key)
+        self._pin(key)
+
+    def _remove(self, key: Hashable) -> None:
+        """เอา key ออก พร้อมลูกทั้งหมด"""
+        _, nbytes = self._entries.pop(key)
+        self.bytes -= nbytes
+        self._pins.pop(key, None)
+        for child in self._children.pop(key, ()):
+            self._parents.pop(child, None)
+            if child in self._entries:
+                self._remove(child)
+        self._unlink(key)
+
+    def _unlink(self, key: Hashable) -> None:
+        parent = self._parents.pop(key, None)
+        if parent is not None:
+            children = self._children.get(parent)
+            if children is not None:
+                children.discard(key)
+                if not children:
+                    del self._children[parent]
+
+    # ---------- pinning ----------
+    @property
+    def pin_tag(self) -> Hashable | None:
+        return self._pin_tag
+
+    def set_pin_tag(self, tag: Hashable | None) -> None:
+        """เปลี่ยน tag ที่ใช้ pin (ปล่อย pin ของ tag เดิม แล้วไล่ของที่เกิน budget ออก)"""
+        old = self._pin_tag
+        self._pin_tag = tag
+        if old is not None and old != tag:
+            for key in list(self._pins):
+                tags = self._pins[key]
+                tags.discard(old)
+                if not tags:
+                    del self._pins[key]
+        self._evict()
+
+    def is_pinned(self, key: Hashable) -> bool:
+        return key in self._pins
+
+    def _pin(self, key: Hashable) -> None:
+        if self._pin_tag is not None:
+            self._pins.setdefault(key, set()).add(self._pin_tag)
+
+    # ---------- eviction ----------
+    def _over_limit(self) -> bool:
+        if self.budget_bytes is not None and self.bytes > self.budget_bytes:
+            return True
+        return self.max_entries is not None and len(self._entries) > self.max_entries
+
+    def _evict(self) -> None:
+        # ทุกตัวถูก pin (ของด่านปัจจุบันเกินงบเอง) -> ไม่มีอะไรให้ไล่ ไม่ต้องไล่ดูทั้ง cache ทุกครั้งที่ put
+        if not self._over_limit() or len(self._pins) >= len(self._entries):
+            return
+        # ไล่จากตัวที่ไม่ได้ใช้นานที่สุด ข้ามตัวที่ถูก pin (เหลือแต่ตัวที่ pin -> หยุด ไม่ต้องไล่ดูต่อ)
+        for key in list(self._entries):
+            if not self._over_limit() or len(self._pins) >= len(self._entries):
+                break
+            if key in self._pins or key not in self._entries:
+                continue
+            self._remove(key)
+            self.evictions += 1
+
+    # ---------- stats ----------
+    def stats(self) -> CacheStats:
+        pinned = sum(self._entries[key][1] for key in self._pins if key in self._entries)
+        return CacheStats(
+            entries=len(self._entries),
+            bytes=self.bytes,
+            pinned_bytes=pinned,
+            budget_bytes=self.budget_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
@@ -0,0 +1,86 @@
+# core/node_pool.py
+"""
+เก็บ node ที่ถูก kill() ไว้ใช้ซ้ำ แทนการสร้าง object + Surface ใหม่ทุกครั้ง (ลูกธนู / ลูกไฟ / หินบอส / trail)
+
+    class ProjectileNode(PooledNode, AnimatedNode): ...
+
+    node = ProjectileNode.from_pool(pool, ...)  # ได้ตัวที่ถูก kill ไปแล้วมา reset(...) หรือสร้างใหม่ถ้าไม่มี
+    node.kill()                                 # ออกจากทุก group แล้วกลับเข้า pool
+
+node ที่ใช้กับ pool ต้องมี reset(...) ที่ตั้ง state ใหม่ทั้งหมดแล้ว add เข้า group เอง
+และ _on_release() ที่ตัด reference ไปยังของในด่าน (owner / target ...) ไม่ให้ pool ยึด enemy + atlas ของด่านก่อนไว้
+เฟรมที่หมุนแล้วของลูกธนู / ลูกไฟ อยู่ใน resources.rotations (core/rotation_cache.py) ไม่ใช่ใน pool
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List
+
+
+class NodePool:
+    def __init__(self, max_free_per_type: int = 512) -> None:
+        self.max_free_per_type = max_free_per_type
+        self._free: Dict[type, List[object]] = {}
+        # ตัวนับสำหรับ benchmark / debug
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, cls: type):
+        """คืน node ว่างของคลาสนี้ (ยังไม่ reset) หรือ None ถ้าไม่มี"""
+        free = self._free.get(cls)
+        if not free:
+            self.created += 1
+            return None
+        node = free.pop()
+        node._in_pool = False
+        self.reused += 1
+        return node
+
+    def release(self, node) -> None:
+        if getattr(node, "_in_pool", False):
+            return
+        free = self._free.setdefault(type(node), [])
+        if len(free) >= self.max_free_per_type:
+            return
+        node._in_pool = True
+        free.append(node)
+
+    def free_count(self, cls: type) -> int:
+        return len(self._free.get(cls, ()))
+
+    def clear(self) -> None:
+        self._free.clear()
+
+
+class PooledNode:
+    """
+    mixin สำหรับ sprite ที่ใช้ NodePool ได้ (วางไว้หน้า base class ของ sprite เพื่อ override kill)
+    subclass ต้องมี reset(...) ที่รับ argument ชุดเดียวกับ __init__
+    """
+
+    _pool: NodePool | None = None
+    _in_pool = False
+
+    @classmethod
+    def from_pool(cls, pool: NodePool | None, *args, **kwargs):
+        node = pool.acquire(cls) if pool is not None else None
+        if node is None:
+            node = cls(*args, **kwargs)
+        else:
+            node.reset(*args, **kwargs)
+        node._pool = pool
+        return node
+
+    def kill(self) -> None:
+        super().kill()
+        if self._pool is not None:
+            self._on_release()
+            self._pool.release(self)
+
+    def _on_release(self) -> None:
+        """เรียกตอนกลับเข้า pool: ตั้ง reference ที่ชี้ไปยัง sprite / ของในด่านเป็น None"""
+
+
+def game_pool(game) -> NodePool | None:
+    """game.node_pool ถ้ามี (stub ใน test / benchmark ที่ไม่มีจะได้ None = ไม่ใช้ pool)"""
+    return getattr(game, "node_pool", None)
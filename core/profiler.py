@@ -0,0 +1,192 @@
+# core/profiler.py
+"""
+จับเวลาแต่ละส่วนของเฟรม (ms) แบบเบา ๆ ด้วย perf_counter_ns
+
+    prof = game.profiler
+    with prof.scope("update.collisions"):
+        ...
+    prof.begin("draw.hud")      # สำหรับโค้ดยาวต่อเนื่องที่ไม่อยากห่อ with
+    ...
+    prof.end("draw.hud")
+    prof.end_frame()            # GameApp.run เรียกเฟรมละครั้ง
+
+- scope ชื่อเดียวกันที่ถูกเรียกหลายครั้งในเฟรม (เช่นหลาย sim step) ถูกรวมเป็นเวลาของเฟรมนั้น
+- เก็บย้อนหลัง window เฟรม -> avg / p99 / max สำหรับ overlay (F3) และ dump_csv (F4)
+- ปิดอยู่ (enabled = False): scope คืน context ว่างตัวเดียวกันทุกครั้ง, begin/end/end_frame return ทันที
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+
+@dataclass
+class ScopeStats:
+    name: str
+    avg_ms: float
+    p99_ms: float
+    max_ms: float
+    frames: int
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self._profiler._add(self._name, time.perf_counter_ns() - self._start)
+        return False
+
+
+class Profiler:
+    # สร้างข้อความ overlay ใหม่ทุก ๆ กี่เฟรม (render font ทุกเฟรมจะกินเวลาเอง)
+    OVERLAY_REFRESH_FRAMES = 30
+
+    def __init__(self, window: int = 240, enabled: bool = False) -> None:
+        self.window = window
+        self.enabled = enabled
+        self._frame: Dict[str, int] = {}           # ns สะสมของเฟรมปัจจุบัน
+        self._open: Dict[str, int] = {}            # begin() ที่ยังไม่ end()
+        self._samples: Dict[str, Deque[float]] = {}  # ms ต่อเฟรม ย้อนหลัง window เฟรม
+        self._overlay: Optional[object] = None
+        self._overlay_age = 0
+        self._font = None
+
+    # ---------- Recording ----------
+    def scope(self, name: str):
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def begin(self, name: str) -> None:
+        if self.enabled:
+            self._open[name] = time.perf_counter_ns()
+
+    def end(self, name: str) -> None:
+        if not self.enabled:
+            return
+        start = self._open.pop(name, None)
+        if start is not None:
+            self._add(name, time.perf_counter_ns() - start)
+
+    def _add(self, name: str, ns: int) -> None:
+        self._frame[name] = self._frame.get(name, 0) + ns
+
+    def end_frame(self) -> None:
+        """ปิดเฟรม: ย้ายเวลารวมของเฟรมนี้เข้า window (scope ที่เฟรมนี้ไม่ได้วิ่งนับเป็น 0)"""
+        if not self.enabled:
+            return
+        frame = self._frame
+        for name in frame:
+            if name not in self._samples:
+                self._samples[name] = deque(maxlen=self.window)
+        for name, samples in self._samples.items():
+            samples.append(frame.get(name, 0) / 1_000_000)
+        frame.clear()
+        self._overlay_age += 1
+
+    # ---------- Control ----------
+    def set_enabled(self, enabled: bool) -> None:
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+
+    def toggle(self) -> bool:
+        self.set_enabled(not self.enabled)
+        return self.enabled
+
+    def reset(self) -> None:
+        self._frame.clear()
+        self._open.clear()
+        self._samples.clear()
+        self._overlay = None
+
+    # ---------- Report ----------
+    def stats(self) -> List[ScopeStats]:
+        """สถิติทุก scope เรียงตามชื่อ (scope ย่อย "update.xxx" จะอยู่ติดกัน)"""
+        result = []
+        for name in sorted(self._samples):
+            samples = self._samples[name]
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            n = len(ordered)
+            result.append(ScopeStats(
+                name=name,
+                avg_ms=sum(ordered) / n,
+                p99_ms=ordered[min(n - 1, int(n * 0.99))],
+                max_ms=ordered[-1],
+                frames=n,
+            ))
+        return result
+
+    def dump_csv(self, path: Optional[str] = None) -> str:
+        """เขียน stats() ลง CSV (ไม่ระบุ path = profile_<เวลา>.csv ในโฟลเดอร์ปัจจุบัน) แล้วคืน path"""
+        if path is None:
+            path = time.strftime("profile_%Y%m%d_%H%M%S.csv")
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["scope", "avg_ms", "p99_ms", "max_ms", "frames"])
+            for s in self.stats():
+                writer.writerow([s.name, f"{s.avg_ms:.4f}", f"{s.p99_ms:.4f}", f"{s.max_ms:.4f}", s.frames])
+        return path
+
+    def overlay_lines(self) -> List[Tuple[str, str, str]]:
+        return [(s.name, f"{s.avg_ms:6.2f}", f"{s.p99_ms:6.2f}") for s in self.stats()]
+
+    def draw_overlay(self, surface, pos: Tuple[int, int] = (8, 8)) -> None:
+        """วาดตาราง scope / avg / p99 มุมจอ (ใช้ font ติดเครื่องของ pygame ไม่พึ่ง assets)"""
+        if not self.enabled:
+            return
+
+        if self._overlay is None or self._overlay_age >= self.OVERLAY_REFRESH_FRAMES:
+            if self._font is None:
+                self._font = pygame.font.Font(None, 18)
+            font = self._font
+            rows = [("scope", "avg ms", "p99 ms")] + self.overlay_lines()
+            line_h = font.get_linesize()
+            name_w = max(font.size(r[0])[0] for r in rows) + 12
+            col_w = font.size("000.00 ms")[0] + 8
+            panel = pygame.Surface((name_w + col_w * 2 + 12, line_h * len(rows) + 8), pygame.SRCALPHA)
+            panel.fill((0, 0, 0, 170))
+            for i, (name, avg, p99) in enumerate(rows):
+                color = (255, 220, 120) if i == 0 else (230, 230, 230)
+                y = 4 + i * line_h
+                panel.blit(font.render(name, True, color), (6, y))
+                panel.blit(font.render(avg, True, color), (6 + name_w, y))
+                panel.blit(font.render(p99, True, color), (6 + name_w + col_w, y))
+            self._overlay = panel
+            self._overlay_age = 0
+
+        surface.blit(self._overlay, pos)
@@ -0,0 +1,150 @@
+# core/render_group.py
+from __future__ import annotations
+
+from bisect import insort
+from heapq import merge
+from operator import attrgetter
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pygame
+
+from combat.spatial_grid import StaticRectGrid
+
+_rect_bottom = attrgetter("rect.bottom")
+
+
+class ZOrderedGroup(pygame.sprite.Group):
+    """
+    Group ที่เก็บ sprite แยก bucket ตาม z ไว้ตลอด (ไม่ต้อง sort ทั้งกลุ่มทุกเฟรม)
+
+    convention ของ z ในโปรเจกต์:
+        -10 : decor ด้านหลัง
+          0 : actor (player / enemy / item / projectile / effect ทั่วไป)
+        +10 : decor ด้านหน้า
+         15 : hit effect
+         20 : damage number
+
+    - bucket ถูกอัปเดตตอน add / remove และตอนเปลี่ยนค่า z (NodeBase.z -> change_z)
+    - เฉพาะ bucket ACTOR_Z เท่านั้นที่ y-sort (ตาม rect.bottom) ทุกเฟรม
+      และ y-sort เฉพาะ sprite ที่มี y_sort = True; ตัวอื่นในชั้นนี้ (effect ฯลฯ)
+      วาดทับตามลำดับที่ถูกเพิ่มเข้ามา
+    - ลิสต์ actor เก็บต่อเนื่องข้ามเฟรม เรียงเกือบเสร็จแล้วทุกครั้ง
+      list.sort (timsort) จึงใช้เวลาราว O(n)
+    - sprite ที่ไม่ขยับ (static_render = True เช่น DecorationNode) เก็บใน
+      StaticRectGrid แยกตาม z -> buckets(view) ไม่ต้องไล่ตัวที่อยู่นอกจอเลย
+      (sprite แบบนี้ต้องตั้ง rect ให้เสร็จก่อน add เข้า group)
+    """
+
+    ACTOR_Z = 0
+
+    def __init__(self, *sprites: Any) -> None:
+        # z -> sprite (dict ใช้แทน ordered set: ลบได้ O(1) และรักษาลำดับการเพิ่ม)
+        self._buckets: Dict[int, Dict[Any, None]] = {}
+        # z ที่มีอยู่ เรียงจากหลังไปหน้า
+        self._z_order: List[int] = []
+        # actor ที่ต้อง y-sort (อยู่ใน bucket ACTOR_Z)
+        self._actors: List[Any] = []
+        # sprite ที่ไม่ขยับ: z -> StaticRectGrid
+        self._static: Dict[int, StaticRectGrid] = {}
+        super().__init__(*sprites)
+
+    # ---------- pygame.sprite.Group hooks ----------
+    def add_internal(self, sprite: Any, layer: Any = None) -> None:
+        super().add_internal(sprite, layer)
+        self._insert(sprite, getattr(sprite, "z", 0))
+
+    def remove_internal(self, sprite: Any) -> None:
+        super().remove_internal(sprite)
+        self._discard(sprite, getattr(sprite, "z", 0))
+
+    # ---------- bucket ----------
+    def _insert(self, sprite: Any, z: int) -> None:
+        bucket = self._buckets.get(z)
+        if bucket is None:
+            bucket = self._buckets[z] = {}
+            insort(self._z_order, z)
+
+        if getattr(sprite, "static_render", False):
+            grid = self._static.get(z)
+            if grid is None:
+                grid = self._static[z] = StaticRectGrid()
+            grid.insert(sprite)
+        elif z == self.ACTOR_Z and getattr(sprite, "y_sort", False):
+            self._actors.append(sprite)
+        else:
+            bucket[sprite] = None
+
+    def _discard(self, sprite: Any, z: int) -> None:
+        bucket = self._buckets.get(z)
+        if bucket is None:
+            return
+        if sprite in bucket:
+            del bucket[sprite]
+        elif getattr(sprite, "static_render", False):
+            grid = self._static.get(z)
+            if grid is not None:
+                grid.remove(sprite)
+        elif z == self.ACTOR_Z:
+            try:
+                self._actors.remove(sprite)
+            except ValueError:
+                pass
+
+    def change_z(self, sprite: Any, old_z: int, new_z: int) -> None:
+        """ย้าย sprite ไป bucket ใหม่ (เรียกจาก NodeBase.z setter)"""
+        if sprite not in self.spritedict:
+            return
+        self._discard(sprite, old_z)
+        self._insert(sprite, new_z)
+
+    # ---------- draw order ----------
+    def buckets(self, view: pygame.Rect | None = None) -> Iterator[Tuple[int, List[Any]]]:
+        """
+        คืน (z, sprites) จากหลังไปหน้า ข้าม bucket ที่ว่าง
+
+        view : rect ของกล้องในพิกัด world (None = ไม่ cull)
+               sprite ที่ rect ไม่ทับ view จะไม่ถูกคืนมา ยกเว้นตัวที่มี
+               extra_bounds() (เช่น telegraph ของบอส) ทับ view
+
+        ในแต่ละ bucket: static ก่อน แล้วตามด้วย sprite ที่ขยับได้
+        bucket ACTOR_Z = actor ที่ y-sort แล้ว (รวม static ที่ y_sort) ตามด้วยตัวอื่น
+        """
+        actor_z = self.ACTOR_Z
+        for z in self._z_order:
+            members = self._buckets[z]
+            grid = self._static.get(z)
+
+            if view is None:
+                statics = list(grid) if grid else []
+                dynamic = list(members)
+            else:
+                statics = grid.query_rect(view) if grid else []
+                dynamic = [s for s in members if _visible(s, view)]
+
+            if z == actor_z:
+                actors = self._actors
+                actors.sort(key=_rect_bottom)
+                if view is not None:
+                    actors = [s for s in actors if _visible(s, view)]
+
+                y_statics = [s for s in statics if getattr(s, "y_sort", False)]
+                if y_statics:
+                    statics = [s for s in statics if not getattr(s, "y_sort", False)]
+                    y_statics.sort(key=_rect_bottom)
+                    actors = list(merge(actors, y_statics, key=_rect_bottom))
+                sprites = actors + statics + dynamic
+            else:
+                sprites = statics + dynamic
+
+            if sprites:
+                yield z, sprites
+
+
+def _visible(sprite: Any, view: pygame.Rect) -> bool:
+    if view.colliderect(sprite.rect):
+        return True
+    extra_bounds = getattr(sprite, "extra_bounds", None)
+    if extra_bounds is None:
+        return False
+    bounds = extra_bounds()
+    return bounds is not None and view.colliderect(bounds)
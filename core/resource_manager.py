@@ -2,10 +2,31 @@
 from __future__ import annotations
 
 import os
-from typing import Dict, Tuple, Optional, Any
+import sys
+from typing import Dict, List, Tuple, Optional, Any
 
 import pygame
 
+from . import asset_cache
+from .asset_pack import PACK_SUBPATH, AssetPack
+from .lru_cache import CacheStats, LRUCache
+from .rotation_cache import RotationCache
+from .texture_atlas import TextureAtlas
+
+
+def surface_bytes(surf: pygame.Surface) -> int:
+    """ขนาด pixel ของ Surface (byte)"""
+    return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+
+def sound_bytes(sound: pygame.mixer.Sound) -> int:
+    """ขนาด sample ของ Sound (byte) ประมาณจากความยาว x format ของ mixer"""
+    init = pygame.mixer.get_init()
+    if not init:
+        return 0
+    frequency, fmt, channels = init
+    return int(sound.get_length() * frequency) * channels * (abs(fmt) // 8)
+
 
 class ResourceManager:
     def __init__(
@@ -16,6 +37,13 @@ class ResourceManager:
         projectile_scale: float | None = None,
         item_scale: float | None = None,
         item_scale_overrides: Dict[str, float] | None = None,
+        prescaled_dir: str | None = None,
+        use_prescaled: bool = True,
+        pack_path: str | None = None,
+        image_budget_mb: float | None = None,
+        sound_budget_mb: float | None = None,
+        max_fonts: int | None = None,
+        rotation_budget_mb: float | None = None,
     ) -> None:
         """
         sprite_scale        : scale สำหรับตัวละคร / enemy / UI ฯลฯ
@@ -29,6 +57,14 @@ class ResourceManager:
                     "items/shield": 0.8,
                 }
             จะถูกจับคู่กับ relative_path ที่เริ่มด้วย prefix นั้น
+        prescaled_dir       : โฟลเดอร์รูปที่ย่อไว้แล้ว (None = assets/.cache/prescaled)
+        use_prescaled       : False = โหลดจากต้นฉบับแล้วย่อเองทุกครั้ง (ไม่ใช้ทั้ง prescaled และ pack)
+        pack_path           : asset pack ที่สร้างด้วย pack_assets.py (None = assets/.cache/assets.pack)
+        image_budget_mb     : งบ memory ของรูป (image + tile table + atlas) ก่อนเริ่มไล่ตัวที่ไม่ได้ใช้นานสุดออก
+        sound_budget_mb     : งบ memory ของเสียง
+        max_fonts           : จำนวน font (ขนาด) สูงสุดที่เก็บไว้
+        rotation_budget_mb  : งบ memory ของเฟรม projectile ที่หมุนแล้ว (resources.rotations)
+            (None = ไม่จำกัด) ของที่ถูก pin ไว้กับด่านปัจจุบัน (ดู pin_level) จะไม่ถูกไล่ออก
         """
         self.base_path = base_path
 
@@ -38,9 +74,33 @@ class ResourceManager:
         self.item_scale = item_scale if item_scale is not None else sprite_scale
         self.item_scale_overrides = item_scale_overrides or {}
 
-        self._images: Dict[Tuple[str, float, Any], pygame.Surface] = {}
-        self._sounds: Dict[str, pygame.mixer.Sound] = {}
-        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        # รูปที่ย่อไว้แล้ว (สร้างด้วย build_assets.py) -> ใช้ก่อนถ้ายังตรงกับต้นฉบับ
+        self._graphics_dir = self._resolve("graphics")
+        self.prescaled_dir = prescaled_dir or self._resolve(*asset_cache.PRESCALED_SUBDIR)
+        self.use_prescaled = use_prescaled and os.path.isdir(self.prescaled_dir)
+        # asset pack (ไฟล์เดียว เปิดด้วย mmap) -> ลองก่อน prescaled
+        self.pack_path = pack_path or self._resolve(*PACK_SUBPATH)
+        self.pack: AssetPack | None = None
+        if use_prescaled and os.path.isfile(self.pack_path):
+            try:
+                self.pack = AssetPack(self.pack_path)
+            except (OSError, ValueError) as e:
+                print(f"[WARN] เปิด asset pack ไม่ได้ ({self.pack_path}): {e}")
+
+        # cache ของรูปทุกแบบ ใช้งบ byte ร่วมกัน key แยกตามชนิด:
+        #   ("image", relative_path, scale, colorkey) -> Surface
+        #   ("tiles", relative_path, tile_size)       -> list ของ subsurface (ใช้ pixel ร่วมกับรูป tileset จึงนับ 0 byte
+        #                                                และผูกกับ entry รูป tileset: ถูกไล่ออกพร้อมกัน)
+        #   ("atlas", atlas_id)                       -> TextureAtlas (เช่น "enemy/goblin@0.25")
+        self._surfaces: LRUCache[Any] = LRUCache(self._mb_to_bytes(image_budget_mb))
+        # รูปที่ decode ล่วงหน้าจาก AssetLoader (background thread) รอให้ load_image มาหยิบไป
+        self._staged: Dict[Tuple[str, float, Any], pygame.Surface] = {}
+        self._sounds: LRUCache[pygame.mixer.Sound] = LRUCache(self._mb_to_bytes(sound_budget_mb))
+        self._fonts: LRUCache[pygame.font.Font] = LRUCache(max_entries=max_fonts)
+        # รายชื่อไฟล์ใต้ assets/graphics (สแกนครั้งแรกที่ถาม ดู image_exists / frame_sequence)
+        self._graphics_files: frozenset[str] | None = None
+        # เฟรมที่หมุนตามมุมแล้ว (ลูกธนู / ลูกไฟ) ใช้ร่วมกันทุก node แยกงบจาก _surfaces
+        self.rotations = RotationCache(self._mb_to_bytes(rotation_budget_mb))
 
     # ------------------------------------------------------------------
     # Utils
@@ -48,6 +108,10 @@ class ResourceManager:
     def _resolve(self, *parts: str) -> str:
         return os.path.join(self.base_path, *parts)
 
+    @staticmethod
+    def _mb_to_bytes(mb: float | None) -> int | None:
+        return None if mb is None else int(mb * 1024 * 1024)
+
     def _scale_surface(self, surf: pygame.Surface, scale: float) -> pygame.Surface:
         if scale == 1.0:
             return surf
@@ -60,18 +124,9 @@ class ResourceManager:
     # ------------------------------------------------------------------
     # Images (sprites + tiles + projectiles + items)
     # ------------------------------------------------------------------
-    def load_image(self, relative_path: str, colorkey=None, scale_override: float | None = None) -> pygame.Surface:
-        """
-        relative_path ตัวอย่าง: "player/idle/idle_down_01.png"
-        """
-        # --- Normalize path first ---
-        key_path = relative_path
-        
-        # --- Determine potential scale early for cache key ---
-        # Note: We duplicate some logic here or restructure to ensure key matches the effective scale
-        # For simplicity, we'll determine the scale first.
-        
-        # --- Normalize path logic (copied/moved up) ---
+    @staticmethod
+    def _normalize_image_path(relative_path: str) -> str:
+        """ตัด prefix assets/ graphics/ และแปลง images/tiles/ -> tiles/"""
         norm_path = relative_path
         if norm_path.startswith("assets/"):
             norm_path = norm_path[len("assets/"):]
@@ -79,54 +134,217 @@ class ResourceManager:
             norm_path = norm_path[len("graphics/"):]
         if norm_path.startswith("images/tiles/"):
             norm_path = "tiles/" + norm_path[len("images/tiles/"):]
+        return norm_path
+
+    def image_scale(self, relative_path: str, scale_override: float | None = None) -> float:
+        """scale ที่ load_image จะใช้กับ path นี้ (ตามหมวด tile / projectile / item / sprite)"""
+        if scale_override is not None:
+            return scale_override
 
+        norm_path = self._normalize_image_path(relative_path)
         is_tile = norm_path.startswith("tiles/") or "/tiles/" in norm_path
         is_projectile = norm_path.startswith("projectiles/") or "/projectiles/" in norm_path
         is_item = norm_path.startswith("items/") or "/items/" in norm_path
 
-        if scale_override is not None:
-            scale = scale_override
-        elif is_tile:
-            scale = self.tile_scale
-        elif is_projectile:
-            scale = self.projectile_scale
-        elif is_item:
-            scale = self.item_scale
+        if is_tile:
+            return self.tile_scale
+        if is_projectile:
+            return self.projectile_scale
+        if is_item:
             for prefix, override_scale in self.item_scale_overrides.items():
                 if norm_path.startswith(prefix):
-                    scale = override_scale
-                    break
-        else:
-            scale = self.sprite_scale
+                    return override_scale
+            return self.item_scale
+        return self.sprite_scale
+
+    def _graphics_rel_path(self, relative_path: str) -> str:
+        """path ใต้ assets/graphics/ (คั่นด้วย "/") เช่น "enemy/orc/a.png" -> "images/enemy/orc/a.png" """
+        norm_path = self._normalize_image_path(relative_path)
+        if norm_path.startswith("images/") or norm_path.startswith("tiles/"):
+            return norm_path
+        return "images/" + norm_path
+
+    def image_source_path(self, relative_path: str) -> str:
+        """path ของไฟล์ต้นฉบับใต้ assets/graphics/..."""
+        return self._resolve("graphics", *self._graphics_rel_path(relative_path).split("/"))
+
+    # ------------------------------------------------------------------
+    # File index (หาไฟล์ / ลำดับเฟรมโดยไม่ต้องลองเปิดไฟล์ที่ไม่มี)
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _index_key(path: str) -> str:
+        # macOS / Windows หาไฟล์แบบไม่สนตัวพิมพ์ -> index ต้องให้ผลเหมือนกัน
+        if sys.platform == "darwin" or sys.platform.startswith("win"):
+            return path.lower()
+        return path
+
+    def _file_index(self) -> frozenset[str]:
+        if self._graphics_files is None:
+            files = set()
+            for root, _dirs, names in os.walk(self._graphics_dir):
+                rel_root = os.path.relpath(root, self._graphics_dir).replace(os.sep, "/")
+                prefix = "" if rel_root == "." else rel_root + "/"
+                files.update(self._index_key(prefix + name) for name in names)
+            self._graphics_files = frozenset(files)
+        return self._graphics_files
+
+    def rescan_files(self) -> None:
+        """ล้าง index ให้สแกน assets/graphics ใหม่ในครั้งถัดไป (เช่นหลังเพิ่มไฟล์ตอนเกมรันอยู่)"""
+        self._graphics_files = None
+
+    def image_exists(self, relative_path: str) -> bool:
+        """มีไฟล์ต้นฉบับของรูปนี้ไหม (ดูจาก index ไม่แตะ filesystem)"""
+        return self._index_key(self._graphics_rel_path(relative_path)) in self._file_index()
+
+    def frame_sequence(self, stem: str, ext: str = ".png") -> List[str]:
+        """
+        path ของเฟรมที่มีไฟล์จริงเรียงต่อกันตั้งแต่ 01 เช่น
+            "enemy/orc/idle/idle_down" -> ["enemy/orc/idle/idle_down_01.png", ..._02.png, ...]
+        หยุดที่เลขแรกที่ไม่มีไฟล์ (ว่าง = ไม่มีแม้แต่ _01)
+        """
+        paths: List[str] = []
+        index = 1
+        while True:
+            rel_path = f"{stem}_{index:02d}{ext}"
+            if not self.image_exists(rel_path):
+                return paths
+            paths.append(rel_path)
+            index += 1
+
+    def load_image(
+        self,
+        relative_path: str,
+        colorkey=None,
+        scale_override: float | None = None,
+        cache: bool = True,
+    ) -> pygame.Surface:
+        """
+        relative_path ตัวอย่าง: "player/idle/idle_down_01.png"
+        cache = False : ไม่เก็บรูปไว้ใน cache (เช่น เฟรมที่จะถูก pack ลง atlas ต่อ)
+
+        ลำดับการหา (ใช้อันแรกที่ยังตรงกับต้นฉบับ):
+            asset pack (pack_assets.py) -> ไฟล์ที่ย่อไว้แล้ว (build_assets.py) -> ต้นฉบับ
+        """
+        scale = self.image_scale(relative_path, scale_override)
 
         # --- Check Cache with (path, scale) ---
-        cache_key = (key_path, scale, colorkey)
-        if cache_key in self._images:
-            return self._images[cache_key]
+        cache_key = (relative_path, scale, colorkey)
+        image = self._surfaces.get(("image",) + cache_key)
+        if image is not None:
+            return image
+
+        # --- decode ไว้แล้วจาก AssetLoader (หยิบครั้งเดียว) ---
+        image = self._staged.pop(cache_key, None)
+        if image is not None:
+            if cache:
+                self._surfaces.put(("image",) + cache_key, image, surface_bytes(image))
+            return image
 
         # --- Build full path under assets/graphics/... ---
-        if norm_path.startswith("images/") or norm_path.startswith("tiles/"):
-            full_path = self._resolve("graphics", norm_path)
-        else:
-            full_path = self._resolve("graphics", "images", norm_path)
+        full_path = self.image_source_path(relative_path)
 
-        try:
+        # --- ไฟล์ที่ scale ไว้ล่วงหน้า (ไม่ต้อง decode รูปเต็มแล้วย่อเอง) ---
+        image = None
+        if self.pack is not None:
+            key = asset_cache.entry_key(self._graphics_dir, full_path, scale)
+            if key is not None:
+                image = self.pack.load(key)
+        if image is None and scale != 1.0 and self.use_prescaled:
+            image = asset_cache.load_prescaled(self.prescaled_dir, self._graphics_dir, full_path, scale)
+
+        if image is None:
             image = pygame.image.load(full_path).convert_alpha()
-        except FileNotFoundError:
-            # เพิ่ม logging หรือ print เถื่อน ๆ เพื่อ debug (แต่ใน lib ไม่ควร print)
-            raise 
-        except Exception:
-             raise 
 
-        if colorkey is not None:
-            image.set_colorkey(colorkey)
+            if colorkey is not None:
+                image.set_colorkey(colorkey)
 
-        # apply scale
-        image = self._scale_surface(image, scale)
+            # apply scale
+            image = self._scale_surface(image, scale)
+        elif colorkey is not None:
+            image.set_colorkey(colorkey)
 
-        self._images[cache_key] = image
+        if cache:
+            self._surfaces.put(("image",) + cache_key, image, surface_bytes(image))
         return image
 
+    def has_image(self, relative_path: str, scale_override: float | None = None) -> bool:
+        """รูปนี้ (ไม่มี colorkey) อยู่ใน cache หรือ decode รอไว้แล้วหรือยัง"""
+        cache_key = (relative_path, self.image_scale(relative_path, scale_override), None)
+        return ("image",) + cache_key in self._surfaces or cache_key in self._staged
+
+    def stage_image(
+        self,
+        relative_path: str,
+        image: pygame.Surface,
+        scale_override: float | None = None,
+    ) -> None:
+        """
+        ฝากรูปที่ decode ไว้แล้ว (เช่นจาก AssetLoader) ให้ load_image ครั้งถัดไปของ path + scale นี้หยิบไปใช้
+        ใช้แทนการโหลดเองเท่านั้น: ถ้ารูปนี้อยู่ใน cache แล้วจะไม่เก็บซ้ำ
+        """
+        cache_key = (relative_path, self.image_scale(relative_path, scale_override), None)
+        if ("image",) + cache_key not in self._surfaces:
+            self._staged[cache_key] = image
+
+    def clear_staged(self) -> int:
+        """ทิ้งรูปที่ decode ไว้แต่ไม่มีใครมาหยิบ (คืนจำนวนที่ทิ้ง)"""
+        count = len(self._staged)
+        self._staged.clear()
+        return count
+
+    def load_tile_table(self, relative_path: str, tile_size: int) -> List[pygame.Surface]:
+        """
+        หั่น tileset เป็น list ของ tile (index 0-based เรียงซ้ายไปขวา บนลงล่าง)
+        หั่นครั้งเดียวต่อ (tileset, tile_size) แล้วแชร์ให้ TileMap ทุกตัว
+        """
+        key = ("tiles", relative_path, tile_size)
+        table = self._surfaces.get(key)
+        if table is not None:
+            return table
+
+        sheet = self.load_image(relative_path)
+        sheet_key = ("image", relative_path, self.image_scale(relative_path), None)
+        cols = sheet.get_width() // tile_size
+        rows = sheet.get_height() // tile_size
+
+        table = [
+            sheet.subsurface(pygame.Rect(col * tile_size, row * tile_size, tile_size, tile_size))
+            for row in range(rows)
+            for col in range(cols)
+        ]
+        # subsurface ยึดรูป tileset ทั้งแผ่นไว้ -> ผูกกับ entry ของรูป ไม่ให้รูปถูกไล่ออก (เลิกนับ byte) ทั้งที่ table ยังอยู่
+        # ถ้ารูปไม่ได้อยู่ใน cache (เช่นถูกไล่ออกทันทีเพราะใหญ่เกินงบ) table ต้องนับ byte ของรูปเอง
+        if sheet_key in self._surfaces:
+            self._surfaces.put(key, table, 0, parent=sheet_key)
+        else:
+            self._surfaces.put(key, table, surface_bytes(sheet))
+        return table
+
+    # ------------------------------------------------------------------
+    # Texture atlas (เฟรมแอนิเมชันของ player / enemy)
+    # ------------------------------------------------------------------
+    def get_atlas(self, atlas_id: str) -> TextureAtlas | None:
+        return self._surfaces.get(("atlas", atlas_id))
+
+    def has_atlas(self, atlas_id: str) -> bool:
+        """มี atlas นี้ใน cache หรือยัง (ไม่นับเป็น hit / miss และไม่ pin)"""
+        return ("atlas", atlas_id) in self._surfaces
+
+    def build_atlas(
+        self,
+        atlas_id: str,
+        animations: Dict[Any, List[pygame.Surface]],
+    ) -> TextureAtlas:
+        """
+        pack เฟรมทั้งหมดของ sprite หนึ่งตัวลง sheet ไม่กี่แผ่นแล้วเก็บไว้ตาม atlas_id
+        ผู้เรียกควรใช้ atlas.animations แทน list ของ Surface เดิม
+        """
+        atlas = self.get_atlas(atlas_id)
+        if atlas is None:
+            atlas = TextureAtlas.pack(animations)
+            self._surfaces.put(("atlas", atlas_id), atlas, atlas.byte_size)
+        return atlas
+
     # ------------------------------------------------------------------
     # Sounds
     # ------------------------------------------------------------------
@@ -135,8 +353,9 @@ class ResourceManager:
         relative_path เช่น "sfx/hit.wav" -> assets/sounds/sfx/hit.wav
         """
         key = relative_path
-        if key in self._sounds:
-            return self._sounds[key]
+        sound = self._sounds.get(key)
+        if sound is not None:
+            return sound
 
         # ตัด prefix assets/ ถ้ามี
         if relative_path.startswith("assets/"):
@@ -148,7 +367,7 @@ class ResourceManager:
 
         full_path = self._resolve("sounds", relative_path)
         sound = pygame.mixer.Sound(full_path)
-        self._sounds[key] = sound
+        self._sounds.put(key, sound, sound_bytes(sound))
         return sound
 
     # ------------------------------------------------------------------
@@ -160,8 +379,9 @@ class ResourceManager:
         relative_path = "fonts/myfont.ttf" -> assets/data/fonts/myfont.ttf
         """
         key = (relative_path, size)
-        if key in self._fonts:
-            return self._fonts[key]
+        font = self._fonts.get(key)
+        if font is not None:
+            return font
 
         if relative_path is None:
             font = pygame.font.Font(None, size)
@@ -174,5 +394,42 @@ class ResourceManager:
             full_path = self._resolve("data", path)
             font = pygame.font.Font(full_path, size)
 
-        self._fonts[key] = font
+        self._fonts.put(key, font, 0)
         return font
+
+    # ------------------------------------------------------------------
+    # Cache budget / pinning / stats
+    # ------------------------------------------------------------------
+    def pin_level(self, level_id: str | None) -> None:
+        """
+        pin ทุก resource ที่ถูกโหลด / ใช้ตั้งแต่นี้ไว้กับ level_id (ไม่ถูกไล่ออกจาก cache ระหว่างเล่นด่านนี้)
+        และปล่อย pin ของด่านก่อนหน้า -> ของที่ด่านใหม่ไม่ได้ใช้จะถูกไล่ออกได้เมื่อเกินงบ
+        """
+        for cache in (self._surfaces, self._sounds, self._fonts):
+            cache.set_pin_tag(level_id)
+
+    def release_image(self, relative_path: str, scale_override: float | None = None) -> None:
+        """เอารูป (และ tile table ที่หั่นจากรูปนี้) ออกจาก cache"""
+        scale = self.image_scale(relative_path, scale_override)
+        self._surfaces.discard(("image", relative_path, scale, None))
+        self._staged.pop((relative_path, scale, None), None)
+        for key in [k for k in self._surfaces if k[0] == "tiles" and k[1] == relative_path]:
+            self._surfaces.discard(key)
+
+    def release_atlas(self, atlas_id: str) -> None:
+        self._surfaces.discard(("atlas", atlas_id))
+
+    def has_sound(self, relative_path: str) -> bool:
+        return relative_path in self._sounds
+
+    def release_sound(self, relative_path: str) -> None:
+        self._sounds.discard(relative_path)
+
+    def cache_stats(self) -> Dict[str, CacheStats]:
+        """hit / miss / eviction และขนาดของแต่ละ cache (ไว้ดูใน debug overlay / log)"""
+        return {
+            "surfaces": self._surfaces.stats(),
+            "sounds": self._sounds.stats(),
+            "fonts": self._fonts.stats(),
+            "rotations": self.rotations.stats(),
+        }
@@ -0,0 +1,45 @@
+# core/rng.py
+"""
+ตัวสุ่มกลางของเกม: ทุก subsystem ขอ random.Random ของตัวเอง (stream) จาก seed หลักตัวเดียว
+
+    rng = RngService(seed=1234)
+    crit_roll = rng.stream("combat").random()
+
+- seed เดียวกัน -> ทุก stream ได้ลำดับเลขเหมือนเดิมทุกครั้ง (benchmark / replay / simulate.py ซ้ำได้)
+- stream แยกกัน: การสุ่มของ vfx ที่เพิ่ม / ลดไม่ไปเลื่อนลำดับของ combat หรือ spawn
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Dict
+
+
+class RngService:
+    def __init__(self, seed: int | None = None) -> None:
+        self.seed = 0
+        self._streams: Dict[str, random.Random] = {}
+        self.reseed(seed)
+
+    def reseed(self, seed: int | None = None) -> None:
+        """เริ่มทุก stream ใหม่จาก seed นี้ (None = สุ่ม seed ใหม่จาก OS)"""
+        self.seed = seed if seed is not None else random.SystemRandom().randrange(2**32)
+        self._streams.clear()
+
+    def stream(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            # seed แบบ str ถูก hash ด้วย sha512 -> ไม่ขึ้นกับ PYTHONHASHSEED
+            rng = random.Random(f"{self.seed}:{name}")
+            self._streams[name] = rng
+        return rng
+
+
+# ใช้เมื่อ object ไม่มี game.rng (เช่น stub ใน test / benchmark)
+_FALLBACK = random.Random()
+
+
+def game_stream(game, name: str) -> random.Random:
+    """game.rng.stream(name) ถ้ามี ไม่งั้นคืนตัวสุ่มทั่วไป"""
+    rng = getattr(game, "rng", None)
+    return rng.stream(name) if rng is not None else _FALLBACK
@@ -0,0 +1,69 @@
+# core/rotation_cache.py
+"""
+เฟรมที่หมุนแล้ว ใช้ร่วมกันทุก node (ResourceManager.rotations)
+
+    angle = RotationCache.bucket(raw_angle, 45.0)                    # ปัดมุมเป็นช่อง (0 <= angle < 360)
+    frames = resources.rotations.frames("arrow", raw_frames, angle)  # list ของเฟรม 0..n-1 ที่หมุนแล้ว
+
+- รูปแต่ละเฟรมเก็บ key = (sprite_id, frame_index, angle_bucket) หมุนครั้งเดียว จนกว่าจะถูกไล่ออกตามงบ
+- งบเป็น byte แบบ LRU (กันกรณี projectile_scale ใหญ่ รูปมีขอบโปร่งเยอะ หมุนครบ 72 ช่องแล้วกิน memory มาก)
+- source() เก็บเฟรมต้นฉบับ (ยังไม่หมุน) ของ sprite_id ไว้ด้วย ไม่ต้องไล่หาไฟล์ใหม่ทุกครั้งที่ยิง
+- warm() หมุนทุกช่องมุมของ step ล่วงหน้า (PreloadScene)
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List
+
+import pygame
+
+from .lru_cache import CacheStats, LRUCache
+
+
+class RotationCache:
+    def __init__(self, budget_bytes: int | None = None) -> None:
+        self._sources: Dict[str, List[pygame.Surface]] = {}
+        self._rotated: LRUCache[pygame.Surface] = LRUCache(budget_bytes)
+
+    @staticmethod
+    def bucket(angle: float, step: float) -> float:
+        """ปัดมุม (องศา) เป็นช่องละ step แล้วให้อยู่ในช่วง [0, 360)"""
+        return float(round(angle / step) * step % 360.0)
+
+    def source(self, sprite_id: str, load: Callable[[], List[pygame.Surface]]) -> List[pygame.Surface]:
+        """เฟรมต้นฉบับของ sprite_id (โหลดด้วย load ครั้งแรกครั้งเดียว)"""
+        frames = self._sources.get(sprite_id)
+        if frames is None:
+            frames = load()
+            self._sources[sprite_id] = frames
+        return frames
+
+    def frames(self, sprite_id: str, raw_frames: List[pygame.Surface], angle: float) -> List[pygame.Surface]:
+        """raw_frames ทุกเฟรมหมุนไปทาง angle (องศาตามแกนจอ = degrees(atan2(dy, dx)) ที่ปัดด้วย bucket แล้ว)"""
+        return [self._rotate(sprite_id, i, surf, angle) for i, surf in enumerate(raw_frames)]
+
+    def _rotate(self, sprite_id: str, index: int, surf: pygame.Surface, angle: float) -> pygame.Surface:
+        key = (sprite_id, index, angle)
+        rotated = self._rotated.get(key)
+        if rotated is None:
+            rotated = pygame.transform.rotate(surf, -angle)
+            self._rotated.put(key, rotated, rotated.get_width() * rotated.get_height() * rotated.get_bytesize())
+        return rotated
+
+    def warm(self, sprite_id: str, raw_frames: List[pygame.Surface], step: float) -> int:
+        """หมุนทุกช่องมุม (0, step, 2*step, ...) ล่วงหน้า คืนจำนวนช่องมุม"""
+        count = int(round(360.0 / step))
+        for i in range(count):
+            self.frames(sprite_id, raw_frames, self.bucket(i * step, step))
+        return count
+
+    def clear(self) -> None:
+        self._sources.clear()
+        self._rotated.clear()
+
+    def stats(self) -> CacheStats:
+        return self._rotated.stats()
+
+    def __len__(self) -> int:
+        """จำนวนรูปที่หมุนเก็บไว้"""
+        return len(self._rotated)
@@ -56,10 +56,12 @@ class SceneManager:
 
     def update(self, dt: float) -> None:
         if self.current_scene:
-            self.current_scene.update(dt)
+            with self.game.profiler.scope("scene.update"):
+                self.current_scene.update(dt)
 
     def draw(self, surface) -> None:
         # วาดทุก scene ใน stack เผื่อ pause overlay ฯลฯ
-        for scene in self._stack:
-            scene.draw(surface)
+        with self.game.profiler.scope("scene.draw"):
+            for scene in self._stack:
+                scene.draw(surface)
 
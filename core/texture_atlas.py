@@ -0,0 +1,123 @@
+# core/texture_atlas.py
+from __future__ import annotations
+
+from typing import Dict, Hashable, List, Tuple
+
+import pygame
+
+# region ของเฟรมใน atlas: (index ของ sheet, rect ใน sheet)
+Region = Tuple[int, pygame.Rect]
+
+
+class TextureAtlas:
+    """
+    รวมเฟรมแอนิเมชันหลายร้อยเฟรมลง sheet ไม่กี่แผ่น
+
+    - regions    : anim_key -> list ของ (sheet_index, rect) ตามลำดับเฟรม
+    - animations : anim_key -> list ของ subsurface (ใช้แทน list[Surface] เดิมได้เลย)
+
+    subsurface ใช้ pixel ร่วมกับ sheet จึงไม่ต้องจอง buffer แยกทีละเฟรม
+    """
+
+    # ขนาด sheet สูงสุด (px) – เฟรมที่ใหญ่กว่านี้จะได้ sheet ของตัวเอง
+    MAX_SHEET_SIZE = 2048
+
+    def __init__(
+        self,
+        sheets: List[pygame.Surface],
+        regions: Dict[Hashable, List[Region]],
+    ) -> None:
+        self.sheets = sheets
+        self.regions = regions
+        self.animations: Dict[Hashable, List[pygame.Surface]] = {
+            key: [sheets[index].subsurface(rect) for index, rect in frames]
+            for key, frames in regions.items()
+        }
+
+    @property
+    def frame_count(self) -> int:
+        return sum(len(frames) for frames in self.regions.values())
+
+    @property
+    def byte_size(self) -> int:
+        """ขนาด pixel ของทุก sheet (byte)"""
+        return sum(s.get_width() * s.get_height() * s.get_bytesize() for s in self.sheets)
+
+    @classmethod
+    def pack(
+        cls,
+        animations: Dict[Hashable, List[pygame.Surface]],
+        max_sheet_size: int | None = None,
+    ) -> "TextureAtlas":
+        """
+        pack เฟรมทั้งหมดด้วย shelf packing (เรียงเฟรมจากสูงไปเตี้ย แล้ววางเป็นแถว)
+        เฟรมที่หน้าตาเดียวกัน (Surface ตัวเดียวกัน) จะใช้ region ร่วมกัน
+        """
+        limit = max_sheet_size or cls.MAX_SHEET_SIZE
+
+        # เฟรมไม่ซ้ำ (บางท่าใช้ Surface ตัวเดียวกันซ้ำหลายเฟรม)
+        unique: Dict[int, pygame.Surface] = {}
+        for frames in animations.values():
+            for surf in frames:
+                unique.setdefault(id(surf), surf)
+
+        order = sorted(unique, key=lambda k: (unique[k].get_height(), unique[k].get_width()), reverse=True)
+
+        # ---------- วางตำแหน่ง ----------
+        placements: Dict[int, Region] = {}
+        sheet_sizes: List[Tuple[int, int]] = []
+        # สถานะ shelf ของ sheet ปัจจุบัน
+        x = y = shelf_h = used_w = 0
+
+        def start_sheet() -> None:
+            nonlocal x, y, shelf_h, used_w
+            sheet_sizes.append((0, 0))
+            x = y = shelf_h = used_w = 0
+
+        start_sheet()
+        for key in order:
+            w, h = unique[key].get_size()
+
+            # เฟรมใหญ่เกิน sheet -> แยก sheet เฉพาะตัว
+            if w > limit or h > limit:
+                sheet_sizes.append((w, h))
+                placements[key] = (len(sheet_sizes) - 1, pygame.Rect(0, 0, w, h))
+                start_sheet()
+                continue
+
+            if x + w > limit:
+                # ขึ้น shelf ใหม่
+                y += shelf_h
+                x = shelf_h = 0
+            if y + h > limit:
+                start_sheet()
+
+            index = len(sheet_sizes) - 1
+            placements[key] = (index, pygame.Rect(x, y, w, h))
+            x += w
+            shelf_h = max(shelf_h, h)
+            used_w = max(used_w, x)
+            sheet_sizes[index] = (used_w, y + shelf_h)
+
+        # ---------- สร้าง sheet แล้ว copy pixel ----------
+        sheets = [pygame.Surface((max(w, 1), max(h, 1)), pygame.SRCALPHA) for w, h in sheet_sizes]
+        for key, (index, rect) in placements.items():
+            # blit ลง sheet ที่ยังโปร่งใสทั้งแผ่น = copy pixel ตรง ๆ
+            sheets[index].blit(unique[key], rect)
+
+        if pygame.display.get_surface() is not None:
+            sheets = [s.convert_alpha() for s in sheets]
+
+        # ตัด sheet ว่าง (เกิดจาก start_sheet หลังเฟรมใหญ่ตัวสุดท้าย) แล้ว remap index
+        used = sorted({index for index, _ in placements.values()})
+        remap = {old: new for new, old in enumerate(used)}
+        sheets = [sheets[i] for i in used]
+
+        regions: Dict[Hashable, List[Region]] = {
+            anim_key: [
+                (remap[placements[id(surf)][0]], placements[id(surf)][1])
+                for surf in frames
+            ]
+            for anim_key, frames in animations.items()
+        }
+        return cls(sheets, regions)
@@ -48,21 +48,14 @@ class BornEffectNode(AnimatedNode):
 
     def _load_frames(self) -> list[pygame.Surface]:
         frames: list[pygame.Surface] = []
-        index = 1
         rm = self.game.resources
 
-        while True:
-            rel_path = f"effects/{self.effect_id}_{index:02d}.png"
-            try:
-                surf = rm.load_image(rel_path)
-            except Exception:
-                break
-
+        # effects/<effect_id>_01.png, _02.png, ...
+        for rel_path in rm.frame_sequence(f"effects/{self.effect_id}"):
+            surf = rm.load_image(rel_path)
             if self._extra_scale != 1.0:
                 surf = rm._scale_surface(surf, self._extra_scale)
-
             frames.append(surf)
-            index += 1
 
         return frames
 
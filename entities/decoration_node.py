@@ -16,6 +16,12 @@ class DecorationNode(NodeBase):
     - ไม่เคลื่อนที่
     - ไม่ชนอะไร (ใช้แค่สำหรับวาด)
     """
+
+    # decor ชั้นกลาง (z = 0) วาดเรียงตาม y ร่วมกับตัวละคร
+    y_sort = True
+    # ไม่ขยับ -> ZOrderedGroup เก็บใน spatial index (ไม่ต้องไล่ทุกเฟรม)
+    static_render = True
+
     def __init__(
         self,
         rm: ResourceManager,
@@ -25,7 +31,8 @@ class DecorationNode(NodeBase):
         scale: float = 1.0,
         *groups,
     ) -> None:
-        super().__init__(*groups)
+        # ยังไม่ add เข้า group จนกว่าจะตั้ง rect เสร็จ (ZOrderedGroup index ตาม rect ตอน add)
+        super().__init__()
 
         # โหลดรูป
         self.image = rm.load_image(image_path)
@@ -40,6 +47,8 @@ class DecorationNode(NodeBase):
         # ตั้ง rect ตาม anchor
         self._set_rect_by_anchor(pos, anchor)
 
+        self.add(*groups)
+
     def _set_rect_by_anchor(self, pos: Tuple[int, int], anchor: AnchorType) -> None:
         self.rect = self.image.get_rect()
 
@@ -1,6 +1,7 @@
 # entities/enemy_node.py
 from __future__ import annotations
 
+
 import pygame
 import math
 
@@ -10,52 +11,22 @@ from .damage_number_node import DamageNumberNode
 from .hit_effect_node import HitEffectNode
 from combat.damage_system import Stats, DamagePacket, compute_damage, DamageResult
 from combat.status_effect_system import StatusEffectManager
+from combat.wall_collision import circle_segment_mtv
 from config.enemy_config import ENEMY_CONFIG
+from core.rng import game_stream
 
 
-# helper สำหรับการชน circle + segment
-def circle_segment_mtv(center: pygame.Vector2,
-                       radius: float,
-                       a: pygame.Vector2,
-                       b: pygame.Vector2) -> pygame.Vector2 | None:
-    """
-    หา minimal translation vector (MTV) ที่ต้องขยับวงกลม
-    ออกจาก segment a-b ถ้าไม่ชนให้คืน None
-    """
-    ab = b - a
-    ab_len_sq = ab.x * ab.x + ab.y * ab.y
-    if ab_len_sq == 0:
-        # segment เส้นสั้นมาก → ใช้จุด a แทน
-        to_center = center - a
-        dist_sq = to_center.length_squared()
-        if dist_sq >= radius * radius or dist_sq == 0:
-            return None
-        dist = math.sqrt(dist_sq)
-        overlap = radius - dist
-        return to_center.normalize() * overlap
-
-    # project center ลงเส้น a-b แล้ว clamp ให้อยู่ใน [0, 1]
-    t = (center - a).dot(ab) / ab_len_sq
-    if t < 0.0:
-        t = 0.0
-    elif t > 1.0:
-        t = 1.0
-    closest = a + ab * t
-
-    diff = center - closest
-    dist_sq = diff.length_squared()
-    if dist_sq >= radius * radius or dist_sq == 0:
-        return None
-
-    dist = math.sqrt(dist_sq)
-    overlap = radius - dist
-    normal = diff / dist
+class EnemyNode(AnimatedNode):
+    # ระยะห่างที่ต้องการจากเพื่อน (คูณกับ radius) ใช้ใน _separate
+    SEPARATION_RANGE = 2.2
 
-    return normal * overlap
+    # วาดเรียงตาม y ร่วมกับ actor อื่น (ZOrderedGroup)
+    y_sort = True
 
-class EnemyNode(AnimatedNode):
-    # cache animations ต่อ sprite_id เพื่อไม่ต้องโหลด/scale ซ้ำทุกตัว
-    _ANIMATION_CACHE: dict[str, dict[tuple[str, str], list[pygame.Surface]]] = {}
+    # ท่าที่โหลด (boss มี attack / charge เพิ่ม)
+    ANIMATION_STATES = ("idle", "walk", "hurt", "dead")
+    BOSS_STATES = ("attack", "charge")
+    DIRECTIONS = ("down", "left", "right", "up")
 
     def __init__(
         self,
@@ -99,13 +70,9 @@ class EnemyNode(AnimatedNode):
         # Target for attack (snapshot player position)
         self.attack_target_pos: pygame.Vector2 | None = None
 
-        # ---------- โหลด animations (ใช้ cache ถ้ามีแล้ว) ----------
-        cached = EnemyNode._ANIMATION_CACHE.get(self.sprite_id)
-        if cached is not None:
-            self.animations = cached
-        else:
-            self._load_animations()
-            EnemyNode._ANIMATION_CACHE[self.sprite_id] = self.animations
+        # ---------- โหลด animations (atlas ต่อ sprite_id แชร์ผ่าน ResourceManager) ----------
+        # ไม่เก็บ cache ของตัวเอง: ให้ atlas ที่ถูกไล่ออกจาก cache ของ ResourceManager คืน memory ได้จริง
+        self._load_animations()
 
         # เลือกเฟรมเริ่มต้น
         if ("idle", "down") in self.animations:
@@ -136,7 +103,7 @@ class EnemyNode(AnimatedNode):
         self.pos = pygame.math.Vector2(self.rect.center)
         self.radius: float = 40.0  # กำหนดขนาดรัศมี (อาจลองปรับ 10.0 - 20.0 ตามขนาดศัตรู)
 
-        # เส้น boundary สำหรับชน (รับค่าจาก GameScene)
+        # เส้น boundary สำหรับชน (fallback ถ้าไม่มี game.tilemap ให้ query)
         # list[tuple[pygame.Vector2, pygame.Vector2]]
         self.collision_segments: list[tuple[pygame.Vector2, pygame.Vector2]] = []
         # <--- สิ้นสุดส่วนที่เพิ่ม --->
@@ -205,49 +172,92 @@ class EnemyNode(AnimatedNode):
     # Animation loading
     # ============================================================
     def _load_animations(self) -> None:
+        self.animations = self.build_atlas(self.game.resources, self.enemy_id).animations
+
+    @staticmethod
+    def atlas_id(enemy_id: str) -> str:
+        """id ของ atlas ใน ResourceManager (ศัตรูที่ใช้ sprite_id + scale เดียวกันใช้ atlas ร่วมกัน)"""
+        cfg = ENEMY_CONFIG.get(enemy_id, {})
+        return f"enemy/{cfg.get('sprite_id', enemy_id)}@{cfg.get('scale', None)}"
+
+    @classmethod
+    def build_atlas(cls, resources, enemy_id: str):
+        """
+        โหลดทุกเฟรมของ enemy_id แล้ว pack เป็น texture atlas (แชร์ผ่าน ResourceManager)
+        ไม่ต้องสร้าง EnemyNode: ใช้ preload ได้ตรง ๆ
+        """
+        atlas_id = cls.atlas_id(enemy_id)
+        atlas = resources.get_atlas(atlas_id)
+        if atlas is not None:
+            return atlas
+
+        cfg = ENEMY_CONFIG.get(enemy_id)
+        if cfg is None:
+            raise ValueError(f"Unknown enemy_id: {enemy_id}")
+        sprite_id = cfg.get("sprite_id", enemy_id)
+        scale = cfg.get("scale", None)
+
         # ใช้โฟลเดอร์: enemy/<sprite_id>/<state>/<state>_<direction>_01.png
         # เช่น: enemy/goblin/idle/idle_down_01.png
-        states = ["idle", "walk", "hurt", "dead"]
-        if self.is_boss:
-            states.append("attack")
-            states.append("charge")
-            
-        directions = ["down", "left", "right", "up"]
+        states = list(cls.ANIMATION_STATES)
+        if cfg.get("type") == "boss":
+            states.extend(cls.BOSS_STATES)
 
+        animations: dict[tuple[str, str], list[pygame.Surface]] = {}
         for state in states:
-            for direction in directions:
-                frames = self._load_animation_sequence(state, direction)
+            for direction in cls.DIRECTIONS:
+                frames = cls._load_animation_sequence(resources, sprite_id, scale, state, direction)
                 if frames:
-                    self.animations[(state, direction)] = frames
-
-    def _load_animation_sequence(self, state: str, direction: str) -> list[pygame.Surface]:
-        frames: list[pygame.Surface] = []
-        index = 1
-
-        while True:
-            # assets/graphics/images/enemy/<sprite_id>/<state>/<state>_<direction>_01.png
-            rel_path = f"enemy/{self.sprite_id}/{state}/{state}_{direction}_{index:02d}.png"
-            
-            # Use resource manager to check/load
-            try:
-                surf = self.game.resources.load_image(rel_path, scale_override=self.custom_scale)
-                frames.append(surf)
-                index += 1
-            except Exception:
-                # If failed on the first frame (index=1), try loading without number suffix
-                # e.g. "charge_down.png" instead of "charge_down_01.png"
-                if index == 1:
-                     rel_path_no_num = f"enemy/{self.sprite_id}/{state}/{state}_{direction}.png"
-                     try:
-                         surf = self.game.resources.load_image(rel_path_no_num, scale_override=self.custom_scale)
-                         frames.append(surf)
-                     except Exception:
-                         pass # Really not found
-                
-                # Stop looking for sequence
-                break
+                    animations[(state, direction)] = frames
+        return resources.build_atlas(atlas_id, animations)
 
-        return frames
+    @classmethod
+    def image_requests(cls, resources, enemy_id: str) -> list[tuple[str, float | None]]:
+        """
+        (rel_path, scale_override) ของเฟรมที่ build_atlas จะโหลด (ว่าง = ไม่รู้จัก enemy_id)
+        ใช้ส่งให้ AssetLoader decode ล่วงหน้า
+        """
+        cfg = ENEMY_CONFIG.get(enemy_id)
+        if cfg is None:
+            return []
+        sprite_id = cfg.get("sprite_id", enemy_id)
+        scale = cfg.get("scale", None)
+
+        states = list(cls.ANIMATION_STATES)
+        if cfg.get("type") == "boss":
+            states.extend(cls.BOSS_STATES)
+
+        requests: list[tuple[str, float | None]] = []
+        for state in states:
+            for direction in cls.DIRECTIONS:
+                for rel_path in cls._frame_paths(resources, sprite_id, state, direction):
+                    requests.append((rel_path, scale))
+        return requests
+
+    @staticmethod
+    def _frame_paths(resources, sprite_id: str, state: str, direction: str) -> list[str]:
+        """path ของเฟรม <state>_<direction>_NN.png (ถ้าไม่มีเลขเฟรมเลย ใช้ <state>_<direction>.png ไฟล์เดียว)"""
+        # assets/graphics/images/enemy/<sprite_id>/<state>/<state>_<direction>_01.png
+        stem = f"enemy/{sprite_id}/{state}/{state}_{direction}"
+        paths = resources.frame_sequence(stem)
+        # e.g. "charge_down.png" instead of "charge_down_01.png"
+        if not paths and resources.image_exists(f"{stem}.png"):
+            paths.append(f"{stem}.png")
+        return paths
+
+    @classmethod
+    def _load_animation_sequence(
+        cls,
+        resources,
+        sprite_id: str,
+        scale: float | None,
+        state: str,
+        direction: str,
+    ) -> list[pygame.Surface]:
+        return [
+            resources.load_image(rel_path, scale_override=scale, cache=False)
+            for rel_path in cls._frame_paths(resources, sprite_id, state, direction)
+        ]
 
     # ============================================================
     # Movement / AI (Steering Behaviors)
@@ -275,7 +285,7 @@ class EnemyNode(AnimatedNode):
         """
         Steering force to avoid crowding neighbors
         """
-        desired_separation = self.radius * 2.2 # ระยะห่างที่ต้องการ (ใหญ่กว่าตัวนิดหน่อย)
+        desired_separation = self.radius * self.SEPARATION_RANGE # ระยะห่างที่ต้องการ (ใหญ่กว่าตัวนิดหน่อย)
         steer = pygame.Vector2(0, 0)
         count = 0
         
@@ -303,6 +313,21 @@ class EnemyNode(AnimatedNode):
                     
         return steer
 
+    def _get_separation_neighbors(self) -> list[EnemyNode]:
+        """
+        หาเพื่อนบ้านสำหรับ _separate
+        - ถ้า scene มี enemy_index (spatial grid) -> query เฉพาะรอบตัว
+        - ถ้าไม่มี -> fallback ไปใช้ศัตรูทั้งหมดแบบเดิม
+        """
+        index = getattr(self.game, "enemy_index", None)
+        if index is not None:
+            return index.query_radius(self.pos, self.radius * self.SEPARATION_RANGE)
+
+        enemies = getattr(self.game, "enemies", None)
+        if enemies is None:
+            return []
+        return enemies.sprites()
+
     # ============================================================
     # Movement / AI (Old Patrol)
     # ============================================================
@@ -440,9 +465,9 @@ class EnemyNode(AnimatedNode):
             if dist > 50: # Don't overlap perfectly
                  steer += self._seek(player.pos)
             
-            # Separate
-            if self.game and hasattr(self.game, "enemies"):
-                 steer += self._separate(self.game.enemies.sprites()) * 1.5
+            # Separate (ดูเฉพาะเพื่อนบ้านใกล้ ๆ จาก enemy_index)
+            if self.game:
+                 steer += self._separate(self._get_separation_neighbors()) * 1.5
             
             self.acceleration += steer
             
@@ -523,8 +548,8 @@ class EnemyNode(AnimatedNode):
             cooldown_ms=500
         )
             
-        import random
-        
+        rng = game_stream(self.game, "enemy_ai")
+
         # Num rocks
         num_rocks = 8
         
@@ -537,9 +562,9 @@ class EnemyNode(AnimatedNode):
         
         for _ in range(num_rocks):
             # Angular distribution
-            angle_rad = random.uniform(0, 2 * math.pi)
+            angle_rad = rng.uniform(0, 2 * math.pi)
             # Radial distribution (sqrt for uniform circle area)
-            r = radius * math.sqrt(random.random())
+            r = radius * math.sqrt(rng.random())
             
             # Isometric offset
             off_x = r * math.cos(angle_rad)
@@ -564,7 +589,7 @@ class EnemyNode(AnimatedNode):
             elif hasattr(self.game, "projectiles"): # Fallback
                 groups.append(self.game.projectiles)
             
-            ProjectileNode(
+            ProjectileNode.spawn(
                 self,           # owner
                 start_pos,      # pos
                 direction,      # direction
@@ -589,6 +614,22 @@ class EnemyNode(AnimatedNode):
     # ============================================================
     # Draw Override (Telegraphing) - Called manually by GameScene
     # ============================================================
+    def extra_bounds(self) -> pygame.Rect | None:
+        """
+        rect (world) ของ telegraph ที่ draw_extra จะวาด (None = ไม่มีอะไรให้วาด)
+        ใช้ตอน cull: ศัตรูอยู่นอกจอแต่วง telegraph อาจอยู่ในจอ
+        """
+        if not self.attack_target_pos:
+            return None
+        if self.interrupt_display_timer <= 0 and self.state != "charge":
+            return None
+        radius = self.attack_config.get("damage_radius", 80)
+        width = int(radius * 2 + 4)
+        height = int(radius * 2 * 0.42 + 4)
+        rect = pygame.Rect(0, 0, width, height)
+        rect.center = (int(self.attack_target_pos.x), int(self.attack_target_pos.y))
+        return rect
+
     def draw_extra(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
         if self.interrupt_display_timer > 0 and self.attack_target_pos:
             radius = self.attack_config.get("damage_radius", 80)
@@ -746,6 +787,16 @@ class EnemyNode(AnimatedNode):
         """ ให้ GameScene ส่งเส้น boundary จาก TileMap มาให้ """
         self.collision_segments = segments
 
+    def _segments_near(self, center: pygame.Vector2) -> list[tuple[pygame.Vector2, pygame.Vector2]]:
+        """
+        เลือก segment ที่อยู่ใกล้ center (broad-phase จาก TileMap.segments_near)
+        ถ้าไม่มี tilemap ให้ใช้ collision_segments ทั้งหมดแบบเดิม
+        """
+        tilemap = getattr(self.game, "tilemap", None)
+        if tilemap is not None:
+            return tilemap.segments_near(center, self.radius)
+        return self.collision_segments
+
     def _move_and_collide_circle(self, dt: float) -> None:
         """
         เคลื่อนที่และจัดการชนกำแพง/ขอบเขตด้วยวิธี Circle vs Segment
@@ -753,12 +804,20 @@ class EnemyNode(AnimatedNode):
         # คำนวณตำแหน่งใหม่แบบไม่ชนก่อน
         new_pos = self.pos + self.velocity * dt
 
+        # ถ้า scene มี batch resolver (numpy) -> ขยับก่อน แล้วให้ scene แก้ชนทีเดียวทั้งฝูง
+        resolver = getattr(self.game, "wall_resolver", None)
+        if resolver is not None:
+            self.pos = new_pos
+            self.rect.center = (round(self.pos.x), round(self.pos.y))
+            resolver.defer(self)
+            return
+
         # ลูปชนซ้ำ 4 ครั้ง (เผื่อหลุดกำแพง)
         for _ in range(4):
             moved = False
             
-            # ลูปเช็คชนกับ segment ทั้งหมด
-            for a, b in self.collision_segments:
+            # ลูปเช็คชนกับ segment ที่อยู่ใกล้ตำแหน่งปัจจุบัน
+            for a, b in self._segments_near(new_pos):
                 # คำนวณ MTV (Minimal Translation Vector)
                 mtv = circle_segment_mtv(new_pos, self.radius, a, b)
                 
@@ -781,7 +840,7 @@ class EnemyNode(AnimatedNode):
     def take_hit(self, attacker_stats: Stats, damage_packet: DamagePacket) -> DamageResult:
         if self.is_dead:
             # ตายแล้วโดนซ้ำ ไม่ต้องเปลี่ยน state เพิ่ม
-            return compute_damage(attacker_stats, self.stats, damage_packet)
+            return compute_damage(attacker_stats, self.stats, damage_packet, rng=game_stream(self.game, "combat").random)
 
         # 🔊 เล่นเสียงโดนตี (ถ้ามีไฟล์)
         if self.sfx_hit is not None:
@@ -818,7 +877,7 @@ class EnemyNode(AnimatedNode):
             # effectively cancelling the skill logic. This is intended for now.
 
         # compute_damage จะไปหัก HP ใน self.stats ให้เอง
-        result = compute_damage(attacker_stats, self.stats, damage_packet)
+        result = compute_damage(attacker_stats, self.stats, damage_packet, rng=game_stream(self.game, "combat").random)
 
         if result.killed:
             self.is_dead = True
@@ -1,6 +1,6 @@
 import pygame
-import random
 from .animated_node import AnimatedNode
+from core.rng import game_stream
 
 class HitEffectNode(AnimatedNode):
     """
@@ -28,7 +28,7 @@ class HitEffectNode(AnimatedNode):
             
             # สุ่มหมุนเพื่อความไม่ซ้ำซาก (หมุนทั้งชุดด้วยมุมเดียวกัน)
             if rotation:
-                angle = random.randint(0, 360)
+                angle = game_stream(game, "vfx").randint(0, 360)
                 self.frames = [pygame.transform.rotate(f, angle) for f in self.frames]
                 
         except Exception:
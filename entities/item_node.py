@@ -28,6 +28,9 @@ class ItemNode(AnimatedNode):
         shield    -> items/shield_01.png,   shield_02.png,   ...
     """
 
+    # วาดเรียงตาม y ร่วมกับ actor อื่น (ZOrderedGroup)
+    y_sort = True
+
     def __init__(
         self,
         game,
@@ -83,13 +86,18 @@ class ItemNode(AnimatedNode):
             items/<base_key>_02.png
             ...
         """
+        return self.animation_base_key(self.item, self.item_id)
+
+    @staticmethod
+    def animation_base_key(item: ItemBase, item_id: str) -> str:
+        """ดู _get_animation_base_key (แยกเป็น static ให้ manifest ของด่านเรียกได้โดยไม่ต้องสร้าง node)"""
         # 1) animation_key (ถ้ามีใน ItemBase)
-        base_key = getattr(self.item, "animation_key", None)
+        base_key = getattr(item, "animation_key", None)
         if base_key:
             return base_key
 
         # 2) จาก icon_key
-        icon_key = getattr(self.item, "icon_key", "") or ""
+        icon_key = getattr(item, "icon_key", "") or ""
         if icon_key:
             filename = os.path.basename(icon_key)        # "bow_power_01.png"
             name_no_ext, _ = os.path.splitext(filename)  # "bow_power_01"
@@ -102,30 +110,37 @@ class ItemNode(AnimatedNode):
                 return name_no_ext
 
         # 3) fallback: ใช้ item_id
-        return self.item_id
+        return item_id
+
+    @classmethod
+    def image_requests(cls, resources, item_id: str) -> list[tuple[str, float | None]]:
+        """
+        (rel_path, scale_override) ของรูปที่ไอเท็มนี้ใช้:
+        เฟรมบนพื้น (หรือ icon ถ้าไม่มีเฟรม) + ui_icon ที่ HUD / inventory โหลดด้วยขนาดไฟล์จริง
+        """
+        item = ITEM_DB.try_get(item_id)
+        if item is None:
+            return []
+
+        base_key = cls.animation_base_key(item, item_id)
+        requests: list[tuple[str, float | None]] = [
+            (rel_path, None) for rel_path in resources.frame_sequence(f"items/{base_key}")
+        ]
+
+        if not requests and item.icon_key:
+            requests.append((item.icon_key, None))
+        if item.ui_icon_key:
+            requests.append((item.ui_icon_key, 1.0))
+        return requests
 
 
     # ------------------------------------------------------------------
     # โหลดเฟรมตามแพทเทิร์น items/<base_key>_NN.png
     # ------------------------------------------------------------------
     def _load_animation_frames(self) -> List[pygame.Surface]:
-        frames: List[pygame.Surface] = []
         resources = self.game.resources
-
         base_key = self._get_animation_base_key()
-        index = 1
-
-        while True:
-            rel_path = f"items/{base_key}_{index:02d}.png"
-            try:
-                surf = resources.load_image(rel_path)
-            except Exception:
-                break
-            else:
-                frames.append(surf)
-                index += 1
-
-        return frames
+        return [resources.load_image(rel_path) for rel_path in resources.frame_sequence(f"items/{base_key}")]
 
     # ------------------------------------------------------------------
     # fallback: ใช้ icon_key หรือ placeholder 1 รูป
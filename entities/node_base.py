@@ -7,14 +7,35 @@ class NodeBase(pygame.sprite.Sprite):
     base class ของทุก entity ในเกม
     - มี image + rect พื้นฐาน
     - รองรับการอัปเดตด้วย dt
+    - มี z (ลำดับการวาด) ที่แจ้ง group แบบ ZOrderedGroup ให้ย้าย bucket เมื่อเปลี่ยนค่า
     """
 
+    # ค่า default ระดับคลาส (ใช้ได้ตั้งแต่ก่อน __init__ เพราะ Sprite.__init__ จะ add เข้า group ทันที)
+    _z = 0
+    # True = y-sort ร่วมกับ actor อื่นในชั้น z = 0 (player / enemy / item / decor กลางฉาก)
+    y_sort = False
+
     def __init__(self, *groups) -> None:
         super().__init__(*groups)
         self.image = pygame.Surface((32, 32), pygame.SRCALPHA)
         self.image.fill((255, 0, 255))  # debug magenta
         self.rect = self.image.get_rect()
 
+    @property
+    def z(self) -> int:
+        return self._z
+
+    @z.setter
+    def z(self, value: int) -> None:
+        old = self._z
+        if value == old:
+            return
+        self._z = value
+        for group in self.groups():
+            change_z = getattr(group, "change_z", None)
+            if change_z is not None:
+                change_z(self, old, value)
+
     def update(self, dt: float) -> None:
         """override ใน subclass ตามต้องการ"""
         pass
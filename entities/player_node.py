@@ -10,8 +10,10 @@ from core.buff_manager import BuffManager
 from .animated_node import AnimatedNode
 from combat.damage_system import Stats, DamagePacket, DamageResult, compute_damage
 from combat.status_effect_system import StatusEffectManager
+from combat.wall_collision import circle_segment_mtv
 from config.settings import PLAYER_SPEED
 from config.player_config import PLAYER_CONFIG
+from core.rng import game_stream
 from .damage_number_node import DamageNumberNode
 from .projectile_node import ProjectileNode
 from entities.slash_effect_node import SlashEffectNode
@@ -79,49 +81,13 @@ except ImportError:
     Inventory = None
     Equipment = None
 
-# helper สำหรับการชน circle + segment
-def circle_segment_mtv(center: pygame.Vector2,
-                       radius: float,
-                       a: pygame.Vector2,
-                       b: pygame.Vector2) -> pygame.Vector2 | None:
-    """
-    หา minimal translation vector (MTV) ที่ต้องขยับวงกลม
-    ออกจาก segment a-b ถ้าไม่ชนให้คืน None
-    """
-    ab = b - a
-    ab_len_sq = ab.x * ab.x + ab.y * ab.y
-    if ab_len_sq == 0:
-        # segment เส้นสั้นมาก → ใช้จุด a แทน
-        to_center = center - a
-        dist_sq = to_center.length_squared()
-        if dist_sq >= radius * radius or dist_sq == 0:
-            return None
-        dist = math.sqrt(dist_sq)
-        overlap = radius - dist
-        return to_center.normalize() * overlap
-
-    # project center ลงเส้น a-b แล้ว clamp ให้อยู่ใน [0, 1]
-    t = (center - a).dot(ab) / ab_len_sq
-    if t < 0.0:
-        t = 0.0
-    elif t > 1.0:
-        t = 1.0
-    closest = a + ab * t
-
-    diff = center - closest
-    dist_sq = diff.length_squared()
-    if dist_sq >= radius * radius or dist_sq == 0:
-        return None
-
-    dist = math.sqrt(dist_sq)
-    overlap = radius - dist
-    normal = diff / dist
-
-    return normal * overlap
 
 
 
 class PlayerNode(AnimatedNode):
+    # วาดเรียงตาม y ร่วมกับ actor อื่น (ZOrderedGroup)
+    y_sort = True
+
     def __init__(
         self,
         game,
@@ -144,6 +110,8 @@ class PlayerNode(AnimatedNode):
         self.config_data = p_cfg  # Store for later
         self.speed = p_cfg.get("speed", 220)
         self.scale = p_cfg.get("scale", 1.0)
+        # scale รวมของเฟรมแอนิเมชัน (sprite_scale x scale ของ player_type) ย่อครั้งเดียวตอนโหลด
+        self.frame_scale = self.game.resources.sprite_scale * self.scale
         
         # ---------- SFX (ใช้ ResourceManager โหลดเสียง) ----------
         self.sfx_slash = self.game.resources.load_sound("sfx/slash.wav")
@@ -211,17 +179,26 @@ class PlayerNode(AnimatedNode):
         self.velocity = pygame.Vector2(0, 0)
         self.facing = pygame.Vector2(0, 1)
 
-        # โหลดเฟรมทั้งหมดตามโครงสร้าง:
-        # assets/graphics/images/player/{state}/{state}_{direction}_01.png
-        self._load_animations()
-
-        # โหลดเฟรมท่ายิงธนู (attack_arrow_*)
         self.bow_attack_animations: dict[str, list[pygame.Surface]] = {}
-        self._load_bow_attack_animations()
-
-        # โหลดเฟรมท่าเวทย์ไฟ (attack_fire_*)
         self.fire_attack_animations: dict[str, list[pygame.Surface]] = {}
-        self._load_fire_attack_animations()
+
+        # เฟรมทั้งหมดของ player_type นี้ถูก pack เป็น texture atlas ใน ResourceManager
+        # (สร้างครั้งแรกครั้งเดียว ครั้งถัดไปใช้ atlas เดิมโดยไม่ต้องโหลดไฟล์ซ้ำ)
+        atlas_id = f"player/{self.player_type}@{self.frame_scale:g}"
+        atlas = self.game.resources.get_atlas(atlas_id)
+        if atlas is None:
+            # โหลดเฟรมทั้งหมดตามโครงสร้าง:
+            # assets/graphics/images/player/{state}/{state}_{direction}_01.png
+            self._load_animations()
+
+            # โหลดเฟรมท่ายิงธนู (attack_arrow_*)
+            self._load_bow_attack_animations()
+
+            # โหลดเฟรมท่าเวทย์ไฟ (attack_fire_*)
+            self._load_fire_attack_animations()
+
+            atlas = self.game.resources.build_atlas(atlas_id, self._atlas_source())
+        self._use_atlas(atlas)
 
         # เลือกเฟรมเริ่มต้น
         if ("idle", "down") in self.animations:
@@ -385,22 +362,40 @@ class PlayerNode(AnimatedNode):
 
 
     def _load_animation_sequence(self, state: str, direction: str) -> list[pygame.Surface]:
-        frames: list[pygame.Surface] = []
-        index = 1
-        while True:
-            rel_path = f"player/{self.player_type}/{state}/{state}_{direction}_{index:02d}.png"
-            try:
-                surf = self.game.resources.load_image(rel_path)
-                if self.scale != 1.0:
-                    w = int(surf.get_width() * self.scale)
-                    h = int(surf.get_height() * self.scale)
-                    surf = pygame.transform.scale(surf, (w, h))
-            except Exception:
-                break
-            frames.append(surf)
-            index += 1
-        return frames
+        return self._load_frame_sequence(f"player/{self.player_type}/{state}/{state}_{direction}")
+
+    def _load_frame_sequence(self, stem: str) -> list[pygame.Surface]:
+        """โหลด <stem>_01.png, _02.png, ... เท่าที่มีไฟล์ (ไม่เก็บใน cache เพราะจะถูก pack ลง atlas)"""
+        resources = self.game.resources
+        return [
+            resources.load_image(rel_path, scale_override=self.frame_scale, cache=False)
+            for rel_path in resources.frame_sequence(stem)
+        ]
     
+    def _atlas_source(self) -> dict[tuple, list[pygame.Surface]]:
+        """รวมแอนิเมชันทุกชุดเป็น dict เดียว (key ขึ้นต้นด้วยชื่อชุด) สำหรับ pack atlas"""
+        source: dict[tuple, list[pygame.Surface]] = {}
+        for (state, direction), frames in self.animations.items():
+            source[("base", state, direction)] = frames
+        for direction, frames in self.bow_attack_animations.items():
+            source[("bow", direction)] = frames
+        for direction, frames in self.fire_attack_animations.items():
+            source[("fire", direction)] = frames
+        return source
+
+    def _use_atlas(self, atlas) -> None:
+        """แยก atlas.animations กลับเป็น animations / bow / fire (เฟรมเป็น region ใน atlas)"""
+        self.animations = {}
+        self.bow_attack_animations = {}
+        self.fire_attack_animations = {}
+        for key, frames in atlas.animations.items():
+            if key[0] == "base":
+                self.animations[(key[1], key[2])] = frames
+            elif key[0] == "bow":
+                self.bow_attack_animations[key[1]] = frames
+            elif key[0] == "fire":
+                self.fire_attack_animations[key[1]] = frames
+
     # โหลดแฟรมท่ายิงธนู
     def _load_bow_attack_animations(self) -> None:
         """
@@ -413,20 +408,7 @@ class PlayerNode(AnimatedNode):
         ]
 
         for direction in directions:
-            frames: list[pygame.Surface] = []
-            index = 1
-            while True:
-                rel_path = f"player/{self.player_type}/attack/attack_arrow_{direction}_{index:02d}.png"
-                try:
-                    surf = self.game.resources.load_image(rel_path)
-                    if self.scale != 1.0:
-                        w = int(surf.get_width() * self.scale)
-                        h = int(surf.get_height() * self.scale)
-                        surf = pygame.transform.scale(surf, (w, h))
-                except Exception:
-                    break
-                frames.append(surf)
-                index += 1
+            frames = self._load_frame_sequence(f"player/{self.player_type}/attack/attack_arrow_{direction}")
 
             if frames:
                 self.bow_attack_animations[direction] = frames
@@ -449,20 +431,7 @@ class PlayerNode(AnimatedNode):
         ]
 
         for direction in directions:
-            frames: list[pygame.Surface] = []
-            index = 1
-            while True:
-                rel_path = f"player/{self.player_type}/attack/attack_fire_{direction}_{index:02d}.png"
-                try:
-                    surf = self.game.resources.load_image(rel_path)
-                    if self.scale != 1.0:
-                        w = int(surf.get_width() * self.scale)
-                        h = int(surf.get_height() * self.scale)
-                        surf = pygame.transform.scale(surf, (w, h))
-                except Exception:
-                    break
-                frames.append(surf)
-                index += 1
+            frames = self._load_frame_sequence(f"player/{self.player_type}/attack/attack_fire_{direction}")
 
             if frames:
                 self.fire_attack_animations[direction] = frames
@@ -822,17 +791,22 @@ class PlayerNode(AnimatedNode):
     # Input / movement / animation
     # ============================================================
     def _handle_input(self, dt: float) -> None:
-        keys = pygame.key.get_pressed()
-        move = pygame.Vector2(0, 0)
-
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
-            move.y -= 1
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            move.y += 1
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            move.x -= 1
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            move.x += 1
+        controller = getattr(self.game, "player_controller", None)
+        if controller is not None:
+            # input จากสคริปต์ / สุ่ม (โหมด headless)
+            move = pygame.Vector2(controller.move)
+        else:
+            keys = pygame.key.get_pressed()
+            move = pygame.Vector2(0, 0)
+
+            if keys[pygame.K_w] or keys[pygame.K_UP]:
+                move.y -= 1
+            if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+                move.y += 1
+            if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+                move.x -= 1
+            if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+                move.x += 1
 
         if move.length_squared() > 0:
             move = move.normalize()
@@ -897,10 +871,14 @@ class PlayerNode(AnimatedNode):
         new_pos = pygame.Vector2(desired)
         r = self.radius
 
+        # broad-phase: ถ้ามี tilemap ให้ดึงเฉพาะ segment ใกล้ตัวจาก spatial index
+        tilemap = getattr(self.game, "tilemap", None)
+
         # loop 2–3 รอบเผื่อชนหลายเส้นซ้อนกัน
         for _ in range(3):
             moved = False
-            for a, b in segments:
+            nearby = tilemap.segments_near(new_pos, r) if tilemap is not None else segments
+            for a, b in nearby:
                 # broad-phase: AABB รอบ segment เพื่อลดจำนวนที่ต้องเช็คจริง
                 min_x = min(a.x, b.x) - r
                 max_x = max(a.x, b.x) + r
@@ -1351,8 +1329,9 @@ class PlayerNode(AnimatedNode):
         base_damage = 40 + getattr(self.stats, "magic", 0) * 12
         packet = DamagePacket(base=float(base_damage), damage_type="magic", scaling_attack=0.0)
 
+        vfx_rng = game_stream(self.game, "vfx")
         for e in targets:
-            LightningEffectNode(self.rect.center, e.rect.center, self.game.all_sprites)
+            LightningEffectNode(self.rect.center, e.rect.center, self.game.all_sprites, seed=vfx_rng.randrange(10_000_000))
             e.take_hit(self.stats, packet)
 
             # stun สั้น ๆ (Enemy มี hurt_timer อยู่แล้ว)
@@ -1391,8 +1370,11 @@ class PlayerNode(AnimatedNode):
         base_damage = 40 + getattr(self.stats, "magic", 0) * 12
         packet = DamagePacket(base=float(base_damage), damage_type="magic", scaling_attack=0.0)
 
+        vfx_rng = game_stream(self.game, "vfx")
         for e in targets:
-            LightningEffectNode(self.rect.center, e.rect.center, self.game.all_sprites, theme="plasma")
+            LightningEffectNode(
+                self.rect.center, e.rect.center, self.game.all_sprites, theme="plasma", seed=vfx_rng.randrange(10_000_000)
+            )
             e.take_hit(self.stats, packet)
 
             if hasattr(e, "hurt_timer"):
@@ -1476,7 +1458,7 @@ class PlayerNode(AnimatedNode):
         )
 
         for (d, spd) in projectiles_data:
-            ProjectileNode(
+            ProjectileNode.spawn(
                 self,
                 self.rect.center,
                 d,
@@ -1549,7 +1531,7 @@ class PlayerNode(AnimatedNode):
             angles = [0, -15, 15]
             for angle in angles:
                 rotated_dir = direction.rotate(angle)
-                ProjectileNode(
+                ProjectileNode.spawn(
                     self,
                     spawn_pos, # Use adjusted position
                     rotated_dir,
@@ -1565,7 +1547,7 @@ class PlayerNode(AnimatedNode):
                 )
         else:
             # ยิงปกติ 1 ดอก
-            ProjectileNode(
+            ProjectileNode.spawn(
                 self,
                 spawn_pos, # Use adjusted position
                 direction,
@@ -1639,7 +1621,7 @@ class PlayerNode(AnimatedNode):
 
         # คำนวณดาเมจ
         hp_before = float(self.stats.hp)
-        result = compute_damage(attacker_stats, self.stats, damage_packet)
+        result = compute_damage(attacker_stats, self.stats, damage_packet, rng=game_stream(self.game, "combat").random)
 
         # ถ้า compute_damage ไม่ได้หัก HP ให้หักเอง (กันกรณีระบบดาเมจเป็น pure function)
         if abs(float(self.stats.hp) - hp_before) < 1e-6:
@@ -10,6 +10,9 @@ import pygame
 
 from .animated_node import AnimatedNode
 from combat.damage_system import DamagePacket
+from core.node_pool import PooledNode, game_pool
+from core.rng import game_stream
+from core.rotation_cache import RotationCache
 
 __all__ = ["ProjectileNode"]
 
@@ -18,21 +21,112 @@ __all__ = ["ProjectileNode"]
 # Comet Trail (Arrow Path VFX)
 # ============================================================
 
+_BLANK: pygame.Surface | None = None
+
+
+def _blank_image() -> pygame.Surface:
+    """รูปว่าง 1x1 ใช้ร่วมกันตอน trail ยังไม่มีจุดพอวาด (ไม่ต้องสร้าง Surface ใหม่ทุกครั้งที่ reset)"""
+    global _BLANK
+    if _BLANK is None:
+        _BLANK = pygame.Surface((1, 1), pygame.SRCALPHA)
+    return _BLANK
+
+
+def _no_target() -> None:
+    """ใช้แทน weakref ของ trail ที่กลับเข้า pool แล้ว"""
+    return None
+
+
+def _target_of(trail) -> pygame.sprite.Sprite | None:
+    """projectile ที่ trail ผูกอยู่ (None ถ้าหายไป หรือถูก pool เอาไป reset เป็นลูกใหม่แล้ว)"""
+    t = trail._target_ref()
+    if t is None or getattr(t, "_generation", 0) != trail._target_gen:
+        return None
+    return t
+
+
 @dataclass
 class _TrailPoint:
     pos: pygame.Vector2
     age: float
 
 
-class ArrowCometTrailNode(pygame.sprite.Sprite):
+# หัวแปรง (dab) ของ comet trail ต่อชุดสี / ความหนา: วงกลมซ้อนกัน glow -> main -> core
+_DABS: dict[tuple, pygame.Surface] = {}
+
+
+def _trail_dab(
+    main_rgb: tuple[int, int, int],
+    core_rgb: tuple[int, int, int],
+    alpha_main: int,
+    alpha_core: int,
+    thickness: int,
+    core_thickness: int,
+    glow_passes: int,
+) -> pygame.Surface:
+    """รูปหน้าตัดของริบบอน (วาดครั้งเดียวต่อธีม ใช้ร่วมกันทุก trail)"""
+    key = (main_rgb, core_rgb, alpha_main, alpha_core, thickness, core_thickness, glow_passes)
+    dab = _DABS.get(key)
+    if dab is not None:
+        return dab
+
+    # (เส้นผ่านศูนย์กลาง, rgb, alpha) จากวงนอกสุดเข้าหาตรงกลาง (วงในทับวงนอก)
+    rings = [
+        (thickness * (1.9 + g * 0.7), main_rgb, int(alpha_main * (0.20 / (g + 1))))
+        for g in reversed(range(glow_passes))
+    ]
+    rings.append((thickness, main_rgb, alpha_main))
+    rings.append((core_thickness, core_rgb, alpha_core))
+
+    size = int(math.ceil(max(d for d, _, _ in rings))) + 2
+    dab = pygame.Surface((size, size), pygame.SRCALPHA)
+    c = size / 2.0
+    for diameter, rgb, a in rings:
+        if a > 0:
+            pygame.draw.circle(dab, (*rgb, max(0, min(255, a))), (c, c), max(0.5, diameter / 2.0))
+    _DABS[key] = dab
+    return dab
+
+
+# แผ่นคูณ alpha (255, 255, 255, keep) ต่อค่า keep ใช้ blit แบบ BLEND_RGBA_MULT
+# (blit มี path SIMD เร็วกว่า Surface.fill(..., special_flags=BLEND_RGBA_MULT) หลายสิบเท่า)
+_FADE_MASKS: dict[int, pygame.Surface] = {}
+
+
+def _fade_mask(keep: int, w: int, h: int) -> pygame.Surface:
+    mask = _FADE_MASKS.get(keep)
+    if mask is None or mask.get_width() < w or mask.get_height() < h:
+        if mask is not None:
+            w, h = max(w, mask.get_width()), max(h, mask.get_height())
+        mask = pygame.Surface((w, h), pygame.SRCALPHA)
+        mask.fill((255, 255, 255, keep))
+        _FADE_MASKS[keep] = mask
+    return mask
+
+
+class ArrowCometTrailNode(PooledNode, pygame.sprite.Sprite):
     """หางดาวหาง (comet ribbon) สำหรับลูกธนู (ไม่มีจุดสปาร์ค)
 
-    - ริบบอน “หัวหนา-ท้ายบาง” (taper)
-    - core highlight ด้านใน (อ่านวิถีชัด)
+    - ริบบอน glow + main + core highlight (อ่านวิถีชัด)
     - ไม่มี spark/dots/วงกลมปลาย (ตามที่ไม่ต้องการ)
     - ผูกกับ projectile: projectile หาย -> trail หายเอง
+
+    วาดแบบสะสม: canvas ของ trail อยู่ถาวร (ติดไปกับ node ใน NodePool ด้วย)
+    - จุดใหม่แต่ละจุด -> ปั๊มหัวแปรง (_trail_dab) ตามช่วงระหว่างจุดก่อนหน้ากับจุดใหม่ (BLEND_RGBA_MAX)
+    - ทุก update คูณ alpha ของส่วนที่ยังมีชีวิตลงตามอายุ (เหลือ ~1/32 ตอนอายุครบ life) -> ท้ายจางและดูบางลงเอง
+    - image = subsurface ของ canvas เฉพาะกรอบของจุดที่ยังไม่หมดอายุ
+    งานต่อเฟรมจึงขึ้นกับจำนวนจุดใหม่ ไม่ต้องสร้าง Surface / วาดเส้นใหม่ทั้งเส้นทุกเฟรม
     """
 
+    # alpha ที่เหลือ (สัดส่วน) ตอนจุดอายุครบ life
+    FADE_AT_LIFE = 1.0 / 32.0
+    # ระยะห่างระหว่างหัวแปรง (สัดส่วนของ max_thickness)
+    DAB_SPACING = 0.1
+    # เผื่อพื้นที่ canvas ไปทางที่ลูกธนูวิ่ง (สัดส่วนของ max_thickness) จะได้ไม่ต้องย้าย canvas บ่อย
+    CANVAS_LEAD = 8
+
+    _canvas: pygame.Surface | None = None
+
     def __init__(
         self,
         projectile: pygame.sprite.Sprite,
@@ -48,15 +142,38 @@ class ArrowCometTrailNode(pygame.sprite.Sprite):
         alpha_main: int = 165,
         alpha_core: int = 220,
     ) -> None:
-        # วาง trail “หลัง” projectile ถ้าโปรเจกต์ใช้ layer
+        super().__init__()
+        self.reset(
+            projectile, *groups,
+            life=life, sample_interval=sample_interval, max_points=max_points,
+            max_thickness=max_thickness, min_thickness=min_thickness, glow_passes=glow_passes,
+            main_rgb=main_rgb, core_rgb=core_rgb, alpha_main=alpha_main, alpha_core=alpha_core,
+        )
+
+    def reset(
+        self,
+        projectile: pygame.sprite.Sprite,
+        *groups: pygame.sprite.AbstractGroup,
+        life: float = 0.18,
+        sample_interval: float = 0.010,
+        max_points: int = 26,
+        max_thickness: int = 11,
+        min_thickness: int = 2,
+        glow_passes: int = 2,
+        main_rgb: tuple[int, int, int] = (255, 210, 120),
+        core_rgb: tuple[int, int, int] = (255, 255, 255),
+        alpha_main: int = 165,
+        alpha_core: int = 220,
+    ) -> None:
+        """ผูกกับ projectile ใหม่ (ใช้ทั้งตอนสร้างและตอนดึงกลับมาจาก NodePool)"""
+        # วาง trail “หลัง” projectile ถ้าโปรเจกต์ใช้ layer (ตั้งก่อน add เข้า group)
         try:
             self._layer = int(getattr(projectile, "_layer", 0)) - 1
         except Exception:
             pass
 
-        super().__init__(*groups)
-
         self._target_ref = weakref.ref(projectile)
+        self._target_gen = getattr(projectile, "_generation", 0)
 
         self.life = max(0.06, float(life))
         self.sample_interval = max(0.004, float(sample_interval))
@@ -71,17 +188,33 @@ class ArrowCometTrailNode(pygame.sprite.Sprite):
         self.alpha_main = max(0, min(255, int(alpha_main)))
         self.alpha_core = max(0, min(255, int(alpha_core)))
 
+        self._dab = _trail_dab(
+            self.main_rgb, self.core_rgb, self.alpha_main, self.alpha_core,
+            self.max_thickness, max(self.min_thickness, int(round(self.max_thickness * 0.45))), self.glow_passes,
+        )
+        self._dab_half = self._dab.get_width() // 2 + 1
+        self._fade_rate = math.log(self.FADE_AT_LIFE) / self.life  # ต่อวินาที (ติดลบ)
+
         self._timer = 0.0
         self._pts: deque[_TrailPoint] = deque(maxlen=self.max_points)
-        self._dirty = True
 
-        self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
+        # canvas เก่า (ถ้ามาจาก pool) เคลียร์เฉพาะส่วนที่เคยวาด
+        if self._canvas is not None and getattr(self, "_live", None) is not None:
+            self._canvas.fill((0, 0, 0, 0), self._live)
+        self._origin = (0, 0)   # พิกัดโลกของมุมซ้ายบน canvas
+        self._live: pygame.Rect | None = None  # กรอบที่มีของวาดอยู่ (พิกัด canvas) นอกกรอบนี้ canvas ใส = 0 เสมอ
+
+        self.image = _blank_image()
         self.rect = self.image.get_rect()
 
         self._push_point(force=True)
+        self.add(*groups)
 
     def _target(self) -> pygame.sprite.Sprite | None:
-        return self._target_ref()
+        return _target_of(self)
+
+    def _on_release(self) -> None:
+        self._target_ref = _no_target
 
     def _get_target_center(self) -> pygame.Vector2 | None:
         t = self._target()
@@ -96,13 +229,10 @@ class ArrowCometTrailNode(pygame.sprite.Sprite):
         if not force and self._pts:
             if (self._pts[0].pos - c).length_squared() < 1.0:
                 return
+        prev = self._pts[0].pos if self._pts else None
         self._pts.appendleft(_TrailPoint(pos=c, age=0.0))
-        self._dirty = True
-
-    @staticmethod
-    def _ease_out(t: float) -> float:
-        t = max(0.0, min(1.0, t))
-        return 1.0 - (1.0 - t) * (1.0 - t)
+        if prev is not None:
+            self._stamp_segment(prev, c)
 
     def update(self, dt: float) -> None:
         dt = float(dt)
@@ -114,77 +244,136 @@ class ArrowCometTrailNode(pygame.sprite.Sprite):
 
         for p in self._pts:
             p.age += dt
-
-        before = len(self._pts)
         while self._pts and self._pts[-1].age >= self.life:
             self._pts.pop()
-        if len(self._pts) != before:
-            self._dirty = True
+
+        # จางตามอายุ: คูณ alpha ทั้งกรอบที่มีของ (สี RGB คงเดิม)
+        live = self._live
+        if live is not None and dt > 0.0:
+            keep = int(round(255.0 * math.exp(self._fade_rate * dt)))
+            mask = _fade_mask(keep, live.width, live.height)
+            self._canvas.blit(mask, live, (0, 0, live.width, live.height), special_flags=pygame.BLEND_RGBA_MULT)
 
         self._timer += dt
         while self._timer >= self.sample_interval:
             self._timer -= self.sample_interval
             self._push_point()
 
-        if len(self._pts) < 2:
-            return
-
-        if self._dirty:
-            self._rebuild_image()
-            self._dirty = False
-
-    def _rebuild_image(self) -> None:
-        pts = [p.pos for p in self._pts]
-        ages = [p.age for p in self._pts]
-
-        min_x = min(p.x for p in pts)
-        min_y = min(p.y for p in pts)
-        max_x = max(p.x for p in pts)
-        max_y = max(p.y for p in pts)
-
-        pad = self.max_thickness * 2 + 6
-        w = int(math.ceil(max_x - min_x)) + pad * 2
-        h = int(math.ceil(max_y - min_y)) + pad * 2
-        w = max(2, w)
-        h = max(2, h)
-
-        ox = min_x - pad
-        oy = min_y - pad
-        local = [pygame.Vector2(p.x - ox, p.y - oy) for p in pts]
-
-        surf = pygame.Surface((w, h), pygame.SRCALPHA)
-        n = len(local)
-
-        def draw_pass(rgb: tuple[int, int, int], alpha_base: int, thickness_mul: float) -> None:
-            for i in range(n - 1):
-                a_mid = (ages[i] + ages[i + 1]) * 0.5
-                k = max(0.0, min(1.0, 1.0 - (a_mid / self.life)))  # 1=new, 0=old
-                k = self._ease_out(k)
-
-                thick = self.min_thickness + (self.max_thickness - self.min_thickness) * k
-                thick = max(1, int(round(thick * thickness_mul)))
-
-                a = int(alpha_base * (k ** 1.25))
-                if a <= 0:
-                    continue
+        self._shrink_live()
+
+    # ---------- canvas ----------
+    def _points_rect(self) -> pygame.Rect:
+        """กรอบของจุดที่ยังไม่หมดอายุ + รัศมีหัวแปรง (พิกัดโลก)"""
+        xs = [p.pos.x for p in self._pts]
+        ys = [p.pos.y for p in self._pts]
+        h = self._dab_half
+        left = int(math.floor(min(xs))) - h
+        top = int(math.floor(min(ys))) - h
+        return pygame.Rect(left, top, int(math.ceil(max(xs))) + h - left, int(math.ceil(max(ys))) + h - top)
+
+    def _stamp_segment(self, a: pygame.Vector2, b: pygame.Vector2) -> None:
+        """ปั๊มหัวแปรงตามช่วง a -> b ลง canvas (เฉพาะช่วงใหม่)"""
+        h = self._dab_half
+        seg = pygame.Rect(int(min(a.x, b.x)) - h, int(min(a.y, b.y)) - h, 0, 0)
+        seg.width = int(abs(b.x - a.x)) + 2 * h + 1
+        seg.height = int(abs(b.y - a.y)) + 2 * h + 1
+        self._ensure_canvas(seg, b - a)
+
+        ox, oy = self._origin
+        seg.move_ip(-ox, -oy)
+        first = 0 if self._live is None else 1  # ช่วงแรกปั๊มจุดเริ่มด้วย ช่วงต่อไปจุดเริ่มถูกปั๊มไปแล้ว
+        self._live = seg if self._live is None else self._live.union(seg)
+
+        dab = self._dab
+        r = dab.get_width() / 2.0
+        delta = b - a
+        steps = max(1, int(delta.length() / max(1.0, self.max_thickness * self.DAB_SPACING)))
+        sx, sy = a.x - ox - r, a.y - oy - r
+        dx, dy = delta.x / steps, delta.y / steps
+        flags = pygame.BLEND_RGBA_MAX
+        self._canvas.blits(
+            [(dab, (round(sx + dx * i), round(sy + dy * i)), None, flags) for i in range(first, steps + 1)],
+            doreturn=False,
+        )
 
-                col = (rgb[0], rgb[1], rgb[2], max(0, min(255, a)))
-                pygame.draw.line(surf, col, local[i], local[i + 1], thick)
+    def _ensure_canvas(self, need: pygame.Rect, heading: pygame.Vector2) -> None:
+        """ให้ canvas ครอบ need (พิกัดโลก) ได้: ย้าย origin (scroll) หรือขยาย canvas ถ้าไม่พอ"""
+        canvas = self._canvas
+        ox, oy = self._origin
+        if canvas is not None and canvas.get_rect(topleft=(ox, oy)).contains(need):
+            return
 
-        # glow (หนา + จาง)
-        for g in range(self.glow_passes):
-            mul = 1.9 + g * 0.7
-            a = int(self.alpha_main * (0.20 / (g + 1)))
-            draw_pass(self.main_rgb, a, mul)
+        # พื้นที่ใหม่ = ของที่ยังมีชีวิต + ช่วงใหม่ + เผื่อไปทางที่กำลังวิ่ง
+        live_world = self._live.move(ox, oy) if self._live is not None else None
+        region = need.union(live_world) if live_world is not None else need.copy()
+        lead = self.max_thickness * self.CANVAS_LEAD
+        w = region.width + lead
+        h = region.height + lead
+
+        if canvas is None or canvas.get_width() < w or canvas.get_height() < h:
+            old, old_origin = canvas, (ox, oy)
+            cw = max(w, canvas.get_width() if canvas is not None else 0)
+            ch = max(h, canvas.get_height() if canvas is not None else 0)
+            canvas = pygame.Surface((cw, ch), pygame.SRCALPHA)
+            new_origin = self._anchor(region, heading, cw, ch)
+            if old is not None and self._live is not None:
+                dst = (old_origin[0] - new_origin[0] + self._live.x, old_origin[1] - new_origin[1] + self._live.y)
+                canvas.blit(old, dst, self._live, special_flags=pygame.BLEND_RGBA_MAX)
+            self._canvas = canvas
+        else:
+            new_origin = self._anchor(region, heading, canvas.get_width(), canvas.get_height())
+            if self._live is not None:
+                canvas.scroll(ox - new_origin[0], oy - new_origin[1])
+                moved = self._live.move(ox - new_origin[0], oy - new_origin[1])
+                self._clear_outside(canvas.get_rect(), moved)
+            else:
+                canvas.fill((0, 0, 0, 0))
 
-        # main ribbon
-        draw_pass(self.main_rgb, self.alpha_main, 1.0)
+        if self._live is not None:
+            self._live = self._live.move(ox - new_origin[0], oy - new_origin[1])
+        self._origin = new_origin
 
-        # core highlight (บาง)
-        draw_pass(self.core_rgb, self.alpha_core, 0.45)
+    @staticmethod
+    def _anchor(region: pygame.Rect, heading: pygame.Vector2, cw: int, ch: int) -> tuple[int, int]:
+        """origin ของ canvas ขนาด cw x ch ที่ครอบ region และเหลือที่ว่างไปทาง heading"""
+        x = region.left if heading.x >= 0 else region.right - cw
+        y = region.top if heading.y >= 0 else region.bottom - ch
+        return x, y
+
+    def _clear_outside(self, old: pygame.Rect, keep: pygame.Rect) -> None:
+        """เคลียร์ canvas ส่วนที่อยู่ใน old แต่ไม่อยู่ใน keep (รักษา: นอก _live ใสเสมอ)"""
+        clear = (0, 0, 0, 0)
+        canvas = self._canvas
+        keep = keep.clip(old)
+        if not keep:
+            canvas.fill(clear, old)
+            return
+        if keep.left > old.left:
+            canvas.fill(clear, (old.left, old.top, keep.left - old.left, old.height))
+        if keep.right < old.right:
+            canvas.fill(clear, (keep.right, old.top, old.right - keep.right, old.height))
+        if keep.top > old.top:
+            canvas.fill(clear, (keep.left, old.top, keep.width, keep.top - old.top))
+        if keep.bottom < old.bottom:
+            canvas.fill(clear, (keep.left, keep.bottom, keep.width, old.bottom - keep.bottom))
+
+    def _shrink_live(self) -> None:
+        """ตัดกรอบ _live ให้เหลือเฉพาะจุดที่ยังไม่หมดอายุ แล้วตั้ง image เป็น subsurface ของกรอบนั้น"""
+        if self._live is None:
+            return
+        if len(self._pts) < 2:
+            self._canvas.fill((0, 0, 0, 0), self._live)
+            self._live = None
+            self.image = _blank_image()
+            return
 
-        self.image = surf
-        self.rect = self.image.get_rect(topleft=(int(ox), int(oy)))
+        ox, oy = self._origin
+        live = self._points_rect().move(-ox, -oy).clip(self._live)
+        if live != self._live:
+            self._clear_outside(self._live, live)
+            self._live = live
+        self.image = self._canvas.subsurface(live)
+        self.rect = live.move(ox, oy)
 
 
 # ============================================================
@@ -201,7 +390,7 @@ class _Particle:
     color: tuple[int, int, int]
 
 
-class ArrowParticleTrailNode(pygame.sprite.Sprite):
+class ArrowParticleTrailNode(PooledNode, pygame.sprite.Sprite):
     """หางแบบอนุภาค (Particle System) สำหรับลูกธนู (bow_power_1/2)
     
     - ปล่อยจุดวงกลมเล็ก ๆ ตามทาง
@@ -218,31 +407,52 @@ class ArrowParticleTrailNode(pygame.sprite.Sprite):
         speed_variance: float = 10.0,
         main_rgb: tuple[int, int, int] = (255, 255, 255),
     ) -> None:
+        super().__init__()
+        self.reset(
+            projectile, *groups,
+            rate=rate, life=life, radius=radius, speed_variance=speed_variance, main_rgb=main_rgb,
+        )
+
+    def reset(
+        self,
+        projectile: pygame.sprite.Sprite,
+        *groups: pygame.sprite.AbstractGroup,
+        rate: float = 0.005,
+        life: float = 0.4,
+        radius: float = 4.0,
+        speed_variance: float = 10.0,
+        main_rgb: tuple[int, int, int] = (255, 255, 255),
+    ) -> None:
+        """ผูกกับ projectile ใหม่ (ใช้ทั้งตอนสร้างและตอนดึงกลับมาจาก NodePool)"""
         try:
             self._layer = int(getattr(projectile, "_layer", 0)) - 1
         except Exception:
             pass
 
-        super().__init__(*groups)
-
         self._target_ref = weakref.ref(projectile)
+        self._target_gen = getattr(projectile, "_generation", 0)
         self.rate = rate
         self.life = life
         self.radius = radius
         self.speed_variance = speed_variance
         self.main_rgb = main_rgb
         
-        from random import uniform
-        self.rng = uniform
+        owner = getattr(projectile, "owner", None)
+        self.rng = game_stream(getattr(owner, "game", None), "vfx")
 
         self._timer = 0.0
         self.particles: list[_Particle] = []
         
-        self.image = pygame.Surface((1, 1), pygame.SRCALPHA)
+        self.image = _blank_image()
         self.rect = self.image.get_rect()
+        self.add(*groups)
+
+    def _on_release(self) -> None:
+        self._target_ref = _no_target
+        self.particles = []
 
     def update(self, dt: float) -> None:
-        target = self._target_ref()
+        target = _target_of(self)
         
         # 1. Spawn particles if target is alive
         if target is not None and target.alive():
@@ -270,21 +480,21 @@ class ArrowParticleTrailNode(pygame.sprite.Sprite):
             self._rebuild_image()
 
     def _spawn_particle(self, target: pygame.sprite.Sprite) -> None:
-        import random
+        rng = self.rng
         center = pygame.Vector2(target.rect.center)
         # Random offset slightly
-        offset = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, 2))
+        offset = pygame.Vector2(rng.uniform(-2, 2), rng.uniform(-2, 2))
         
         # Velocity opposite to projectile direction? Or random?
         # Let's make them drift slightly randomly
-        vel = pygame.Vector2(random.uniform(-1, 1), random.uniform(-1, 1)) * self.speed_variance
+        vel = pygame.Vector2(rng.uniform(-1, 1), rng.uniform(-1, 1)) * self.speed_variance
         
         p = _Particle(
             pos=center + offset,
             vel=vel,
             life=self.life,
             max_life=self.life,
-            radius=self.radius * random.uniform(0.8, 1.2),
+            radius=self.radius * rng.uniform(0.8, 1.2),
             color=self.main_rgb
         )
         self.particles.append(p)
@@ -337,7 +547,7 @@ class ArrowParticleTrailNode(pygame.sprite.Sprite):
 # Projectile
 # ============================================================
 
-class ProjectileNode(AnimatedNode):
+class ProjectileNode(PooledNode, AnimatedNode):
     """
     กระสุนแบบ 'ลูกธนู' ที่มีแอนิเมชัน และหมุนตามทิศทาง (8 ทิศ)
 
@@ -346,6 +556,8 @@ class ProjectileNode(AnimatedNode):
 
     ✅ เพิ่ม: trail_theme (keyword-only) ให้ player_node คุมสีได้
         ProjectileNode(..., trail_theme="arcane" | "plasma" | "crimson" | ...)
+
+    ยิงผ่าน ProjectileNode.spawn(...) (argument เดียวกับ constructor) เพื่อใช้ node ที่ถูก kill แล้วซ้ำจาก game.node_pool
     """
 
     # ธีมสีสำหรับ trail (แก้เพิ่มได้ในอนาคต แต่ไม่จำเป็นต้องแก้ถ้าคุมจาก player_node)
@@ -365,6 +577,20 @@ class ProjectileNode(AnimatedNode):
         "green":    ((140, 255, 160), (255, 255, 255), 160, 220),
     }
 
+    # ช่องมุมของเฟรมที่หมุน: ลูกปกติ snap 8 ทิศ, homing ปัดทีละ 5° (หมุนใหม่เฉพาะตอนข้ามช่อง และใช้ cache ร่วม)
+    SNAP_ANGLE_STEP = 45.0
+    HOMING_ANGLE_STEP = 5.0
+
+    # projectile ที่ยิงได้ในเกม -> homing ไหม (PreloadScene หมุนเฟรมทุกช่องมุมไว้ล่วงหน้าตามนี้)
+    WARM_UP_IDS: dict[str, bool] = {
+        "arrow": False,
+        "arrow2": False,
+        "arrow/arrow3": True,   # bow_power_3
+        "fire": False,
+        "fire/fire2": True,     # fire_2
+        "rock": False,          # boss rock barrage
+    }
+
     def __init__(
         self,
         owner,
@@ -378,6 +604,67 @@ class ProjectileNode(AnimatedNode):
         trail_theme: str | None = None,
         homing: bool = False,
         homing_turn_rate: float = 4.0, # degrees per frame approx (or factor)
+    ) -> None:
+        self._generation = 0
+        self._setup(owner, pos, direction, speed, damage_packet, projectile_id, lifetime,
+                    trail_theme, homing, homing_turn_rate)
+
+        frame_duration = 0.06
+        loop = True
+
+        super().__init__(self.frames, frame_duration, loop, *groups)
+
+        self.rect.center = self.position
+
+        # ✅ attach comet trail (arrow only)
+        self._maybe_attach_comet_trail(groups)
+
+    @classmethod
+    def spawn(cls, owner, *args, **kwargs) -> "ProjectileNode":
+        """เหมือนเรียก constructor แต่ดึงลูกที่ถูก kill แล้วจาก game.node_pool มาใช้ซ้ำถ้ามี"""
+        return cls.from_pool(game_pool(getattr(owner, "game", None)), owner, *args, **kwargs)
+
+    def reset(
+        self,
+        owner,
+        pos: tuple[int, int],
+        direction: pygame.Vector2,
+        speed: float,
+        damage_packet: DamagePacket,
+        projectile_id: str = "arrow",
+        lifetime: float = 1.5,
+        *groups,
+        trail_theme: str | None = None,
+        homing: bool = False,
+        homing_turn_rate: float = 4.0,
+    ) -> None:
+        """เริ่มเป็นลูกใหม่ (เรียกจาก NodePool) -> trail ของลูกเดิมจะเห็น _generation เปลี่ยนแล้วหายไปเอง"""
+        self._generation += 1
+        self._setup(owner, pos, direction, speed, damage_packet, projectile_id, lifetime,
+                    trail_theme, homing, homing_turn_rate)
+        self.set_frames(self.frames, frame_duration=0.06, loop=True)
+        self.rect.center = self.position
+        self.add(*groups)
+        self._maybe_attach_comet_trail(groups)
+
+    def _on_release(self) -> None:
+        """ไม่ยึดผู้ยิง (อาจเป็นบอสของด่านก่อน) / เป้า homing / packet ไว้ระหว่างรออยู่ใน pool"""
+        self.owner = None
+        self.target = None
+        self.damage_packet = None
+
+    def _setup(
+        self,
+        owner,
+        pos: tuple[int, int],
+        direction: pygame.Vector2,
+        speed: float,
+        damage_packet: DamagePacket,
+        projectile_id: str,
+        lifetime: float,
+        trail_theme: str | None,
+        homing: bool,
+        homing_turn_rate: float,
     ) -> None:
         # ---------- เก็บข้อมูลพื้นฐาน ----------
         self.owner = owner
@@ -410,56 +697,47 @@ class ProjectileNode(AnimatedNode):
         self._update_angle()
 
         # ---------- โหลดเฟรม (จะถูกหมุนแล้ว) ----------
-        # โหลดมาเก็บไว้ก่อน แล้วค่อย rotate ตามมุม real-time
-        self.raw_frames = self._load_raw_frames()
+        # เฟรมต้นฉบับ + ที่หมุนแล้วอยู่ใน resources.rotations ใช้ร่วมกันทุกลูก
+        self.raw_frames = self.source_frames(owner.game.resources, projectile_id)
         self._rotate_frames()
 
-        frame_duration = 0.06
-        loop = True
-
-        super().__init__(self.frames, frame_duration, loop, *groups)
-
-        self.rect.center = self.position
-
-        # ✅ attach comet trail (arrow only)
-        self._maybe_attach_comet_trail(groups)
-
     def _update_angle(self) -> None:
         dx, dy = self.direction.x, self.direction.y
         raw_angle = math.degrees(math.atan2(dy, dx))
-        if not self.homing:
-            # Snap 8 ทิศถ้าไม่ใช่ homing (แบบเดิม)
-            snapped_angle = round(raw_angle / 45.0) * 45.0
-            self._angle = snapped_angle
-        else:
-            # ถ้า homing ให้หมุนเนียนๆ
-            self._angle = raw_angle
+        # Snap 8 ทิศถ้าไม่ใช่ homing (แบบเดิม), homing ปัดเป็นช่องละ 5° ให้ใช้เฟรมจาก cache ได้
+        step = self.HOMING_ANGLE_STEP if self.homing else self.SNAP_ANGLE_STEP
+        self._angle = RotationCache.bucket(raw_angle, step)
+
+    @classmethod
+    def source_frames(cls, resources, projectile_id: str) -> list[pygame.Surface]:
+        """เฟรมต้นฉบับ (ยังไม่หมุน) ของ projectile_id จาก resources.rotations"""
+        return resources.rotations.source(projectile_id, lambda: cls._load_raw_frames(resources, projectile_id))
 
-    def _load_raw_frames(self) -> list[pygame.Surface]:
+    @classmethod
+    def warm_up_rotations(cls, resources, projectile_id: str, homing: bool = False) -> int:
+        """หมุนเฟรมของ projectile_id ทุกช่องมุมไว้ล่วงหน้า (คืนจำนวนช่องมุม)"""
+        step = cls.HOMING_ANGLE_STEP if homing else cls.SNAP_ANGLE_STEP
+        return resources.rotations.warm(projectile_id, cls.source_frames(resources, projectile_id), step)
+
+    @staticmethod
+    def _load_raw_frames(resources, projectile_id: str) -> list[pygame.Surface]:
         """โหลดเฟรมต้นฉบับ (ยังไม่หมุน)"""
         frames: list[pygame.Surface] = []
-        resources = self.owner.game.resources
 
         index = 1
         while True:
             candidates = [
-                f"projectiles/{self.projectile_id}/{self.projectile_id}_{index:02d}.png",
-                f"projectiles/arrow/{self.projectile_id}_{index:02d}.png",
-                f"projectiles/{self.projectile_id}_{index:02d}.png",
+                f"projectiles/{projectile_id}/{projectile_id}_{index:02d}.png",
+                f"projectiles/arrow/{projectile_id}_{index:02d}.png",
+                f"projectiles/{projectile_id}_{index:02d}.png",
             ]
-            
-            base_frame = None
-            for path in candidates:
-                try:
-                    base_frame = resources.load_image(path)
-                    break
-                except Exception:
-                    continue
-            
-            if base_frame is None:
+
+            # ดูจาก file index ของ ResourceManager (ไม่ต้องลองเปิดไฟล์ที่ไม่มี)
+            path = next((p for p in candidates if resources.image_exists(p)), None)
+            if path is None:
                 break
-            
-            frames.append(base_frame)
+
+            frames.append(resources.load_image(path))
             index += 1
 
         if not frames:
@@ -472,15 +750,16 @@ class ProjectileNode(AnimatedNode):
         return frames
 
     def _rotate_frames(self) -> None:
-        """สร้าง self.frames จาก self.raw_frames โดยหมุนตาม self._angle"""
-        self.frames = []
-        for f in self.raw_frames:
-            rotated = pygame.transform.rotate(f, -self._angle)
-            self.frames.append(rotated)
+        """
+        สร้าง self.frames จาก self.raw_frames โดยหมุนตาม self._angle (ช่องมุมจาก _update_angle)
+        ใช้ชุดที่หมุนไว้แล้วจาก resources.rotations ร่วมกัน (ยิงซ้ำ / homing เลี้ยวไม่ต้องสร้าง Surface ใหม่)
+        """
+        rotations = self.owner.game.resources.rotations
+        self.frames = rotations.frames(self.projectile_id, self.raw_frames, self._angle)
         
         # update current image in AnimatedNode
-        if hasattr(self, "image") and hasattr(self, "frame_index"):
-            idx = int(self.frame_index) % len(self.frames)
+        if hasattr(self, "image") and hasattr(self, "_frame_index"):
+            idx = int(self._frame_index) % len(self.frames)
             self.image = self.frames[idx]
             # rect update center
             center = self.rect.center
@@ -528,6 +807,7 @@ class ProjectileNode(AnimatedNode):
             render_group = getattr(self.owner.game, "all_sprites", None)
         if render_group is None:
             return
+        pool = game_pool(getattr(self.owner, "game", None))
 
         # ✅ Check usage for Particle vs Ribbon
         # bow_power_1 ("gold") / bow_power_2 ("arcane") -> Particle
@@ -557,7 +837,8 @@ class ProjectileNode(AnimatedNode):
 
         if use_particle:
             # Particle Trail
-            ArrowParticleTrailNode(
+            ArrowParticleTrailNode.from_pool(
+                pool,
                 self,
                 render_group,
                 rate=0.005,
@@ -572,7 +853,8 @@ class ProjectileNode(AnimatedNode):
             max_thick = 12 if pid == "arrow2" else 11
             life = 0.20 if pid == "arrow2" else 0.18
 
-            ArrowCometTrailNode(
+            ArrowCometTrailNode.from_pool(
+                pool,
                 self,
                 render_group,
                 life=life,
@@ -639,7 +921,7 @@ class ProjectileNode(AnimatedNode):
                         # Update visual rotation
                         old_angle = self._angle
                         self._update_angle()
-                        if abs(self._angle - old_angle) > 1.0:
+                        if self._angle != old_angle:
                             self._rotate_frames()
 
         self.position += self.direction * self.speed * dt
@@ -0,0 +1,119 @@
+# pack_assets.py
+# รวมรูปทั้งหมด (ที่ scale แล้ว) ลง asset pack ไฟล์เดียว: assets/.cache/assets.pack (ดู core/asset_pack.py)
+#
+# ResourceManager เปิด pack ด้วย mmap แล้วสร้าง Surface จาก buffer ตรง ๆ
+# ไม่ต้องเปิดไฟล์ทีละรูป / decode PNG / smoothscale ตอนเล่น
+# ถ้ารูปต้นฉบับถูกแก้ (เนื้อไฟล์เปลี่ยน) เกมจะข้าม entry นั้นไปใช้ prescaled / ต้นฉบับเองจนกว่าจะ pack ใหม่
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python pack_assets.py pack                       # สร้าง assets/.cache/assets.pack
+#   python pack_assets.py list                       # ดู entry ใน pack
+#   python pack_assets.py unpack out/                # แตก pack เป็น PNG (ไว้ตรวจด้วยตา)
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from build_assets import _iter_sources, _scales_for
+from config.settings import RESOURCE_SCALES
+from core import asset_cache
+from core.asset_pack import AssetPack, write_pack
+from core.resource_manager import ResourceManager
+
+
+def _init_display() -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+
+def pack(base_path: str = "assets", out_path: str | None = None) -> str:
+    _init_display()
+
+    rm = ResourceManager(base_path=base_path, use_prescaled=False, **RESOURCE_SCALES)
+    graphics_dir = os.path.join(base_path, "graphics")
+    out_path = out_path or rm.pack_path
+    bytes_in = 0
+
+    def entries():
+        nonlocal bytes_in
+        for rel_path, full_path in _iter_sources(graphics_dir):
+            source = None
+            # รวม scale 1.0 ด้วย (pack ใช้แทนการ decode PNG ได้ทุกรูป ไม่ใช่แค่รูปที่ย่อ)
+            for scale in sorted(_scales_for(rm, rel_path, include_unscaled=True)):
+                key = asset_cache.entry_key(graphics_dir, full_path, scale)
+                if key is None:
+                    continue
+                if source is None:
+                    source = pygame.image.load(full_path).convert_alpha()
+                    bytes_in += os.path.getsize(full_path)
+                yield key, rm._scale_surface(source, scale)
+
+    t0 = time.perf_counter()
+    count = write_pack(out_path, entries())
+    print(
+        f"[pack_assets] packed {count} images "
+        f"({bytes_in / 1e6:.1f} MB source -> {os.path.getsize(out_path) / 1e6:.1f} MB pack) "
+        f"in {time.perf_counter() - t0:.1f}s -> {out_path}"
+    )
+    return out_path
+
+
+def unpack(pack_path: str, out_dir: str) -> None:
+    _init_display()
+
+    asset_pack = AssetPack(pack_path)
+    try:
+        for key in asset_pack.keys():
+            target = os.path.join(out_dir, *key.split("/")) + ".png"
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            pygame.image.save(asset_pack.load(key, convert=False), target)
+        print(f"[pack_assets] unpacked {len(asset_pack)} images -> {out_dir}")
+    finally:
+        asset_pack.close()
+
+
+def list_entries(pack_path: str) -> None:
+    asset_pack = AssetPack(pack_path)
+    try:
+        total = 0
+        for key in sorted(asset_pack.keys()):
+            size = asset_pack.raw_size(key)
+            total += size
+            print(f"{size:>10}  {key}")
+        print(f"[pack_assets] {len(asset_pack)} images, {total / 1e6:.1f} MB pixels")
+    finally:
+        asset_pack.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build / inspect the memory-mapped asset pack")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_pack = sub.add_parser("pack", help="pack every game image into one file")
+    p_pack.add_argument("--base-path", default="assets")
+    p_pack.add_argument("--out", default=None, help="default: <base-path>/.cache/assets.pack")
+
+    p_unpack = sub.add_parser("unpack", help="write every entry of a pack as PNG")
+    p_unpack.add_argument("pack")
+    p_unpack.add_argument("out_dir")
+
+    p_list = sub.add_parser("list", help="list entries of a pack")
+    p_list.add_argument("pack")
+
+    args = parser.parse_args()
+    if args.command == "pack":
+        pack(args.base_path, args.out)
+    elif args.command == "unpack":
+        unpack(args.pack, args.out_dir)
+    else:
+        list_entries(args.pack)
+
+
+if __name__ == "__main__":
+    main()
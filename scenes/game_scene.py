@@ -14,15 +14,19 @@ from entities.born_effect_node import BornEffectNode
 from entities.pickup_effect_node import PickupEffectNode
 
 from combat.collision_system import handle_group_vs_group
+from combat.spatial_grid import SpatialHashGrid
+from combat.wall_collision import CircleWallResolver
 from world.level_data import load_level
 from world.tilemap import TileMap
 from entities.decoration_node import DecorationNode
 
 from world.spawn_manager import SpawnManager
 from core.camera import Camera
+from core.render_group import ZOrderedGroup
 from core.message_log import MessageLog
 from config.settings import SCREEN_WIDTH, SCREEN_HEIGHT, UI_FONT_HUD_PATH
 from entities.item_node import ItemNode
+from world.level_manifest import build_manifest, preload_level
 
 from .pause_scene import PauseScene
 from .game_over_scene import GameOverScene
@@ -39,6 +43,15 @@ class GameScene(BaseScene):
     # (ไฟล์ต้องอยู่ใน assets/sounds/music/)
     MUSIC = MusicCue(intro="battle_intro_5s.wav", loop="battle_loop_30s.wav", volume=0.3, fade_ms=120, fadeout_ms=120)
 
+    # ขนาด cell ของ spatial grid สำหรับศัตรู (px)
+    ENEMY_GRID_CELL_SIZE = 96.0
+
+    # ขอบ (px) ที่เผื่อรอบกล้องตอน cull sprite (แถบ HP / guide ที่วาดเลยขอบ sprite)
+    CULL_MARGIN = 64
+
+    # sprite ที่ขยับเกินระยะนี้ใน sim step เดียว (warp / spawn ใหม่) ไม่ต้อง interpolate ตอนวาด
+    INTERP_SNAP_DISTANCE = 64
+
     def __init__(
         self,
         game,
@@ -64,10 +77,27 @@ class GameScene(BaseScene):
 
         # ---------- LEVEL / TILEMAP ----------
         self.level_data = load_level(level_id)
+        # ของที่ด่านนี้ใช้ต้องอยู่ใน cache ตลอด (ปล่อยของด่านก่อนให้ไล่ออกได้เมื่อเกินงบ)
+        self.game.resources.pin_level(level_id)
+        # asset ทั้งด่าน (tileset / atlas ศัตรู / ไอเท็ม / decor) คำนวณจาก JSON + config
+        # โหลดเฉพาะส่วนที่ยังไม่อยู่ใน cache และปล่อยของด่านก่อนที่ด่านนี้ไม่ใช้
+        # ถ้ามาจาก PreloadScene ด่านนี้ถูก switch_level + โหลดไว้แล้ว ใช้ manifest เดิมได้เลย
+        manifest = getattr(self.game, "level_manifest", None)
+        if manifest is None or manifest.level_id != level_id:
+            manifest = build_manifest(self.level_data, self.game.resources)
+            preload_level(self.game, manifest)
+        self.manifest = manifest
         self.tilemap = TileMap(self.level_data, self.game.resources)
+        # ให้ entity query segment การชนแบบ broad-phase ได้ (tilemap.segments_near)
+        self.game.tilemap = self.tilemap
+
+        # แก้ชนกำแพงของศัตรูทั้งฝูงพร้อมกันด้วย numpy (EnemyNode จะ defer มาที่นี่)
+        self.wall_resolver = CircleWallResolver.from_tilemap(self.tilemap)
+        self.game.wall_resolver = self.wall_resolver
 
         # ---------- SPRITE GROUPS ----------
-        self.all_sprites = pygame.sprite.Group()
+        # group หลักสำหรับวาด: เก็บ sprite แยก bucket ตาม z ไว้ตลอด (ไม่ต้อง sort ทุกเฟรม)
+        self.all_sprites = ZOrderedGroup()
         self.enemies = pygame.sprite.Group()
         self.projectiles = pygame.sprite.Group()
         self.enemy_projectiles = pygame.sprite.Group() # New group for enemy projectiles
@@ -81,6 +111,18 @@ class GameScene(BaseScene):
         self.game.enemy_projectiles = self.enemy_projectiles
         self.game.decorations = self.decorations
 
+        # spatial index ของศัตรู (สร้างใหม่เฟรมละครั้งใน _rebuild_enemy_index)
+        # ใช้ร่วมกันทั้ง enemy separation ของ scene และ steering ของ EnemyNode._separate
+        # cell ควรใหญ่กว่า radius1 + radius2 (EnemyNode.radius = 40)
+        self.enemy_index = SpatialHashGrid(cell_size=self.ENEMY_GRID_CELL_SIZE)
+        self.game.enemy_index = self.enemy_index
+
+        # จำนวน sprite ที่วาด / ถูก cull ในเฟรมล่าสุด (ดู draw)
+        self.sprites_drawn = 0
+        self.sprites_culled = 0
+
+        # rect.center ของทุก sprite ก่อน sim step ล่าสุด (ใช้ interpolate ตอนวาด ดู _interpolate_sprites)
+        self._prev_centers: dict = {}
 
         # ---------- PLAYER ----------
         # ถ้าไม่ได้ระบุ player_type มา ให้ใช้จาก Global State (GameApp)
@@ -111,9 +153,6 @@ class GameScene(BaseScene):
             self.enemies,
             self.all_sprites,
         )
-        # โหลด asset ของศัตรูทุกชนิดในด่านนี้ล่วงหน้า
-        self._preload_enemy_assets()
-
         # โหลด asset ของ effect ต่าง ๆ (เช่น born_effect) ล่วงหน้า
         self._preload_effect_assets()
 
@@ -214,45 +253,6 @@ class GameScene(BaseScene):
         b = 0
         return (r, g, b)
 
-    # ---------- Helper: preload enemy assets ----------
-    def _preload_enemy_assets(self) -> None:
-        """
-        โหลด sprite / animation / sound ของศัตรูทุกชนิดที่ใช้ในด่านนี้ล่วงหน้า
-        เพื่อลดอาการกระตุกตอนศัตรู spawn ครั้งแรกกลางเกม
-        """
-        # ถ้า level_data ไม่มี enemy_spawns ก็ไม่ต้องทำอะไร
-        enemy_spawns = getattr(self.level_data, "enemy_spawns", None)
-        if not enemy_spawns:
-            return
-
-        # รวบรวมชนิดศัตรู (enemy_id) ที่จะใช้ในด่านนี้จาก field "type"
-        enemy_ids: set[str] = set()
-        for spawn in enemy_spawns:
-            enemy_type = spawn.get("type")
-            if enemy_type:
-                enemy_ids.add(enemy_type)
-
-        if not enemy_ids:
-            return
-
-        # ใช้ group ชั่วคราว เพื่อไม่ให้ dummy enemy ไปโผล่ใน all_sprites จริง
-        temp_group = pygame.sprite.Group()
-
-        # สร้าง enemy แต่ละชนิดนอกจอหนึ่งครั้ง เพื่อให้มันโหลด asset เข้าคลัง
-        for enemy_id in enemy_ids:
-            try:
-                dummy = EnemyNode(
-                    self.game,
-                    (-9999, -9999),   # spawn นอกจอ
-                    temp_group,       # ใส่แค่ใน temp_group
-                    enemy_id=enemy_id,
-                )
-                # ไม่ต้องอยู่ต่อในเกม แค่ให้ __init__ ทำงานพอ
-                dummy.kill()
-            except Exception as e:
-                # กันพลาด ถ้า enemy_id ไหน config มีปัญหา จะไม่ทำให้เกมพังทั้งด่าน
-                print(f"[WARN] preload enemy assets failed for '{enemy_id}': {e}")
-
     # ---------- Helper: preload effect assets ----------
     def _preload_effect_assets(self) -> None:
         """
@@ -303,66 +303,69 @@ class GameScene(BaseScene):
     # Collision Handling สำหรับศัตรูด้วยกันจะไม่อยู่ตำแหน่งเดียวกัน
     # ============================================================
 
+    def _rebuild_enemy_index(self) -> None:
+        """
+        สร้าง enemy_index ใหม่จากตำแหน่งศัตรูปัจจุบัน (เฟรมละครั้ง)
+
+        - เรียกหลัง sprite update + spawn เพื่อให้ separation ใช้ตำแหน่งล่าสุด
+        - EnemyNode._separate ในเฟรมถัดไปจะ query จาก index ชุดนี้
+          (ตำแหน่งช้าไปแค่ 1 เฟรม ซึ่งพอสำหรับแรง steering)
+        """
+        # ไม่ต้องทำ separation กับตัวที่ตายแล้ว -> ไม่ใส่ลง index ตั้งแต่แรก
+        self.enemy_index.rebuild(
+            e for e in self.enemies.sprites() if not e.is_dead
+        )
+
     def _handle_enemy_separation(self) -> None:
         """
         จัดการการชนกันระหว่างศัตรู (Enemy vs Enemy) เพื่อไม่ให้เดินซ้อนกัน
         โดยใช้หลักการ Circle-to-Circle collision และผลักออกจากกัน
+
+        ใช้ spatial hash grid (self.enemy_index) เป็น broad-phase
+        -> ตรวจเฉพาะคู่ที่อยู่ในเซลล์เดียวกัน/ติดกัน แทนการวนทุกคู่ O(n²)
         """
-        # ใช้ list() เพื่อสร้างสำเนาของ enemies.sprites() 
-        # เพื่อหลีกเลี่ยงการแก้ไข list ระหว่างวนลูป
-        enemies_list = list(self.enemies.sprites())
-        
-        # วนลูปตรวจสอบทุกคู่ (i, j) โดยที่ i != j และไม่ซ้ำคู่เดิม
-        for i in range(len(enemies_list)):
-            for j in range(i + 1, len(enemies_list)):
-                enemy1: EnemyNode = enemies_list[i]
-                enemy2: EnemyNode = enemies_list[j]
-
-                # ไม่ต้องทำ separation ถ้าตัวใดตัวหนึ่งตายแล้ว
-                if enemy1.is_dead or enemy2.is_dead:
-                    continue
+        for enemy1, enemy2 in self.enemy_index.candidate_pairs():
+            self._separate_pair(enemy1, enemy2)
+
+    @staticmethod
+    def _separate_pair(enemy1: EnemyNode, enemy2: EnemyNode) -> None:
+        """ผลักศัตรู 2 ตัวออกจากกันถ้าวงกลมซ้อนกัน (แบ่งระยะผลักคนละครึ่ง)"""
+        # 1. เช็คระยะห่างระหว่างจุดศูนย์กลาง (pos)
+        distance_vec = enemy1.pos - enemy2.pos
+        distance_sq = distance_vec.length_squared()
+
+        # 2. คำนวณรัศมีที่ควรห่างกัน (enemy1.radius + enemy2.radius)
+        # ถ้าศัตรูมีขนาดไม่เท่ากัน ให้ใช้รัศมีของแต่ละตัว
+        combined_radius = enemy1.radius + enemy2.radius
+        combined_radius_sq = combined_radius * combined_radius
+
+        # 3. ถ้าไม่ชนกัน (หรือซ้อนกันสนิทจนหาทิศไม่ได้) ก็ไม่ต้องทำอะไร
+        if distance_sq >= combined_radius_sq or distance_sq <= 0:
+            return
 
-                # 1. เช็คระยะห่างระหว่างจุดศูนย์กลาง (pos)
-                distance_vec = enemy1.pos - enemy2.pos
-                distance_sq = distance_vec.length_squared()
+        # คำนวณระยะห่างจริงและระยะซ้อนทับ (overlap)
+        distance = math.sqrt(distance_sq)
+        overlap = combined_radius - distance
 
-                # 2. คำนวณรัศมีที่ควรห่างกัน (enemy1.radius + enemy2.radius)
-                # สมมติว่าศัตรูทุกตัวใช้ radius = 20.0 (ตามที่ตั้งใน enemy_node.py)
-                # ถ้าศัตรูมีขนาดไม่เท่ากัน ให้ใช้รัศมีของแต่ละตัว
-                combined_radius = enemy1.radius + enemy2.radius
-                combined_radius_sq = combined_radius * combined_radius
+        # 4. คำนวณทิศทางผลัก (Normalized Vector)
+        normal = distance_vec / distance
 
-                # 3. ถ้าชนกัน (ระยะห่างน้อยกว่าผลรวมรัศมี)
-                if distance_sq < combined_radius_sq and distance_sq > 0:
-                    
-                    # คำนวณระยะห่างจริงและระยะซ้อนทับ (overlap)
-                    distance = distance_vec.length()
-                    if distance == 0:
-                         # ป้องกันหารด้วยศูนย์ ถ้าตำแหน่งซ้อนกันสนิท
-                         # ขยับตัวใดตัวหนึ่งเล็กน้อยในทิศสุ่ม
-                         distance_vec = pygame.Vector2(1, 0).rotate(pygame.time.get_ticks() % 360)
-                         distance = distance_vec.length()
-
-                    overlap = combined_radius - distance
-                    
-                    # 4. คำนวณทิศทางผลัก (Normalized Vector)
-                    normal = distance_vec.normalize()
+        # 5. คำนวณ MTV (Minimal Translation Vector)
+        # แบ่งการผลักให้ศัตรูแต่ละตัวเท่าๆ กัน (half overlap)
+        mtv = normal * (overlap / 2.0)
 
-                    # 5. คำนวณ MTV (Minimal Translation Vector)
-                    # แบ่งการผลักให้ศัตรูแต่ละตัวเท่าๆ กัน (half overlap)
-                    mtv = normal * (overlap / 2.0)
+        # 6. ผลักศัตรูออกจากกัน
+        enemy1.pos += mtv
+        enemy2.pos -= mtv
 
-                    # 6. ผลักศัตรูออกจากกัน
-                    enemy1.pos += mtv
-                    enemy2.pos -= mtv
-                    
-                    # 7. อัปเดต rect (ทำใน enemy update ก็ได้ แต่ทำซ้ำเพื่อความชัวร์)
-                    enemy1.rect.center = (round(enemy1.pos.x), round(enemy1.pos.y))
-                    enemy2.rect.center = (round(enemy2.pos.x), round(enemy2.pos.y))
+        # 7. อัปเดต rect (ทำใน enemy update ก็ได้ แต่ทำซ้ำเพื่อความชัวร์)
+        enemy1.rect.center = (round(enemy1.pos.x), round(enemy1.pos.y))
+        enemy2.rect.center = (round(enemy2.pos.x), round(enemy2.pos.y))
 
     # ---------- UPDATE ----------
     def update(self, dt: float) -> None:
-        
+        self._prev_centers = {sprite: sprite.rect.center for sprite in self.all_sprites}
+
         # Update Consumable Display Timer
         if self.consumable_display_timer > 0:
             self.consumable_display_timer -= dt
@@ -433,29 +436,36 @@ class GameScene(BaseScene):
         self.player.set_collision_segments(self.tilemap.collision_segments)
 
         # <--- Tilemap Collision (Enemies) --->
-        # ส่ง segment การชนให้ EnemyNode ทุกตัว
-        if hasattr(self.tilemap, "collision_segments"):
-            for enemy in self.enemies.sprites():
-                # ตรวจสอบว่ามี method set_collision_segments ใน enemy หรือไม่
-                if hasattr(enemy, "set_collision_segments"):
-                    enemy.set_collision_segments(self.tilemap.collision_segments)
-        
+        # EnemyNode ดึง segment ใกล้ตัวเองจาก self.game.tilemap.segments_near()
+        # จึงไม่ต้องส่ง collision_segments ให้ศัตรูทุกตัวทุกเฟรมแล้ว
+
         # เก็บ rect ไว้ใช้กับอย่างอื่นด้วย
         self.player.set_collision_rects(self.tilemap.collision_rects)
 
+        prof = self.game.profiler
+
         # อัปเดต sprite ทั้งหมด
-        self.all_sprites.update(dt)
+        with prof.scope("update.sprites"):
+            self.all_sprites.update(dt)
+
+            # แก้ชนกำแพงของศัตรูที่ขยับในเฟรมนี้ทีเดียว (batch)
+            self.wall_resolver.resolve()
 
         # อัปเดตการ spawn ศัตรูตามเวลา / wave
         if hasattr(self, "spawn_manager"):
-            self.spawn_manager.update(dt)
+            with prof.scope("update.spawn"):
+                self.spawn_manager.update(dt)
 
-        # จัดการการชนระหว่างศัตรู ไม่ให้อยู่ตำแหน่งเดียวกัน
-        self._handle_enemy_separation()
+        # อัปเดต spatial index ของศัตรู แล้วจัดการการชนระหว่างศัตรู ไม่ให้อยู่ตำแหน่งเดียวกัน
+        with prof.scope("update.separation"):
+            self._rebuild_enemy_index()
+            self._handle_enemy_separation()
 
         # อัปเดตกล้องให้ตาม player
         self.camera.update(self.player.rect, dt)
 
+        prof.begin("update.collisions")
+
         # Projectile vs Enemies
         def on_projectile_hit(projectile, enemy):
             if not hasattr(enemy, "take_hit"):
@@ -495,9 +505,11 @@ class GameScene(BaseScene):
         hits_self = pygame.sprite.spritecollide(self.player, self.projectiles, dokill=False)
         for p in hits_self:
             on_projectile_hit_player(p, self.player)
+        prof.end("update.collisions")
 
 
         # Player vs Items (pickup)
+        prof.begin("update.pickup")
         hits = pygame.sprite.spritecollide(self.player, self.items, dokill=True)
 
         for item_node in hits:
@@ -549,9 +561,11 @@ class GameScene(BaseScene):
             else:
                 if hasattr(self.player, "sfx_slash"):
                     self.player.sfx_slash.play()
+        prof.end("update.pickup")
 
 
         # ---------- Player vs Enemies (touch damage) ----------
+        prof.begin("update.collisions")
         # ลด cooldown การโดนชน (กันไม่ให้โดนซ้ำทุกเฟรม)
         if self.player_contact_timer > 0:
             self.player_contact_timer -= dt
@@ -587,6 +601,7 @@ class GameScene(BaseScene):
 
             # ตั้ง cooldown ไม่ให้โดนชนทุกเฟรม
             self.player_contact_timer = self.player_contact_cooldown
+        prof.end("update.collisions")
 
 
         # ---------- เช็คจบด่าน & เริ่มแสดง Stage Clear ----------
@@ -610,70 +625,44 @@ class GameScene(BaseScene):
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((0, 0, 0))
 
-        offset = self.camera.offset
-
-        # วาด tilemap ก่อน
-        self.tilemap.draw(surface, camera_offset=offset)
-
-        # วาด sprite ตาม z-index (default = 0 ถ้าไม่มี z)
-        for sprite in sorted(self.all_sprites, key=lambda s: getattr(s, "z", 0)):
-            # <--- NEW: Draw Collision Indicator --->
-            if getattr(sprite, "show_collision_indicator", False) and not getattr(sprite, "is_dead", False):
-                self._draw_collision_indicator(surface, sprite, offset)
-            # <--- END NEW --->
-            
-            # <--- NEW: Draw Extra Visuals (e.g. Boss Telegraph) --->
-            if hasattr(sprite, "draw_extra"):
-                sprite.draw_extra(surface, offset)
-            # <--- END NEW --->
-
-            # <--- NEW: Draw Player Guide (Back) --->
-            if sprite == self.player and not self.player.is_dead:
-                self._draw_player_guides(surface, offset, "back")
-            # <--- END NEW --->
-
-            draw_x = sprite.rect.x - int(offset.x)
-            draw_y = sprite.rect.y - int(offset.y)
-            surface.blit(sprite.image, (draw_x, draw_y))
-
-            # <--- NEW: Draw Player Guide (Front) --->
-            if sprite == self.player and not self.player.is_dead:
-                self._draw_player_guides(surface, offset, "front")
-            # <--- END NEW --->
-
-            # ---------- วาดแถบ HP ของศัตรู ----------
-            if isinstance(sprite, EnemyNode) or isinstance(sprite, PlayerNode) and not sprite.is_dead:
-                ratio = sprite.hp_ratio   # ใช้ property hp_ratio ใน EnemyNode
-
-                # ขนาดแท่ง HP (สั้นกว่าตัว 50%)
-                full_width = sprite.rect.width
-                bar_width = int(full_width * 0.5)
-                bar_height = 3
-
-                # ตำแหน่งวาด: เหนือหัวศัตรูนิดหน่อย + จัดให้อยู่กลางหัว
-                bar_x = draw_x + (full_width - bar_width) // 2
-                bar_y = draw_y - 4  # ปรับขึ้น/ลงตามที่ชอบ
-
-                # พื้นหลังแท่ง (เทาเข้ม)
-                bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-                pygame.draw.rect(surface, (40, 40, 40), bg_rect)
-
-                # ความยาวตาม % HP
-                hp_width = int(bar_width * ratio)
-                hp_color = self._get_hp_color(ratio)
-
-                hp_rect = pygame.Rect(bar_x, bar_y, hp_width, bar_height)
-                pygame.draw.rect(surface, hp_color, hp_rect)
-
-        # วาดเลเยอร์ foreground (ถ้ามี) ให้อยู่หน้าตัวละคร แต่หลังพื้นหลัง
-        if hasattr(self.tilemap, "draw_foreground"):
-            self.tilemap.draw_foreground(surface, camera_offset=offset)
+        # วาดที่ตำแหน่งระหว่าง sim step ก่อนหน้ากับล่าสุด (ถ้ามี scene อื่นทับอยู่ เช่น pause ให้หยุดนิ่งที่ step ล่าสุด)
+        alpha = self.game.render_alpha if self.game.scene_manager.current_scene is self else 1.0
+        offset = self.camera.lerp_offset(alpha)
+        moved = self._interpolate_sprites(alpha)
+        prof = self.game.profiler
+        try:
+            # วาด tilemap ก่อน
+            with prof.scope("draw.tilemap"):
+                self.tilemap.draw(surface, camera_offset=offset)
+
+            # วาด sprite ตาม z-index ทีละ bucket (ชั้น actor จะถูก y-sort ใน ZOrderedGroup)
+            # cull ตัวที่อยู่นอกกล้องก่อนทำงานวาดใด ๆ (เผื่อขอบไว้สำหรับแถบ HP / guide)
+            view = pygame.Rect(int(offset.x), int(offset.y), self.camera.screen_width, self.camera.screen_height)
+            view.inflate_ip(self.CULL_MARGIN * 2, self.CULL_MARGIN * 2)
+            drawn = 0
+            with prof.scope("draw.sprites"):
+                for _, bucket in self.all_sprites.buckets(view):
+                    self._draw_sprite_bucket(surface, bucket, offset)
+                    drawn += len(bucket)
+
+            # ตัวนับสำหรับ profiling: วาดจริง vs ถูก cull (รวม decor ที่ไม่ถูกไล่เลย)
+            self.sprites_drawn = drawn
+            self.sprites_culled = len(self.all_sprites) - drawn
+
+            # วาดเลเยอร์ foreground (ถ้ามี) ให้อยู่หน้าตัวละคร แต่หลังพื้นหลัง
+            if hasattr(self.tilemap, "draw_foreground"):
+                with prof.scope("draw.foreground"):
+                    self.tilemap.draw_foreground(surface, camera_offset=offset)
+        finally:
+            for sprite, center in moved:
+                sprite.rect.center = center
 
         # <--- REMOVED: Old Draw Player Direction Indicator call (Moved to sprite loop) --->
 
 
 
         # HUD (วาดแบบ fixed screen)
+        prof.begin("draw.hud")
         # --- current equipment ---
         eq = getattr(self.player, "equipment", None)
 
@@ -816,7 +805,91 @@ class GameScene(BaseScene):
         # [NEW] Multi-Slot Active Item Indicators (Bottom Right)
         # ----------------------------------------------------
         self.draw_hud_indicators(surface)
+        prof.end("draw.hud")
+
+
+    def _interpolate_sprites(self, alpha: float) -> list:
+        """
+        ย้าย rect ของ sprite ที่ขยับใน sim step ล่าสุดไปยังตำแหน่ง prev + (cur - prev) * alpha ชั่วคราว
+        คืน [(sprite, center จริง)] ให้ draw คืนค่าหลังวาดเสร็จ
+        """
+        if alpha >= 1.0:
+            return []
+        snap_sq = self.INTERP_SNAP_DISTANCE * self.INTERP_SNAP_DISTANCE
+        back = 1.0 - alpha
+        moved = []
+        for sprite, (px, py) in self._prev_centers.items():
+            rect = sprite.rect
+            cx, cy = rect.center
+            dx = px - cx
+            dy = py - cy
+            if (dx == 0 and dy == 0) or dx * dx + dy * dy > snap_sq:
+                continue
+            moved.append((sprite, (cx, cy)))
+            rect.center = (round(cx + dx * back), round(cy + dy * back))
+        return moved
+
+    def _draw_sprite_bucket(self, surface: pygame.Surface, sprites: list, offset: pygame.Vector2) -> None:
+        """
+        วาด sprite ที่ z เท่ากันเป็น 3 pass เพื่อให้ตัว sprite ส่งเข้า surface.blits() ได้ครั้งเดียว
+        1) underlay : collision indicator / draw_extra / guide ด้านหลังผู้เล่น
+        2) sprites  : blit ทั้งกลุ่ม
+        3) overlay  : guide ด้านหน้าผู้เล่น / แถบ HP
+        """
+        ox = int(offset.x)
+        oy = int(offset.y)
+        player = self.player
+        player_alive = not player.is_dead
+
+        # ---------- pass 1: underlay ----------
+        for sprite in sprites:
+            if getattr(sprite, "show_collision_indicator", False) and not getattr(sprite, "is_dead", False):
+                self._draw_collision_indicator(surface, sprite, offset)
+
+            # เช่น telegraph ของบอส
+            if hasattr(sprite, "draw_extra"):
+                sprite.draw_extra(surface, offset)
+
+            if sprite is player and player_alive:
+                self._draw_player_guides(surface, offset, "back")
+
+        # ---------- pass 2: sprites ----------
+        surface.blits(
+            [(sprite.image, (sprite.rect.x - ox, sprite.rect.y - oy)) for sprite in sprites],
+            doreturn=False,
+        )
+
+        # ---------- pass 3: overlay ----------
+        for sprite in sprites:
+            if sprite is player and player_alive:
+                self._draw_player_guides(surface, offset, "front")
+
+            if isinstance(sprite, EnemyNode) or isinstance(sprite, PlayerNode) and not sprite.is_dead:
+                self._draw_hp_bar(surface, sprite, sprite.rect.x - ox, sprite.rect.y - oy)
+
+    def _draw_hp_bar(self, surface: pygame.Surface, sprite, draw_x: int, draw_y: int) -> None:
+        """วาดแถบ HP เหนือหัว sprite (ตำแหน่งบนจอ draw_x, draw_y = มุมซ้ายบนของ sprite)"""
+        ratio = sprite.hp_ratio   # ใช้ property hp_ratio ใน EnemyNode
+
+        # ขนาดแท่ง HP (สั้นกว่าตัว 50%)
+        full_width = sprite.rect.width
+        bar_width = int(full_width * 0.5)
+        bar_height = 3
+
+        # ตำแหน่งวาด: เหนือหัวศัตรูนิดหน่อย + จัดให้อยู่กลางหัว
+        bar_x = draw_x + (full_width - bar_width) // 2
+        bar_y = draw_y - 4  # ปรับขึ้น/ลงตามที่ชอบ
+
+        # พื้นหลังแท่ง (เทาเข้ม)
+        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
+        pygame.draw.rect(surface, (40, 40, 40), bg_rect)
+
+        # ความยาวตาม % HP
+        hp_width = int(bar_width * ratio)
+        hp_color = self._get_hp_color(ratio)
 
+        hp_rect = pygame.Rect(bar_x, bar_y, hp_width, bar_height)
+        pygame.draw.rect(surface, hp_color, hp_rect)
 
     def _draw_player_guides(self, surface: pygame.Surface, offset: pygame.Vector2, part: str) -> None:
         """
@@ -8,9 +8,12 @@ import sys
 from typing import Callable, Optional
 
 from .base_scene import BaseScene
+from core.asset_loader import AssetLoader
 from world.level_data import load_level
+from world.level_manifest import EFFECT_IDS, build_manifest, missing_requests, switch_level
 from world.tilemap import TileMap
 from entities.enemy_node import EnemyNode
+from entities.projectile_node import ProjectileNode
 from entities.born_effect_node import BornEffectNode
 from entities.slash_effect_node import SlashEffectNode
 from entities.sword_slash_arc_node import SwordSlashArcNode
@@ -77,6 +80,9 @@ class PreloadScene(BaseScene):
 
     OVERRIDE_MUSIC = False  # ไม่อยากให้ _sync_music ไปโหลดเพลงหนัก ๆ ระหว่างโหลด
 
+    # สัดส่วนของแถบ progress ที่เป็นช่วง decode รูป (ที่เหลือคือช่วงสร้าง node warm up)
+    DECODE_WEIGHT = 0.8
+
     def __init__(
         self,
         game,
@@ -84,6 +90,7 @@ class PreloadScene(BaseScene):
         level_id: str = "level01",
         next_scene_factory: Callable[[], BaseScene],
         items_per_frame: int = 2,
+        workers: int | None = None,
         title: str = "Loading...",
         note: str = "กำลังโหลดทรัพยากรครั้งแรก อาจใช้เวลาสักครู่บน macOS",
     ) -> None:
@@ -91,6 +98,8 @@ class PreloadScene(BaseScene):
         self.level_id = level_id
         self.next_scene_factory = next_scene_factory
         self.items_per_frame = max(1, int(items_per_frame))
+        # จำนวน thread ที่ decode รูป (None = เท่าจำนวน core)
+        self.workers = workers
 
         self.title = title
         self.note = note
@@ -99,6 +108,7 @@ class PreloadScene(BaseScene):
         self._done = 0
         self._total: Optional[int] = None
         self._status = "Preparing..."
+        self._loader: Optional[AssetLoader] = None
 
         # ใช้ฟอนต์ระบบ (ไม่ไปโหลดไฟล์ font เพิ่มในช่วง preload)
         self._title_font = _make_system_font(42, bold=True)
@@ -166,8 +176,9 @@ class PreloadScene(BaseScene):
         bar_y = status_rect.bottom + 18
         pygame.draw.rect(surface, (70, 70, 70), (bar_x, bar_y, bar_w, bar_h), border_radius=8)
 
-        if self._total and self._total > 0:
-            pct = max(0.0, min(1.0, self._done / float(self._total)))
+        progress = self._progress()
+        if progress is not None:
+            pct = max(0.0, min(1.0, progress))
             fill_w = int(bar_w * pct)
             pygame.draw.rect(surface, (120, 220, 140), (bar_x, bar_y, fill_w, bar_h), border_radius=8)
             pct_text = f"{int(pct * 100)}%"
@@ -197,43 +208,94 @@ class PreloadScene(BaseScene):
 
     # ----------------- internal -----------------
 
+    def _progress(self) -> Optional[float]:
+        """0.0-1.0 (None = ยังไม่รู้ปริมาณงาน)"""
+        if self._loader is None:
+            return None
+        if self._total is None:
+            # ช่วง decode: ตาม byte ของไฟล์ที่โหลดเสร็จแล้วจริง
+            return self.DECODE_WEIGHT * self._loader.progress
+        steps = self._done / float(self._total) if self._total > 0 else 1.0
+        return self.DECODE_WEIGHT + (1.0 - self.DECODE_WEIGHT) * steps
+
     def _preload_runner(self):
         # 1) โหลดข้อมูลเลเวล
         self._status = f"Loading level data: {self.level_id}"
         level_data = load_level(self.level_id)
+        self.game.resources.pin_level(self.level_id)
         yield
 
-        # รวบรวม enemy types ที่จะใช้ในด่านนี้
-        enemy_spawns = getattr(level_data, "enemy_spawns", []) or []
-        enemy_ids = sorted({s.get("type") for s in enemy_spawns if s.get("type")})
+        # asset ทั้งด่านคำนวณจาก JSON + config (ไม่ต้องสร้าง dummy EnemyNode)
+        # แล้วโหลดเฉพาะส่วนที่ยังไม่อยู่ใน cache / ปล่อยของด่านก่อนที่ด่านนี้ไม่ใช้
+        resources = self.game.resources
+        manifest = build_manifest(level_data, resources)
+        switch_level(self.game, manifest)
+        enemy_ids, requests = missing_requests(manifest, resources)
 
         # effect ที่อยาก warm up (เพิ่มได้)
-        effect_ids = ["born"]  # BornEffectNode ใช้ effect_id
+        effect_ids = list(EFFECT_IDS)  # BornEffectNode ใช้ effect_id
 
         # ทิศที่ต้อง warm up สำหรับเอฟเฟ็กต์ฟัน (8 ทิศ)
         slash_dirs = ["up", "up_right", "right", "down_right", "down", "down_left", "left", "up_left"]
 
+        # 2) decode รูปที่ยังไม่มีบน thread pool (main thread แค่ convert_alpha ทีละนิดต่อเฟรม)
+        #    ขั้นถัดไปเรียก load_image ตามปกติแล้วจะได้รูปที่ decode ไว้แล้วทันที
+        self._loader = AssetLoader(resources, max_workers=self.workers)
+        try:
+            self._loader.submit(requests)
+            while not self._loader.done:
+                # items_per_frame ครั้งต่อเฟรม -> แบ่งเวลา convert ให้รวมกันไม่เกิน ~8ms
+                self._loader.poll(time_budget=0.008 / self.items_per_frame)
+                loader = self._loader
+                self._status = (
+                    f"Decoding images: {loader.files_done}/{loader.files_total} files "
+                    f"({loader.bytes_done / 1e6:.1f}/{loader.bytes_total / 1e6:.1f} MB)"
+                )
+                yield
+        finally:
+            self._loader.shutdown()
+        for rel_path, ex in self._loader.failed:
+            print(f"[WARN] preload decode failed: {rel_path}: {ex}")
 
         # ตั้ง total หลังรู้จำนวนงาน
-        # - 1: load level
+        # (load level + decode รูปนับแยกใน _progress แล้ว)
         # - 1: build tilemap (tileset image)
-        # - N: enemy types
+        # - 1: รูปอื่นใน manifest (ไอเท็ม / decor / effect) + เสียง
+        # - N: enemy types ที่ยังไม่มี atlas
         # - M: effects
-        self._total = 2 + len(enemy_ids) + len(effect_ids) + len(slash_dirs) + len(slash_dirs)  # +slash +sword_arc
+        # - P: projectile (หมุนเฟรมทุกช่องมุม)
+        self._done = 0
+        self._total = (
+            2 + len(enemy_ids) + len(effect_ids) + len(ProjectileNode.WARM_UP_IDS)
+            + len(slash_dirs) + len(slash_dirs)  # +slash +sword_arc
+        )
 
-        # 2) สร้าง TileMap (จะโหลด tileset)
+        # 3) สร้าง TileMap (จะโหลด tileset)
         self._status = "Building tilemap (tileset image)"
-        _ = TileMap(level_data, self.game.resources)
+        _ = TileMap(level_data, resources)
         yield
 
-        # 3) preload enemy assets: สร้าง dummy EnemyNode นอกจอเพื่อบังคับโหลด sprite/sound
-        temp_group = pygame.sprite.Group()
+        self._status = "Preloading items / decorations"
+        for path, scale in manifest.images:
+            try:
+                resources.load_image(path, scale_override=scale)
+            except Exception as ex:
+                print(f"[WARN] preload image failed: {path}: {ex}")
+        for sound in manifest.sounds:
+            try:
+                resources.load_sound(sound)
+            except Exception as ex:
+                print(f"[WARN] preload sound failed: {sound}: {ex}")
+        yield
+
+        # 3) pack atlas ของศัตรูที่ยังไม่มีใน cache
         for enemy_id in enemy_ids:
             self._status = f"Preloading enemy: {enemy_id}"
-            dummy = EnemyNode(self.game, (-9999, -9999), temp_group, enemy_id=enemy_id)
-            dummy.kill()
+            EnemyNode.build_atlas(resources, enemy_id)
             yield
 
+        temp_group = pygame.sprite.Group()
+
         # 4) preload effects
         for effect_id in effect_ids:
             self._status = f"Preloading effect: {effect_id}"
@@ -248,6 +310,12 @@ class PreloadScene(BaseScene):
             dummy.kill()
             yield
 
+        # 4) หมุนเฟรมลูกธนู / ลูกไฟ / หินบอส ทุกช่องมุมไว้ใน resources.rotations (ตอนยิงจะไม่ต้อง rotate)
+        for projectile_id, homing in ProjectileNode.WARM_UP_IDS.items():
+            self._status = f"Preloading projectile rotations: {projectile_id}"
+            ProjectileNode.warm_up_rotations(resources, projectile_id, homing=homing)
+            yield
+
                 # 4) Warm up SlashEffectNode (สร้างเฟรมไว้ใน cache เพื่อลดกระตุกตอนฟัน)
         #
         # NOTE สำคัญ:
@@ -294,5 +362,8 @@ class PreloadScene(BaseScene):
                 dummy.kill()
                 yield
 
+        # รูปที่ decode ไว้แต่ไม่มีใครหยิบไปใช้ (เช่นเฟรมที่ไม่ต่อเลข) ไม่ต้องค้างไว้ใน memory
+        resources.clear_staged()
+
         self._status = "Done"
         return
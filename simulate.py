@@ -0,0 +1,189 @@
+# simulate.py
+# รัน GameScene แบบ headless (ไม่มีหน้าต่าง / ไม่มีเสียง / ไม่วาด) เร็วที่สุดเท่าที่เครื่องไหว
+# ใช้ balance ด่าน (รันหลายร้อยไฟต์) และวัด throughput ของ AI + collision แยกจากการวาด
+#
+# วิธีรัน (จาก root ของโปรเจกต์):
+#   python simulate.py                                   # level01, ผู้เล่นเดิน/ฟันแบบสุ่ม 10 ไฟต์
+#   python simulate.py --level level03 --fights 200 --seconds 90 --seed 7
+#   python simulate.py --script kite.json                # input ตามสคริปต์ (ดู ScriptedController)
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+import pygame
+
+from core.game_app import GameApp
+from scenes.game_scene import GameScene
+
+_SHOOT_EVENT = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" ", scancode=0)
+
+
+# ---------------------------------------------------------------------------
+# Controllers: แทนคีย์บอร์ด (PlayerNode อ่าน game.player_controller.move)
+# ---------------------------------------------------------------------------
+class RandomController:
+    """เปลี่ยนทิศเดิน (8 ทิศ หรือยืนนิ่ง) ทุก ๆ hold วินาที และกดโจมตีตามโอกาส shoot_rate ต่อวินาที"""
+
+    DIRECTIONS = [(0, 0)] + [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+    def __init__(self, seed: int | None = None, hold: float = 0.6, shoot_rate: float = 3.0) -> None:
+        self.rng = random.Random(seed)
+        self.hold = hold
+        self.shoot_rate = shoot_rate
+        self.move = pygame.Vector2()
+        self.shoot = False
+        self._timer = 0.0
+
+    def update(self, scene: GameScene, dt: float) -> None:
+        self._timer -= dt
+        if self._timer <= 0:
+            self._timer = self.hold
+            self.move.update(self.rng.choice(self.DIRECTIONS))
+        self.shoot = self.rng.random() < self.shoot_rate * dt
+
+
+class ScriptedController:
+    """
+    เล่นตามลำดับ step ซ้ำไปเรื่อย ๆ
+    step = {"t": วินาที, "move": [dx, dy], "shoot": true/false}  (shoot = กดโจมตีทุก step ของช่วงนั้น)
+    """
+
+    def __init__(self, steps: Sequence[dict]) -> None:
+        if not steps:
+            raise ValueError("script must contain at least one step")
+        self.steps = list(steps)
+        self.move = pygame.Vector2()
+        self.shoot = False
+        self._index = -1
+        self._timer = 0.0
+
+    @classmethod
+    def from_file(cls, path: str) -> "ScriptedController":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def update(self, scene: GameScene, dt: float) -> None:
+        self._timer -= dt
+        if self._timer <= 0:
+            self._index = (self._index + 1) % len(self.steps)
+            step = self.steps[self._index]
+            self._timer = float(step.get("t", 1.0))
+            self.move.update(step.get("move", (0, 0)))
+        self.shoot = bool(self.steps[self._index].get("shoot", False))
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+@dataclass
+class FightResult:
+    outcome: str            # "dead" | "clear" | "timeout"
+    steps: int
+    sim_seconds: float
+    wall_seconds: float
+    player_hp: float
+    enemies_alive: int
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+
+def run_fight(
+    game: GameApp,
+    level_id: str,
+    controller,
+    max_seconds: float = 120.0,
+    seed: int | None = None,
+) -> FightResult:
+    """
+    สร้าง GameScene ใหม่แล้ว step update ทีละ game.sim_dt จนผู้เล่นตาย / เคลียร์ด่าน / หมดเวลา
+    (หยุดก่อน GameScene จะ push GameOverScene หรือสร้างด่านถัดไปเอง)
+    seed: reseed game.rng ก่อนเริ่ม -> seed + input เดิมได้ผลเดิมทุกครั้ง
+    """
+    if seed is not None:
+        game.rng.reseed(seed)
+    scene = GameScene(game, level_id=level_id)
+    game.scene_manager.set_scene(scene)
+    game.player_controller = controller
+
+    dt = game.sim_dt
+    max_steps = int(max_seconds / dt)
+    steps = 0
+    outcome = "timeout"
+    start = time.perf_counter()
+    while steps < max_steps:
+        controller.update(scene, dt)
+        if controller.shoot:
+            scene.handle_events([_SHOOT_EVENT])
+        scene.update(dt)
+        steps += 1
+        if scene.player.is_dead:
+            outcome = "dead"
+            break
+        if scene.stage_clear:
+            outcome = "clear"
+            break
+    wall = time.perf_counter() - start
+
+    game.player_controller = None
+    return FightResult(
+        outcome=outcome,
+        steps=steps,
+        sim_seconds=steps * dt,
+        wall_seconds=wall,
+        player_hp=scene.player.stats.hp,
+        enemies_alive=sum(1 for e in scene.enemies if not e.is_dead),
+    )
+
+
+def summarize(results: List[FightResult]) -> Tuple[dict, float]:
+    """(จำนวนผลแต่ละแบบ, sim step ต่อวินาทีรวมทุกไฟต์)"""
+    outcomes: dict = {}
+    for r in results:
+        outcomes[r.outcome] = outcomes.get(r.outcome, 0) + 1
+    steps = sum(r.steps for r in results)
+    wall = sum(r.wall_seconds for r in results)
+    return outcomes, (steps / wall if wall > 0 else 0.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run GameScene headless for balancing / load testing")
+    parser.add_argument("--level", default="level01")
+    parser.add_argument("--fights", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=120.0, help="max sim time per fight")
+    parser.add_argument("--seed", type=int, default=0, help="seed ของ game.rng และ RandomController (ไฟต์ที่ i ใช้ seed + i)")
+    parser.add_argument("--script", default=None, help="JSON list ของ step สำหรับ ScriptedController")
+    parser.add_argument("--player", default="hero", help="player_type")
+    args = parser.parse_args()
+
+    game = GameApp(headless=True)
+    game.selected_player_type = args.player
+
+    results: List[FightResult] = []
+    for i in range(args.fights):
+        if args.script:
+            controller = ScriptedController.from_file(args.script)
+        else:
+            controller = RandomController(seed=args.seed + i)
+        r = run_fight(game, args.level, controller, args.seconds, seed=args.seed + i)
+        results.append(r)
+        print(
+            f"[simulate] fight {i + 1}/{args.fights}: {r.outcome:<7} "
+            f"sim {r.sim_seconds:6.1f}s  hp {r.player_hp:5.0f}  enemies left {r.enemies_alive:3d}  "
+            f"{r.steps_per_second:8.0f} steps/s"
+        )
+
+    outcomes, sps = summarize(results)
+    print(f"[simulate] {args.level}: {outcomes}  {sps:.0f} sim steps/s ({sps * game.sim_dt:.1f}x realtime)")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
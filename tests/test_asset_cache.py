@@ -0,0 +1,95 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Set dummy video driver for headless testing
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import pygame
+
+from core import asset_cache
+from core.resource_manager import ResourceManager
+
+
+class TestPrescaledCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = self.tmp.name
+        self.graphics = os.path.join(self.base, "graphics")
+        self.source = os.path.join(self.graphics, "images", "enemy", "orc", "idle_down_01.png")
+        os.makedirs(os.path.dirname(self.source))
+
+        surf = pygame.Surface((40, 20), pygame.SRCALPHA)
+        surf.fill((200, 30, 60, 128))
+        pygame.image.save(surf, self.source)
+
+        self.cache_dir = os.path.join(self.base, *asset_cache.PRESCALED_SUBDIR)
+        os.makedirs(self.cache_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_keeps_straight_alpha(self):
+        surf = pygame.Surface((3, 2), pygame.SRCALPHA)
+        surf.fill((57, 58, 57, 35))
+        path = os.path.join(self.cache_dir, "x.rgba")
+        asset_cache.save_surface(surf, path)
+        loaded = asset_cache.load_surface(path)
+        self.assertEqual(pygame.image.tobytes(loaded, "RGBA"), pygame.image.tobytes(surf, "RGBA"))
+
+    def test_resource_manager_prefers_prescaled_file(self):
+        marker = pygame.Surface((10, 5), pygame.SRCALPHA)
+        marker.fill((1, 2, 3, 255))
+        target = asset_cache.prescaled_path(self.cache_dir, self.graphics, self.source, 0.25)
+        asset_cache.save_surface(marker, target)
+
+        rm = ResourceManager(base_path=self.base, sprite_scale=0.25)
+        image = rm.load_image("enemy/orc/idle_down_01.png")
+        self.assertEqual(image.get_size(), (10, 5))
+        self.assertEqual(tuple(image.get_at((0, 0))), (1, 2, 3, 255))
+
+    def test_falls_back_when_source_changed(self):
+        marker = pygame.Surface((10, 5), pygame.SRCALPHA)
+        target = asset_cache.prescaled_path(self.cache_dir, self.graphics, self.source, 0.25)
+        asset_cache.save_surface(marker, target)
+
+        # ต้นฉบับถูกแก้ -> เนื้อไฟล์ไม่ตรงกับชื่อไฟล์ cache
+        edited = pygame.Surface((40, 20), pygame.SRCALPHA)
+        edited.fill((10, 220, 60, 255))
+        pygame.image.save(edited, self.source)
+
+        rm = ResourceManager(base_path=self.base, sprite_scale=0.25)
+        image = rm.load_image("enemy/orc/idle_down_01.png")
+        self.assertEqual(image.get_size(), (10, 5))
+        self.assertEqual(tuple(image.get_at((0, 0))), (10, 220, 60, 255))
+
+    def test_copy_without_mtime_still_hits_cache(self):
+        """PyInstaller / git clone ไม่รักษา mtime -> cache ต้องยังใช้ได้"""
+        marker = pygame.Surface((10, 5), pygame.SRCALPHA)
+        marker.fill((1, 2, 3, 255))
+        target = asset_cache.prescaled_path(self.cache_dir, self.graphics, self.source, 0.25)
+        asset_cache.save_surface(marker, target)
+
+        copied = os.path.join(self.base, "bundle")
+        shutil.copytree(self.base, copied, copy_function=shutil.copyfile, ignore=shutil.ignore_patterns("bundle"))
+        copied_source = os.path.join(copied, "graphics", "images", "enemy", "orc", "idle_down_01.png")
+        st = os.stat(copied_source)
+        os.utime(copied_source, (st.st_atime, st.st_mtime + 1000))
+
+        rm = ResourceManager(base_path=copied, sprite_scale=0.25)
+        image = rm.load_image("enemy/orc/idle_down_01.png")
+        self.assertEqual(tuple(image.get_at((0, 0))), (1, 2, 3, 255))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Set dummy video driver for headless testing
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import pygame
+
+from core.asset_loader import AssetLoader
+from core.resource_manager import ResourceManager
+
+
+class TestAssetLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = self.tmp.name
+        folder = os.path.join(self.base, "graphics", "images", "enemy", "orc")
+        os.makedirs(folder)
+        self.paths = []
+        for i in range(6):
+            surf = pygame.Surface((40, 20 + i), pygame.SRCALPHA)
+            surf.fill((10 * i, 200, 30, 128 + i))
+            name = f"idle_down_{i + 1:02d}.png"
+            pygame.image.save(surf, os.path.join(folder, name))
+            self.paths.append(f"enemy/orc/{name}")
+        self.rm = ResourceManager(base_path=self.base, sprite_scale=0.5)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_decoded_images_match_load_image(self):
+        loader = AssetLoader(self.rm, max_workers=3)
+        try:
+            self.assertEqual(loader.submit([(p, None) for p in self.paths] + [("enemy/orc/missing.png", None)]), 6)
+            loader.wait()
+        finally:
+            loader.shutdown()
+
+        self.assertEqual((loader.files_done, loader.files_total), (6, 6))
+        self.assertEqual(loader.bytes_done, loader.bytes_total)
+        self.assertEqual(loader.progress, 1.0)
+        self.assertEqual(loader.failed, [])
+
+        reference = ResourceManager(base_path=self.base, sprite_scale=0.5)
+        for path in self.paths:
+            self.assertTrue(self.rm.has_image(path))
+            staged = self.rm.load_image(path, cache=False)
+            expected = reference.load_image(path)
+            self.assertEqual(pygame.image.tobytes(staged, "RGBA"), pygame.image.tobytes(expected, "RGBA"))
+            # cache=False -> หยิบแล้วหายจาก staged
+            self.assertFalse(self.rm.has_image(path))
+
+    def test_skips_images_already_loaded(self):
+        self.rm.load_image(self.paths[0])
+        loader = AssetLoader(self.rm, max_workers=1)
+        try:
+            self.assertEqual(loader.submit([(self.paths[0], None), (self.paths[1], None), (self.paths[1], None)]), 1)
+            loader.wait()
+        finally:
+            loader.shutdown()
+        self.assertEqual(self.rm.clear_staged(), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
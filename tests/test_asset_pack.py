@@ -0,0 +1,108 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Set dummy video driver for headless testing
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import pygame
+
+from core import asset_cache
+from core.asset_pack import AssetPack, PACK_SUBPATH, write_pack
+from core.resource_manager import ResourceManager
+
+
+def _noise(rng, w, h):
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    for x in range(w):
+        for y in range(h):
+            surf.set_at((x, y), (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(256)))
+    return surf
+
+
+class TestAssetPack(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((1, 1))
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.base = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_is_exact(self):
+        rng = random.Random(3)
+        surfaces = {f"images/x/{i}@1_0": _noise(rng, rng.randint(1, 13), rng.randint(1, 9)) for i in range(6)}
+        path = os.path.join(self.base, "test.pack")
+        self.assertEqual(write_pack(path, surfaces.items()), 6)
+
+        pack = AssetPack(path)
+        try:
+            self.assertEqual(set(pack.keys()), set(surfaces))
+            self.assertNotIn("missing", pack)
+            self.assertIsNone(pack.load("missing"))
+            for key, original in surfaces.items():
+                loaded = pack.load(key)
+                self.assertEqual(loaded.get_size(), original.get_size())
+                self.assertEqual(pygame.image.tobytes(loaded, "RGBA"), pygame.image.tobytes(original, "RGBA"))
+        finally:
+            pack.close()
+
+    def test_rejects_foreign_file(self):
+        path = os.path.join(self.base, "bogus.pack")
+        with open(path, "wb") as f:
+            f.write(b"\x89PNG" + b"\0" * 64)
+        with self.assertRaises(ValueError):
+            AssetPack(path)
+
+    def _write_packed_tree(self):
+        """assets/ ที่มีรูปต้นฉบับ 1 รูป + pack ที่เก็บรูป marker ไว้แทน (เห็นได้ว่าโหลดจาก pack)"""
+        graphics = os.path.join(self.base, "graphics")
+        source = os.path.join(graphics, "images", "items", "potion.png")
+        os.makedirs(os.path.dirname(source))
+        surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+        surf.fill((200, 30, 60, 255))
+        pygame.image.save(surf, source)
+
+        marker = pygame.Surface((4, 2), pygame.SRCALPHA)
+        marker.fill((1, 2, 3, 255))
+        key = asset_cache.entry_key(graphics, source, 1.0)
+        write_pack(os.path.join(self.base, *PACK_SUBPATH), [(key, marker)])
+
+    def _assert_loads_from_pack(self, base_path):
+        rm = ResourceManager(base_path=base_path)
+        try:
+            self.assertIsNotNone(rm.pack)
+            image = rm.load_image("items/potion.png")
+            self.assertEqual(image.get_size(), (4, 2))
+            self.assertEqual(tuple(image.get_at((0, 0))), (1, 2, 3, 255))
+        finally:
+            rm.pack.close()
+
+    def test_resource_manager_prefers_pack(self):
+        self._write_packed_tree()
+        self._assert_loads_from_pack(self.base)
+
+    def test_pack_still_hits_after_copy_without_mtime(self):
+        """PyInstaller (COLLECT) copy ไฟล์ด้วย shutil.copyfile -> mtime ใหม่หมด แต่ pack ต้องยังใช้ได้"""
+        self._write_packed_tree()
+        bundle = os.path.join(self.base, "dist", "assets")
+        shutil.copytree(self.base, bundle, copy_function=shutil.copyfile, ignore=shutil.ignore_patterns("dist"))
+        source = os.path.join(bundle, "graphics", "images", "items", "potion.png")
+        st = os.stat(source)
+        os.utime(source, (st.st_atime, st.st_mtime + 1000))
+
+        self._assert_loads_from_pack(bundle)
+
+
+if __name__ == '__main__':
+    unittest.main()
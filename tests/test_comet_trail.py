@@ -0,0 +1,92 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from core.node_pool import NodePool
+from entities.projectile_node import ArrowCometTrailNode
+
+
+class _Dot(pygame.sprite.Sprite):
+    def __init__(self, group, pos, velocity):
+        super().__init__(group)
+        self.pos = pygame.Vector2(pos)
+        self.velocity = pygame.Vector2(velocity)
+        self.rect = pygame.Rect(0, 0, 4, 4)
+        self.rect.center = pos
+
+    def update(self, dt):
+        self.pos += self.velocity * dt
+        self.rect.center = (round(self.pos.x), round(self.pos.y))
+
+
+class TestArrowCometTrail(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.group = pygame.sprite.Group()
+
+    def _fly(self, dot, trail, frames, dt=1 / 60):
+        for _ in range(frames):
+            dot.update(dt)
+            trail.update(dt)
+
+    def _alpha_at(self, trail, world_pos):
+        return trail.image.get_at((world_pos[0] - trail.rect.x, world_pos[1] - trail.rect.y)).a
+
+    def _max_alpha(self, surf):
+        return max(surf.get_at((x, y)).a for x in range(surf.get_width()) for y in range(surf.get_height()))
+
+    def test_canvas_is_reused_while_flying(self):
+        dot = _Dot(self.group, (100, 100), (650, 0))
+        trail = ArrowCometTrailNode(dot, self.group)
+        self._fly(dot, trail, 20)
+        canvas = trail._canvas
+        self._fly(dot, trail, 120)  # วิ่งไกลกว่าขนาด canvas หลายเท่า -> scroll แทนการสร้างใหม่
+        self.assertIs(trail._canvas, canvas)
+        self.assertIs(trail.image.get_parent(), canvas)
+        self.assertTrue(trail.rect.collidepoint(dot.rect.center))
+
+    def test_trail_fades_when_projectile_stops(self):
+        dot = _Dot(self.group, (100, 100), (650, 0))
+        trail = ArrowCometTrailNode(dot, self.group, life=0.18)
+        self._fly(dot, trail, 10)
+        head = dot.rect.center
+        bright = self._alpha_at(trail, head)
+
+        dot.velocity.update(0, 0)
+        self._fly(dot, trail, 3)
+        self.assertLess(self._alpha_at(trail, head), bright)
+
+        self._fly(dot, trail, 15)  # ทุกจุดหมดอายุ -> ไม่เหลือภาพ
+        self.assertIsNone(trail._live)
+        self.assertEqual(trail.image.get_size(), (1, 1))
+
+    def test_pooled_trail_starts_with_clean_canvas(self):
+        pool = NodePool()
+        dot = _Dot(self.group, (100, 100), (650, 0))
+        trail = ArrowCometTrailNode.from_pool(pool, dot, self.group)
+        self._fly(dot, trail, 10)
+        canvas = trail._canvas
+        trail.kill()
+
+        dot2 = _Dot(self.group, (400, 400), (0, 650))
+        again = ArrowCometTrailNode.from_pool(pool, dot2, self.group)
+        self.assertIs(again, trail)
+        self.assertIs(again._canvas, canvas)
+        self.assertEqual(self._max_alpha(canvas), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
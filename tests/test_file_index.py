@@ -0,0 +1,54 @@
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.resource_manager import ResourceManager
+
+
+class TestFileIndex(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base = self._tmp.name
+        for rel in (
+            "graphics/images/enemy/orc/idle/idle_down_01.png",
+            "graphics/images/enemy/orc/idle/idle_down_02.png",
+            "graphics/images/enemy/orc/idle/idle_down_04.png",
+            "graphics/images/enemy/orc/charge/charge_down.png",
+            "graphics/tiles/dungeon.png",
+        ):
+            path = os.path.join(self.base, *rel.split("/"))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "wb").close()
+        self.resources = ResourceManager(base_path=self.base)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_image_exists_uses_same_paths_as_load_image(self):
+        self.assertTrue(self.resources.image_exists("enemy/orc/charge/charge_down.png"))
+        self.assertTrue(self.resources.image_exists("tiles/dungeon.png"))
+        self.assertTrue(self.resources.image_exists("assets/graphics/images/tiles/dungeon.png"))
+        self.assertFalse(self.resources.image_exists("enemy/orc/charge/charge_down_01.png"))
+
+    def test_frame_sequence_stops_at_first_gap(self):
+        self.assertEqual(
+            self.resources.frame_sequence("enemy/orc/idle/idle_down"),
+            ["enemy/orc/idle/idle_down_01.png", "enemy/orc/idle/idle_down_02.png"],
+        )
+        self.assertEqual(self.resources.frame_sequence("enemy/orc/idle/idle_up"), [])
+
+    def test_index_is_built_once_until_rescan(self):
+        self.resources.image_exists("tiles/dungeon.png")
+        open(os.path.join(self.base, "graphics", "tiles", "forest.png"), "wb").close()
+        self.assertFalse(self.resources.image_exists("tiles/forest.png"))
+
+        self.resources.rescan_files()
+        self.assertTrue(self.resources.image_exists("tiles/forest.png"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from core.resource_manager import ResourceManager
+from world.level_data import load_level
+from world.level_manifest import build_manifest, missing_requests, release_unused
+
+
+class TestLevelManifest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.resources = ResourceManager(use_prescaled=False)
+
+    def test_manifest_covers_level_json(self):
+        level = load_level("level01")
+        manifest = build_manifest(level, self.resources)
+
+        self.assertEqual(manifest.level_id, level.id)
+        self.assertIn((f"tiles/{level.tileset}", None), manifest.images)
+        self.assertEqual(manifest.enemy_ids, sorted({s["type"] for s in level.enemy_spawns}))
+        self.assertEqual(len(manifest.images), len(set(manifest.images)))
+        for path, _ in manifest.images:
+            self.assertTrue(os.path.exists(self.resources.image_source_path(path)), path)
+
+    def test_only_missing_assets_are_requested(self):
+        manifest = build_manifest("level01", self.resources)
+        enemies, requests = missing_requests(manifest, self.resources)
+        self.assertEqual(enemies, manifest.enemy_ids)
+
+        path, scale = manifest.images[0]
+        self.resources.load_image(path, scale_override=scale)
+        _, requests_after = missing_requests(manifest, self.resources)
+        self.assertNotIn((path, scale), requests_after)
+        self.assertEqual(len(requests_after), len(requests) - 1)
+
+    def test_release_unused_drops_only_old_level_assets(self):
+        old = build_manifest("level01", self.resources)
+        new = build_manifest("level02", self.resources)
+        for path, scale in old.images:
+            self.resources.load_image(path, scale_override=scale)
+
+        release_unused(self.resources, old, new)
+
+        for path, scale in old.images:
+            expected = (path, scale) in new.images
+            self.assertEqual(self.resources.has_image(path, scale), expected, path)
+
+
+if __name__ == "__main__":
+    unittest.main()
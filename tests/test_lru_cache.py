@@ -0,0 +1,118 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from core.lru_cache import LRUCache
+from core.resource_manager import ResourceManager, surface_bytes
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used_over_budget(self):
+        cache = LRUCache(budget_bytes=100)
+        cache.put("a", 1, 40)
+        cache.put("b", 2, 40)
+        self.assertEqual(cache.get("a"), 1)  # a ใช้ล่าสุด -> b เก่าสุด
+        cache.put("c", 3, 40)
+
+        self.assertNotIn("b", cache)
+        self.assertEqual(list(cache), ["a", "c"])
+        self.assertEqual(cache.bytes, 80)
+
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions), (1, 0, 1))
+
+    def test_pinned_entries_survive_until_tag_changes(self):
+        cache = LRUCache(budget_bytes=100)
+        cache.set_pin_tag("level01")
+        cache.put("tileset", "t1", 80)
+        cache.set_pin_tag("level02")
+        # ด่านใหม่ใช้ tileset เดิมซ้ำ -> pin ต่อด้วย tag ใหม่
+        cache.get("tileset")
+        cache.put("enemy", "e", 60)
+
+        # เกินงบแต่ทุกตัวถูก pin -> ไม่ไล่ทิ้ง
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats().pinned_bytes, 140)
+
+        cache.set_pin_tag("level03")
+        # ปล่อย pin ของ level02 -> ไล่ตัวเก่าสุดจนไม่เกินงบ
+        self.assertEqual(list(cache), ["enemy"])
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_max_entries_and_miss_count(self):
+        cache = LRUCache(max_entries=2)
+        self.assertIsNone(cache.get("x"))
+        for key in "abc":
+            cache.put(key, key, 0)
+        self.assertEqual(list(cache), ["b", "c"])
+        self.assertEqual(cache.stats().misses, 1)
+
+    def test_child_entry_is_evicted_with_parent(self):
+        cache = LRUCache(budget_bytes=100)
+        cache.put("sheet", "s", 60)
+        cache.put("tiles", "t", 0, parent="sheet")
+        cache.put("other", "o", 30)
+        cache.get("tiles")  # ใช้ table = ใช้ sheet ด้วย -> other เก่าสุด
+        cache.put("new", "n", 30)
+        self.assertEqual(list(cache), ["sheet", "tiles", "new"])
+
+        cache.put("big", "b", 50)  # ไล่ sheet -> tiles ต้องออกไปด้วย
+        self.assertNotIn("sheet", cache)
+        self.assertNotIn("tiles", cache)
+        self.assertEqual(cache.bytes, 80)
+
+    def test_all_pinned_stops_eviction_scan(self):
+        cache = LRUCache(budget_bytes=10)
+        cache.set_pin_tag("level01")
+        for i in range(5):
+            cache.put(i, i, 10)
+        self.assertEqual(len(cache), 5)
+        self.assertEqual(cache.bytes, 50)
+        self.assertEqual(cache.stats().evictions, 0)
+
+
+class TestResourceCacheBytes(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def _held_bytes(self, rm):
+        """byte ของ pixel ที่ cache ยึดไว้จริง (รูปแม่ของ subsurface นับครั้งเดียว)"""
+        sheets = {}
+        for key in rm._surfaces:
+            value = rm._surfaces._entries[key][0]
+            surfaces = value if isinstance(value, list) else [value]
+            for surf in surfaces:
+                root = surf
+                while root.get_parent() is not None:
+                    root = root.get_parent()
+                sheets[id(root)] = root
+        return sum(surface_bytes(s) for s in sheets.values())
+
+    def test_tile_table_bytes_match_held_pixels_under_pressure(self):
+        rm = ResourceManager(use_prescaled=False)
+        sheet = rm.load_image("tiles/overworld_level_01.png")
+        rm._surfaces.budget_bytes = surface_bytes(sheet) * 2
+        rm.load_tile_table("tiles/overworld_level_01.png", 32)
+        self.assertEqual(rm._surfaces.bytes, self._held_bytes(rm))
+
+        # โหลดรูปอื่นจนเกินงบ -> tileset ถูกไล่ พร้อม tile table
+        for name in ("overworld_level_02", "overworld_level_04", "overworld_level_05"):
+            rm.load_image(f"tiles/{name}.png")
+            self.assertEqual(rm._surfaces.bytes, self._held_bytes(rm))
+        self.assertNotIn(("tiles", "tiles/overworld_level_01.png", 32), rm._surfaces)
+        self.assertLessEqual(rm._surfaces.bytes, rm._surfaces.budget_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+import gc
+import os
+import sys
+import unittest
+import weakref
+from types import SimpleNamespace
+from unittest import mock
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from combat.damage_system import DamagePacket
+from core.node_pool import NodePool
+from core.resource_manager import ResourceManager
+from entities.projectile_node import ArrowCometTrailNode, ProjectileNode
+from world.level_manifest import switch_level
+
+
+class _Owner:
+    """ผู้ยิงแบบย่อ (weakref ได้ ต่างจาก SimpleNamespace)"""
+
+    def __init__(self, game):
+        self.game = game
+        self.equipment = None
+
+
+class TestNodePool(unittest.TestCase):
+    def test_release_is_idempotent_and_bounded(self):
+        class Node:
+            pass
+
+        pool = NodePool(max_free_per_type=1)
+        a, b = Node(), Node()
+        pool.release(a)
+        pool.release(a)
+        pool.release(b)
+        self.assertEqual(pool.free_count(Node), 1)
+        self.assertIs(pool.acquire(Node), a)
+        self.assertIsNone(pool.acquire(Node))
+
+
+class TestProjectilePooling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.game = SimpleNamespace(
+            resources=ResourceManager(use_prescaled=False),
+            node_pool=NodePool(),
+            enemies=pygame.sprite.Group(),
+        )
+        self.owner = _Owner(self.game)
+        self.group = pygame.sprite.Group()
+
+    def _fire(self, direction=(1, 0), theme="storm"):
+        return ProjectileNode.spawn(
+            self.owner, (100, 100), pygame.Vector2(direction), 650,
+            DamagePacket(base=1.0), "arrow", 1.5, self.group, trail_theme=theme,
+        )
+
+    def test_killed_projectile_and_trail_are_reused(self):
+        first = self._fire()
+        trail = next(s for s in self.group if isinstance(s, ArrowCometTrailNode))
+        first.kill()
+        trail.update(0.016)  # projectile หาย -> trail kill ตัวเอง
+
+        second = self._fire(direction=(0, 1))
+        self.assertIs(second, first)
+        self.assertTrue(second.alive())
+        self.assertEqual(second.age, 0.0)
+        self.assertIn(trail, self.group)
+        self.assertIs(trail._target(), second)
+
+    def test_old_trail_detaches_when_projectile_is_recycled(self):
+        first = self._fire()
+        old_trail = next(s for s in self.group if isinstance(s, ArrowCometTrailNode))
+        first.kill()
+        second = self._fire()  # ได้ลูกเดิมกลับมาก่อน trail เก่าจะ update
+        self.assertIs(second, first)
+        self.assertIsNone(old_trail._target())
+        old_trail.update(0.016)
+        self.assertFalse(old_trail.alive())
+
+    def test_released_projectile_drops_level_references(self):
+        proj = self._fire()
+        trail = next(s for s in self.group if isinstance(s, ArrowCometTrailNode))
+        proj.target = object()
+        proj.kill()
+        trail.update(0.016)
+
+        self.assertEqual(self.game.node_pool.free_count(ProjectileNode), 1)
+        self.assertIsNone(proj.owner)
+        self.assertIsNone(proj.target)
+        self.assertIsNone(proj.damage_packet)
+        self.assertEqual(self.game.node_pool.free_count(ArrowCometTrailNode), 1)
+        self.assertIsNone(trail._target())
+
+        # ผู้ยิงไม่ถูก pool ยึดไว้แล้ว
+        owner_ref = weakref.ref(self.owner)
+        self.owner = None
+        gc.collect()
+        self.assertIsNone(owner_ref())
+
+    def test_switch_level_clears_pool(self):
+        self._fire().kill()
+        self.game.level_manifest = SimpleNamespace(level_id="level01")
+        switch_level(self.game, SimpleNamespace(level_id="level01"))  # ด่านเดิม -> เก็บไว้
+        self.assertEqual(self.game.node_pool.free_count(ProjectileNode), 1)
+
+        with mock.patch("world.level_manifest.release_unused", return_value=0):
+            switch_level(self.game, SimpleNamespace(level_id="level02"))
+        self.assertEqual(self.game.node_pool.free_count(ProjectileNode), 0)
+
+    def test_snapped_rotations_are_shared(self):
+        a = self._fire(direction=(1, 1))
+        b = self._fire(direction=(1, 1.05))
+        c = self._fire(direction=(-1, 0))
+        self.assertIs(a.frames[0], b.frames[0])
+        self.assertIsNot(a.frames[0], c.frames[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
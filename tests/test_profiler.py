@@ -0,0 +1,87 @@
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.profiler import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    def test_disabled_records_nothing(self):
+        prof = Profiler()
+        with prof.scope("update"):
+            pass
+        prof.begin("draw")
+        prof.end("draw")
+        prof.end_frame()
+        self.assertEqual(prof.stats(), [])
+        self.assertIs(prof.scope("a"), prof.scope("b"))
+
+    def test_scopes_sum_within_a_frame(self):
+        prof = Profiler(enabled=True)
+        prof._add("sim", 1_000_000)
+        prof._add("sim", 2_000_000)
+        prof.end_frame()
+        prof._add("sim", 1_000_000)
+        prof.end_frame()
+
+        (stats,) = prof.stats()
+        self.assertEqual(stats.name, "sim")
+        self.assertEqual(stats.frames, 2)
+        self.assertAlmostEqual(stats.avg_ms, 2.0)
+        self.assertAlmostEqual(stats.max_ms, 3.0)
+
+    def test_missing_scope_counts_as_zero_and_window_rolls(self):
+        prof = Profiler(window=100, enabled=True)
+        for i in range(150):
+            if i % 2 == 0:
+                prof._add("spawn", (i + 1) * 1_000_000)
+            prof.end_frame()
+
+        (stats,) = prof.stats()
+        self.assertEqual(stats.frames, 100)
+        # 100 เฟรมล่าสุด = i 50..149, ครึ่งหนึ่งเป็น 0
+        self.assertAlmostEqual(stats.max_ms, 149.0)
+        self.assertAlmostEqual(stats.p99_ms, 149.0)
+        self.assertAlmostEqual(stats.avg_ms, sum(range(51, 150, 2)) / 100)
+
+    def test_context_and_begin_end_measure_time(self):
+        prof = Profiler(enabled=True)
+        with prof.scope("draw.tilemap"):
+            sum(range(10000))
+        prof.begin("draw.hud")
+        sum(range(10000))
+        prof.end("draw.hud")
+        prof.end("never_started")
+        prof.end_frame()
+        names = [s.name for s in prof.stats()]
+        self.assertEqual(names, ["draw.hud", "draw.tilemap"])
+        self.assertTrue(all(s.avg_ms > 0 for s in prof.stats()))
+
+    def test_dump_csv(self):
+        prof = Profiler(enabled=True)
+        prof._add("flip", 500_000)
+        prof.end_frame()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = prof.dump_csv(os.path.join(tmp, "out", "profile.csv"))
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(rows[0], ["scope", "avg_ms", "p99_ms", "max_ms", "frames"])
+        self.assertEqual(rows[1][0], "flip")
+        self.assertAlmostEqual(float(rows[1][1]), 0.5)
+
+    def test_toggle_resets_samples(self):
+        prof = Profiler(enabled=True)
+        prof._add("sim", 1_000_000)
+        prof.end_frame()
+        self.assertFalse(prof.toggle())
+        self.assertTrue(prof.toggle())
+        self.assertEqual(prof.stats(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
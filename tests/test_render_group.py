@@ -0,0 +1,93 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from core.render_group import ZOrderedGroup
+from entities.node_base import NodeBase
+
+
+class _Actor(NodeBase):
+    y_sort = True
+
+    def __init__(self, bottom, *groups):
+        super().__init__(*groups)
+        self.rect.bottom = bottom
+
+
+class _Effect(NodeBase):
+    pass
+
+
+class _Decor(NodeBase):
+    y_sort = True
+    static_render = True
+
+    def __init__(self, rect, *groups):
+        super().__init__()
+        self.rect = rect
+        self.add(*groups)
+
+
+def _order(group_or_buckets):
+    buckets = group_or_buckets
+    if isinstance(group_or_buckets, ZOrderedGroup):
+        buckets = group_or_buckets.buckets()
+    return [(z, list(sprites)) for z, sprites in buckets]
+
+
+class TestZOrderedGroup(unittest.TestCase):
+    def test_buckets_follow_z_and_y_sort_only_actors(self):
+        group = ZOrderedGroup()
+        front = _Effect(group)
+        front.z = 20
+        low = _Actor(200, group)
+        effect = _Effect(group)
+        high = _Actor(100, group)
+        back = _Effect(group)
+        back.z = -10
+
+        self.assertEqual(
+            _order(group),
+            [(-10, [back]), (0, [high, low, effect]), (20, [front])],
+        )
+
+        # actor เดินลงมาอยู่ต่ำกว่า -> ต้องวาดทีหลัง
+        high.rect.bottom = 300
+        self.assertEqual(_order(group)[1], (0, [low, high, effect]))
+
+    def test_kill_and_change_z_keep_buckets_in_sync(self):
+        group = ZOrderedGroup()
+        other = pygame.sprite.Group()
+        actor = _Actor(10, group, other)
+        effect = _Effect(group)
+
+        actor.z = 10
+        self.assertEqual(_order(group), [(0, [effect]), (10, [actor])])
+
+        actor.kill()
+        effect.kill()
+        self.assertEqual(_order(group), [])
+        self.assertEqual(len(group), 0)
+
+    def test_view_culls_dynamic_and_static_sprites(self):
+        group = ZOrderedGroup()
+        near = _Actor(100, group)
+        far = _Actor(5000, group)
+        tree = _Decor(pygame.Rect(50, 0, 40, 120), group)
+        far_tree = _Decor(pygame.Rect(4000, 4000, 40, 120), group)
+        back_tree = _Decor(pygame.Rect(0, 0, 40, 40), group)
+        back_tree.z = -10
+
+        view = pygame.Rect(0, 0, 800, 600)
+        # ต้นไม้ bottom=120 อยู่ต่ำกว่าตัวละคร (bottom=100) -> วาดทีหลัง
+        self.assertEqual(_order(group.buckets(view)), [(-10, [back_tree]), (0, [near, tree])])
+        self.assertEqual(sum(len(b) for _, b in group.buckets()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
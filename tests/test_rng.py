@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rng import RngService
+
+
+class TestRngService(unittest.TestCase):
+    def test_same_seed_gives_same_streams(self):
+        a = RngService(seed=42)
+        b = RngService(seed=42)
+        self.assertEqual([a.stream("combat").random() for _ in range(5)],
+                         [b.stream("combat").random() for _ in range(5)])
+
+    def test_streams_are_independent(self):
+        a = RngService(seed=42)
+        b = RngService(seed=42)
+        # ใช้ vfx ไปเยอะ ๆ ไม่ทำให้ลำดับของ combat เปลี่ยน
+        for _ in range(100):
+            a.stream("vfx").random()
+        self.assertEqual(a.stream("combat").random(), b.stream("combat").random())
+        self.assertNotEqual(RngService(seed=42).stream("vfx").random(), RngService(seed=42).stream("spawn").random())
+
+    def test_reseed_restarts_every_stream(self):
+        rng = RngService(seed=7)
+        first = [rng.stream("spawn").randint(0, 1000) for _ in range(3)]
+        rng.reseed(7)
+        self.assertEqual([rng.stream("spawn").randint(0, 1000) for _ in range(3)], first)
+        self.assertEqual(rng.seed, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from combat.damage_system import DamagePacket
+from core.resource_manager import ResourceManager
+from core.rotation_cache import RotationCache
+from entities.projectile_node import ProjectileNode
+
+
+class TestRotationCache(unittest.TestCase):
+    def test_bucket_wraps_into_0_360(self):
+        self.assertEqual(RotationCache.bucket(-180.0, 45.0), 180.0)
+        self.assertEqual(RotationCache.bucket(180.0, 45.0), 180.0)
+        self.assertEqual(RotationCache.bucket(-44.0, 45.0), 315.0)
+        self.assertEqual(RotationCache.bucket(12.4, 5.0), 10.0)
+        self.assertEqual(RotationCache.bucket(359.0, 5.0), 0.0)
+
+    def test_frames_are_rotated_once_per_bucket(self):
+        cache = RotationCache()
+        raw = [pygame.Surface((20, 4), pygame.SRCALPHA), pygame.Surface((20, 4), pygame.SRCALPHA)]
+        a = cache.frames("arrow", raw, 90.0)
+        b = cache.frames("arrow", raw, 90.0)
+        self.assertIs(b[0], a[0])
+        self.assertIs(b[1], a[1])
+        self.assertEqual(a[0].get_size(), (4, 20))
+        self.assertEqual(len(cache), 2)
+
+    def test_budget_evicts_least_recently_used_bucket(self):
+        raw = [pygame.Surface((10, 10), pygame.SRCALPHA)]
+        cache = RotationCache(budget_bytes=2 * 10 * 10 * 4)
+        zero = cache.frames("fire", raw, 0.0)[0]
+        cache.frames("fire", raw, 90.0)
+        cache.frames("fire", raw, 0.0)
+        cache.frames("fire", raw, 180.0)  # เกินงบ -> 90 ออก
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.frames("fire", raw, 0.0)[0], zero)
+        self.assertEqual(cache.stats().evictions, 1)
+
+    def test_warm_covers_every_bucket(self):
+        cache = RotationCache()
+        raw = [pygame.Surface((8, 2), pygame.SRCALPHA)]
+        self.assertEqual(cache.warm("fire", raw, 5.0), 72)
+        self.assertEqual(len(cache), 72)
+        self.assertEqual(cache.warm("fire", raw, 5.0), 72)
+        self.assertEqual(len(cache), 72)
+
+
+class TestProjectileRotation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.resources = ResourceManager(use_prescaled=False)
+        enemies = pygame.sprite.Group()
+        enemy = pygame.sprite.Sprite(enemies)
+        enemy.rect = pygame.Rect(0, 0, 10, 10)
+        enemy.rect.center = (100, 400)
+        self.game = SimpleNamespace(resources=self.resources, enemies=enemies)
+        self.owner = SimpleNamespace(game=self.game, equipment=None)
+
+    def _fly_homing(self):
+        proj = ProjectileNode(
+            self.owner, (100, 100), pygame.Vector2(1, 0), 300, DamagePacket(base=1.0),
+            "fire/fire2", 2.0, homing=True, homing_turn_rate=4.5,
+        )
+        angles = set()
+        for _ in range(60):
+            proj.update(1 / 60)
+            angles.add(proj._angle)
+            self.assertEqual(proj._angle % ProjectileNode.HOMING_ANGLE_STEP, 0.0)
+        return angles
+
+    def test_warm_up_covers_snapped_angles(self):
+        self.assertEqual(ProjectileNode.warm_up_rotations(self.resources, "arrow"), 8)
+        warmed = len(self.resources.rotations)
+        for direction in ((1, 0), (1, 1), (0, -1), (-1, 0.1)):
+            ProjectileNode(
+                self.owner, (100, 100), pygame.Vector2(direction), 650, DamagePacket(base=1.0), "arrow", 1.5,
+            )
+        self.assertEqual(len(self.resources.rotations), warmed)
+
+    def test_homing_turn_uses_warmed_rotations(self):
+        ProjectileNode.warm_up_rotations(self.resources, "fire/fire2", homing=True)
+        warmed = len(self.resources.rotations)
+        self.assertGreater(len(self._fly_homing()), 3)  # เลี้ยวผ่านหลายช่องมุม
+        self.assertEqual(len(self.resources.rotations), warmed)  # ไม่มีการหมุนรูปใหม่ระหว่างบิน
+
+    def test_homing_turn_rotates_each_bucket_once(self):
+        angles = self._fly_homing()
+        self.assertGreater(len(angles), 3)  # เลี้ยวผ่านหลายช่องมุม
+        n_frames = len(ProjectileNode.source_frames(self.resources, "fire/fire2"))
+        rotated = len(self.resources.rotations)
+        self.assertLessEqual(rotated, (len(angles) + 1) * n_frames)
+
+        self._fly_homing()  # ลูกที่สองเส้นทางเดิม -> ใช้รูปเดิมทั้งหมด
+        self.assertEqual(len(self.resources.rotations), rotated)
+
+
+if __name__ == "__main__":
+    unittest.main()
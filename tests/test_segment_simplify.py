@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from world.segment_simplify import simplify_segments
+
+
+def _seg(ax, ay, bx, by):
+    return (pygame.Vector2(ax, ay), pygame.Vector2(bx, by))
+
+
+class TestSimplifySegments(unittest.TestCase):
+    def test_square_loop_merges_to_four_sides(self):
+        """สี่เหลี่ยมที่มาจาก segment สั้น ๆ (ลำดับ/ทิศสลับกัน) ต้องเหลือ 4 ด้าน"""
+        segs = []
+        for x in range(0, 40, 4):
+            segs.append(_seg(x, 0, x + 4, 0))
+            segs.append(_seg(x + 4, 40, x, 40))
+        for y in range(0, 40, 4):
+            segs.append(_seg(40, y + 4, 40, y))
+            segs.append(_seg(0, y, 0, y + 4))
+
+        merged = simplify_segments(segs)
+        self.assertEqual(len(merged), 4)
+        total = sum((b - a).length() for a, b in merged)
+        self.assertAlmostEqual(total, 160.0)
+
+    def test_open_staircase_with_tolerance(self):
+        """ขั้นบันไดเล็ก ๆ จะถูกยุบเป็นเส้นเดียวเมื่อ tolerance พอ"""
+        segs = []
+        x, y = 0.0, 0.0
+        for _ in range(10):
+            segs.append(_seg(x, y, x + 2, y))
+            segs.append(_seg(x + 2, y, x + 2, y + 2))
+            x += 2
+            y += 2
+
+        self.assertEqual(len(simplify_segments(segs)), 20)
+        self.assertEqual(len(simplify_segments(segs, tolerance=2.0)), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulate import RandomController, ScriptedController
+
+
+class TestControllers(unittest.TestCase):
+    def test_scripted_steps_repeat_in_order(self):
+        ctrl = ScriptedController([
+            {"t": 0.5, "move": [1, 0], "shoot": True},
+            {"t": 0.25, "move": [0, -1]},
+        ])
+        seen = []
+        for _ in range(8):
+            ctrl.update(None, 0.25)
+            seen.append((tuple(ctrl.move), ctrl.shoot))
+
+        right, up = ((1, 0), True), ((0, -1), False)
+        self.assertEqual(seen, [right, right, up, right, right, up, right, right])
+
+    def test_scripted_rejects_empty_script(self):
+        with self.assertRaises(ValueError):
+            ScriptedController([])
+
+    def test_random_is_reproducible_per_seed(self):
+        def run(seed):
+            ctrl = RandomController(seed=seed, hold=0.1)
+            out = []
+            for _ in range(50):
+                ctrl.update(None, 1 / 120)
+                out.append((tuple(ctrl.move), ctrl.shoot))
+            return out
+
+        self.assertEqual(run(3), run(3))
+        self.assertNotEqual(run(3), run(4))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import random
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from combat.spatial_grid import SpatialHashGrid, StaticRectGrid
+
+
+class _Body:
+    def __init__(self, x, y):
+        self.pos = pygame.Vector2(x, y)
+
+
+class TestSpatialHashGrid(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        self.bodies = [_Body(rng.uniform(-300, 900), rng.uniform(-300, 900)) for _ in range(150)]
+        self.grid = SpatialHashGrid(cell_size=80.0)
+        self.grid.rebuild(self.bodies)
+
+    def test_candidate_pairs_cover_all_close_pairs(self):
+        """ทุกคู่ที่ห่างกันน้อยกว่า cell_size ต้องอยู่ใน candidate_pairs และไม่ซ้ำ"""
+        pairs = list(self.grid.candidate_pairs())
+        seen = {frozenset((id(a), id(b))) for a, b in pairs}
+        self.assertEqual(len(seen), len(pairs), "candidate_pairs should not repeat a pair")
+
+        for i, a in enumerate(self.bodies):
+            for b in self.bodies[i + 1:]:
+                if a.pos.distance_to(b.pos) < 80.0:
+                    self.assertIn(frozenset((id(a), id(b))), seen)
+
+    def test_query_radius_is_superset(self):
+        center = pygame.Vector2(250, 250)
+        found = {id(b) for b in self.grid.query_radius(center, 120.0)}
+        for b in self.bodies:
+            if b.pos.distance_to(center) <= 120.0:
+                self.assertIn(id(b), found)
+
+
+class _Box:
+    def __init__(self, x, y, w, h):
+        self.rect = pygame.Rect(x, y, w, h)
+
+
+class TestStaticRectGrid(unittest.TestCase):
+    def test_query_rect_matches_brute_force_in_insert_order(self):
+        rng = random.Random(3)
+        boxes = [
+            _Box(rng.randint(-200, 2000), rng.randint(-200, 2000), rng.randint(1, 400), rng.randint(1, 400))
+            for _ in range(200)
+        ]
+        grid = StaticRectGrid(cell_size=128.0)
+        for box in boxes:
+            grid.insert(box)
+
+        view = pygame.Rect(300, 450, 700, 500)
+        expected = [box for box in boxes if view.colliderect(box.rect)]
+        self.assertEqual(grid.query_rect(view), expected)
+
+        grid.remove(expected[0])
+        self.assertEqual(grid.query_rect(view), expected[1:])
+        self.assertEqual(len(grid), 199)
+
+
+if __name__ == '__main__':
+    unittest.main()
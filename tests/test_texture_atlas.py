@@ -0,0 +1,66 @@
+import os
+import random
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from core.texture_atlas import TextureAtlas
+
+
+def _frame(rng, w, h):
+    surf = pygame.Surface((w, h), pygame.SRCALPHA)
+    for _ in range(6):
+        color = (rng.randrange(256), rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        surf.fill(color, pygame.Rect(rng.randrange(w), rng.randrange(h), rng.randint(1, w), rng.randint(1, h)))
+    return surf
+
+
+def _pixels(surf):
+    return pygame.image.tobytes(surf, "RGBA")
+
+
+class TestTextureAtlas(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.animations = {
+            (state, direction): [_frame(rng, rng.randint(8, 70), rng.randint(8, 90)) for _ in range(5)]
+            for state in ("idle", "walk", "hurt")
+            for direction in ("down", "left", "right", "up")
+        }
+
+    def test_frames_are_copied_exactly(self):
+        atlas = TextureAtlas.pack(self.animations, max_sheet_size=256)
+
+        self.assertGreater(len(atlas.sheets), 1)
+        self.assertEqual(atlas.frame_count, 60)
+        for key, frames in self.animations.items():
+            packed = atlas.animations[key]
+            self.assertEqual(len(packed), len(frames))
+            for original, region in zip(frames, packed):
+                self.assertEqual(region.get_size(), original.get_size())
+                self.assertEqual(_pixels(region), _pixels(original))
+
+    def test_regions_do_not_overlap_and_fit_sheet(self):
+        atlas = TextureAtlas.pack(self.animations, max_sheet_size=256)
+        seen = {}
+        for frames in atlas.regions.values():
+            for index, rect in frames:
+                sheet_rect = atlas.sheets[index].get_rect()
+                self.assertTrue(sheet_rect.contains(rect))
+                for other in seen.get(index, []):
+                    self.assertFalse(rect.colliderect(other))
+                seen.setdefault(index, []).append(rect)
+
+    def test_shared_surface_is_packed_once(self):
+        shared = _frame(random.Random(1), 20, 20)
+        atlas = TextureAtlas.pack({("a", "down"): [shared, shared], ("a", "up"): [shared]})
+        regions = [r for frames in atlas.regions.values() for r in frames]
+        self.assertEqual(len({(i, tuple(rect)) for i, rect in regions}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from core.resource_manager import ResourceManager
+from world.level_data import LevelData
+from world.tilemap import TileMap
+
+
+class _FakeResources(ResourceManager):
+    """คืน tileset 4x4 tile ที่แต่ละ tile มีสีไม่ซ้ำกัน"""
+
+    def __init__(self, tile_size):
+        super().__init__()
+        self.tile_size = tile_size
+
+    def load_image(self, path):
+        ts = self.tile_size
+        sheet = pygame.Surface((ts * 4, ts * 4), pygame.SRCALPHA)
+        for i in range(16):
+            color = (i * 15, 255 - i * 15, (i * 37) % 256, 255)
+            sheet.fill(color, pygame.Rect((i % 4) * ts, (i // 4) * ts, ts, ts))
+        return sheet
+
+
+def _make_level(width, height, tile_size):
+    ground = [[(x + y) % 16 for x in range(width)] for y in range(height)]
+    decor = [[(x * 3) % 16 if (x + y) % 5 == 0 else -1 for x in range(width)] for y in range(height)]
+    return LevelData(
+        id="test",
+        tileset="test.png",
+        tile_size=tile_size,
+        width=width,
+        height=height,
+        layers={"ground": ground, "decor": decor},
+        player_spawn=(0, 0),
+        enemy_spawns=[],
+        item_spawns=[],
+        decor_spawns=[],
+    )
+
+
+class TestTileMapChunkCache(unittest.TestCase):
+    def _render(self, tilemap, offset):
+        screen = pygame.Surface((300, 200), pygame.SRCALPHA)
+        tilemap.draw(screen, camera_offset=pygame.Vector2(offset))
+        return pygame.image.tobytes(screen, "RGBA")
+
+    def test_chunked_draw_matches_per_tile_draw(self):
+        """ภาพจาก chunk cache ต้องเหมือนการวาดทีละ tile ทุกตำแหน่งกล้อง"""
+        level = _make_level(40, 30, 16)
+        chunked = TileMap(level, _FakeResources(16))
+        per_tile = TileMap(level, _FakeResources(16), use_chunk_cache=False)
+
+        for offset in [(0, 0), (37, 51), (-20, -10), (400, 350), (333, 123)]:
+            self.assertEqual(self._render(chunked, offset), self._render(per_tile, offset), offset)
+
+    def test_cache_is_bounded(self):
+        level = _make_level(80, 80, 16)
+        tilemap = TileMap(level, _FakeResources(16))
+        tilemap.MAX_CACHED_CHUNKS = 3
+
+        for x in range(0, 1000, 100):
+            self._render(tilemap, (x, x))
+
+        self.assertLessEqual(len(tilemap._chunk_cache), 3)
+
+    def test_tile_table_is_shared_per_tileset(self):
+        """tileset เดียวกันต้องหั่นครั้งเดียวแล้วใช้ list เดียวกัน"""
+        resources = _FakeResources(16)
+        level = _make_level(8, 8, 16)
+        first = TileMap(level, resources)
+        second = TileMap(level, resources)
+
+        self.assertIs(first.tiles, second.tiles)
+        self.assertEqual(len(first.tiles), 16)
+        self.assertEqual(first.tiles[5].get_at((0, 0)), (75, 180, 185, 255))
+
+
+if __name__ == '__main__':
+    unittest.main()
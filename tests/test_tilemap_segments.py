@@ -0,0 +1,133 @@
+import os
+import sys
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+
+from core.resource_manager import ResourceManager
+from world.level_data import LevelData
+from world.tilemap import TileMap
+
+V = pygame.Vector2
+
+
+class _FakeResources(ResourceManager):
+    """tileset สีเดียว 4x4 tile (ไม่ต้องมีไฟล์จริง)"""
+
+    def __init__(self, tile_size):
+        super().__init__()
+        self.tile_size = tile_size
+
+    def load_image(self, path):
+        sheet = pygame.Surface((self.tile_size * 4, self.tile_size * 4), pygame.SRCALPHA)
+        sheet.fill((90, 140, 90, 255))
+        return sheet
+
+
+def _make_level(width, height, tile_size):
+    ground = [[0] * width for _ in range(height)]
+    # กรอบรอบแมพ + กำแพงแนวตั้ง / ก้อนกลางแมพ
+    collision = [
+        [1 if x in (0, width - 1) or y in (0, height - 1) or (x == 9 and y < 14) or (14 <= x <= 16 and 5 <= y <= 7)
+         else 0 for x in range(width)]
+        for y in range(height)
+    ]
+    return LevelData(
+        id="test",
+        tileset="test.png",
+        tile_size=tile_size,
+        width=width,
+        height=height,
+        layers={"ground": ground, "collision": collision},
+        player_spawn=(0, 0),
+        enemy_spawns=[],
+        item_spawns=[],
+        decor_spawns=[],
+    )
+
+
+class TestSegmentsNear(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.display.quit()
+
+    def setUp(self):
+        self.tilemap = TileMap(_make_level(24, 20, 16), _FakeResources(16))
+        self.bucket = self.tilemap.SEGMENT_BUCKET_SIZE
+
+    def _brute_force(self, center, radius):
+        """index ของ segment ที่ AABB ทับกรอบ query (รวมขอบ)"""
+        out = []
+        for i, (a, b) in enumerate(self.tilemap.collision_segments):
+            if (min(a.x, b.x) <= center.x + radius and max(a.x, b.x) >= center.x - radius
+                    and min(a.y, b.y) <= center.y + radius and max(a.y, b.y) >= center.y - radius):
+                out.append(i)
+        return out
+
+    def _assert_query(self, center, radius):
+        segments = self.tilemap.collision_segments
+        index_of = {id(seg): i for i, seg in enumerate(segments)}
+        got = [index_of[id(seg)] for seg in self.tilemap.segments_near(center, radius)]
+
+        # เรียงตาม collision_segments และไม่ซ้ำ
+        self.assertEqual(got, sorted(set(got)), f"order at {center} r={radius}")
+        # ไม่พลาดเส้นที่ AABB ทับกรอบ query
+        missing = set(self._brute_force(center, radius)) - set(got)
+        self.assertFalse(missing, f"missing {missing} at {center} r={radius}")
+        # เส้นที่ได้เกินมาต้องอยู่ใน bucket ที่ query ครอบเท่านั้น (ขยายกรอบเป็นขอบ bucket)
+        size = self.bucket
+        lo_x = (center.x - radius) // size * size
+        lo_y = (center.y - radius) // size * size
+        hi_x = ((center.x + radius) // size + 1) * size
+        hi_y = ((center.y + radius) // size + 1) * size
+        for i in got:
+            a, b = segments[i]
+            self.assertTrue(
+                min(a.x, b.x) < hi_x and max(a.x, b.x) >= lo_x and min(a.y, b.y) < hi_y and max(a.y, b.y) >= lo_y,
+                f"segment {i} {a}-{b} outside buckets of {center} r={radius}",
+            )
+
+    def _sweep(self, xs, ys, radii):
+        for x in xs:
+            for y in ys:
+                for r in radii:
+                    self._assert_query(V(x, y), r)
+
+    def test_matches_brute_force_on_map_segments(self):
+        self.assertGreater(len(self.tilemap.collision_segments), 4)
+        b = self.bucket
+        xs = [-20, 0, 10, b - 12, b, b + 0.5, 150, 2 * b, 300, 383, 400]
+        ys = [-8, 0, b - 8, b, 100, 2 * b, 250, 319, 330]
+        self._sweep(xs, ys, [1, 8, 12, 40])
+
+    def test_long_and_negative_segments(self):
+        b = self.bucket
+        self.tilemap.collision_segments = [
+            (V(-150, -40), V(-10, -40)),          # ลบทั้งเส้น ข้ามหลาย bucket
+            (V(-70, -130), V(200, 170)),          # แนวทแยงยาว ผ่าน bucket จำนวนมาก (ลบ -> บวก)
+            (V(b, -b), V(b, 3 * b)),              # ทับขอบ bucket x = 64 พอดี
+            (V(2 * b, 2 * b), V(2 * b, 2 * b)),   # ยาว 0 อยู่บนมุม bucket
+            (V(300, 10), V(-300, 10)),            # ปลายกลับด้าน (a.x > b.x)
+        ]
+        self.tilemap._segment_buckets.clear()
+        self.tilemap._build_segment_index()
+
+        xs = [-200, -b - 0.5, -b, -40, -1, 0, b - 10, b, b + 10, 2 * b, 2 * b - 6, 250]
+        ys = [-150, -b, -40, -0.25, 0, 10, b, 2 * b, 2 * b + 6, 180]
+        self._sweep(xs, ys, [0.5, 6, 10, 70])
+
+        # query ที่แตะปลายเส้นยาว 0 บนมุม bucket พอดี
+        near = self.tilemap.segments_near(V(2 * b - 6, 2 * b), 6)
+        self.assertIn(self.tilemap.collision_segments[3], near)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pygame
+
+from combat.wall_collision import CircleWallResolver, circle_segment_mtv, segments_to_arrays
+
+V = pygame.Vector2
+
+# resolver ดันออกจากเส้นที่จมลึกสุดทีละเส้น ส่วน reference ดันทีละเส้นตามลำดับ
+# สำหรับชุด segment ง่าย ๆ ด้านล่าง ทั้งสองแบบต้องลงตำแหน่งเดียวกัน (ต่างกันแค่ floating point)
+TOLERANCE_PX = 1e-6
+
+
+def _reference(segments, center, radius, passes=8):
+    """วน circle_segment_mtv ทุกเส้นจนไม่ชนแล้ว (แบบ EnemyNode เดิม)"""
+    pos = V(center)
+    for _ in range(passes):
+        moved = False
+        for a, b in segments:
+            mtv = circle_segment_mtv(pos, radius, a, b)
+            if mtv is not None:
+                pos += mtv
+                moved = True
+        if not moved:
+            break
+    return pos
+
+
+class TestCircleWallResolver(unittest.TestCase):
+    # กำแพงตรงแนวนอน y = 100 ยาว 0..200 (หลาย cell ของ grid)
+    STRAIGHT = [(V(0, 100), V(200, 100))]
+    # มุมด้านใน: พื้น y = 100 กับผนัง x = 100 ชนกันที่ (100, 100)
+    INSIDE_CORNER = [(V(20, 100), V(100, 100)), (V(100, 100), V(100, 20))]
+    # สองเส้นใช้ปลายจุดเดียวกัน: ต่อกันตรง ๆ และหักมุมออกด้านนอก
+    SHARED_ENDPOINT = [
+        (V(20, 60), V(80, 60)), (V(80, 60), V(140, 60)),      # ต่อกันเป็นเส้นตรง
+        (V(40, 160), V(100, 160)), (V(100, 160), V(100, 220)),  # มุมนูน (ยอด = (100, 160))
+    ]
+
+    def _resolver(self, segments):
+        a, b = segments_to_arrays(segments)
+        return CircleWallResolver(a, b, iterations=6, bucket_size=16.0)
+
+    def _assert_matches_reference(self, segments, cases):
+        resolver = self._resolver(segments)
+        centers = np.array([c for c, _ in cases], dtype=np.float64)
+        radii = np.array([r for _, r in cases], dtype=np.float64)
+        out = resolver.resolve_arrays(centers, radii)
+        for (center, radius), got in zip(cases, out):
+            want = _reference(segments, center, radius)
+            self.assertLess(
+                max(abs(got[0] - want.x), abs(got[1] - want.y)), TOLERANCE_PX,
+                f"center={center} r={radius}: got {tuple(got)} want {tuple(want)}",
+            )
+            # หลังดันแล้วต้องไม่จมกำแพงเส้นไหนอีก
+            for a, b in segments:
+                self.assertIsNone(circle_segment_mtv(V(*got), radius, a, b))
+
+    def test_straight_wall_matches_scalar(self):
+        self._assert_matches_reference(self.STRAIGHT, [
+            ((50, 94), 10),     # จมจากด้านบน
+            ((150, 107), 10),   # จมจากด้านล่าง
+            ((-4, 96), 10),     # เลยปลายเส้นซ้าย -> ดันออกจากปลายจุด
+            ((63.5, 100.5), 12),  # ตรงขอบ cell (64) เกือบทับเส้น
+        ])
+
+    def test_inside_corner_matches_scalar(self):
+        self._assert_matches_reference(self.INSIDE_CORNER, [
+            ((95, 95), 10),    # จมทั้งสองผนัง
+            ((92, 97), 10),    # จมพื้นลึกกว่า
+            ((97, 60), 10),    # จมผนังเส้นเดียว
+        ])
+
+    def test_shared_endpoint_is_not_pushed_twice(self):
+        cases = [
+            ((80, 54), 10),     # ตรงรอยต่อของเส้นตรงสองเส้น
+            ((106, 154), 10),   # ใกล้ยอดมุมนูน (ปลายจุดของทั้งสองเส้น)
+        ]
+        self._assert_matches_reference(self.SHARED_ENDPOINT, cases)
+
+        out = self._resolver(self.SHARED_ENDPOINT).resolve_arrays(
+            np.array([c for c, _ in cases], dtype=np.float64), np.array([10.0, 10.0])
+        )
+        self.assertAlmostEqual(out[0][1], 50.0)  # ดันแค่พอพ้นเส้น ไม่ใช่ 2 เท่า
+        corner_dist = V(*out[1]).distance_to((100, 160))
+        self.assertAlmostEqual(corner_dist, 10.0)
+
+    def test_bodies_without_contact_are_unchanged(self):
+        resolver = self._resolver(self.INSIDE_CORNER + self.STRAIGHT)
+        centers = np.array([(50.0, 80.0), (300.0, 300.0), (60.3, 120.7)])
+        out = resolver.resolve_arrays(centers, np.array([10.0, 10.0, 8.0]))
+        np.testing.assert_array_equal(out, centers)
+
+    def test_resolve_writes_back_to_deferred_bodies(self):
+        resolver = self._resolver(self.STRAIGHT)
+
+        def body(x, y):
+            rect = pygame.Rect(0, 0, 20, 20)
+            rect.center = (x, y)
+            return SimpleNamespace(pos=V(x, y), radius=10.0, rect=rect)
+
+        hit, free = body(50, 94), body(50, 40)
+        resolver.defer(hit)
+        resolver.defer(free)
+        resolver.resolve()
+
+        self.assertAlmostEqual(hit.pos.y, 90.0)
+        self.assertEqual(hit.rect.center, (50, 90))
+        self.assertEqual(free.pos, V(50, 40))
+        self.assertEqual(free.rect.center, (50, 40))
+
+        # คิวถูกล้างแล้ว: resolve ซ้ำไม่แตะตัวเดิม
+        hit.pos.update(50, 95)
+        resolver.resolve()
+        self.assertEqual(hit.pos, V(50, 95))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+# world/level_manifest.py
+"""
+manifest ของ asset ที่แต่ละด่านต้องใช้ (คำนวณจาก levelXX.json + ENEMY_CONFIG + ITEM_DB ไม่ต้องสร้าง node)
+
+ใช้ตอนเปลี่ยนด่าน:
+    manifest = build_manifest(level_data, resources)
+    preload_level(game, manifest)   # โหลดเฉพาะที่ยังไม่มีใน cache + ปล่อยของด่านก่อนที่ไม่ใช้แล้ว
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List
+
+from core.asset_loader import AssetLoader, ImageRequest
+from core.node_pool import game_pool
+from core.resource_manager import ResourceManager
+from entities.enemy_node import EnemyNode
+from entities.item_node import ItemNode
+from .level_data import LevelData, load_level
+
+# effect ที่ทุกด่านใช้ (BornEffectNode ตอนศัตรูเกิด / รูปดาบของ SwordSlashArcNode)
+EFFECT_IDS = ("born",)
+SHARED_IMAGES: tuple[ImageRequest, ...] = (("effects/sword_slash.png", None),)
+
+# เสียงที่ศัตรูทุกตัวใช้
+ENEMY_SOUNDS = ("sfx/enemy_hit.wav",)
+
+
+@dataclass
+class LevelManifest:
+    level_id: str
+    # load_image(relative_path, scale_override=...) ที่ต้องอยู่ใน cache
+    images: List[ImageRequest] = field(default_factory=list)
+    # ศัตรูที่ต้องมี atlas (เฟรมโหลดแบบ cache=False แล้ว pack เข้า atlas)
+    enemy_ids: List[str] = field(default_factory=list)
+    sounds: List[str] = field(default_factory=list)
+
+    @property
+    def atlas_ids(self) -> set[str]:
+        return {EnemyNode.atlas_id(enemy_id) for enemy_id in self.enemy_ids}
+
+    def enemy_frame_requests(self, resources: ResourceManager, enemy_ids: List[str] | None = None) -> List[ImageRequest]:
+        """เฟรมของศัตรู (ส่งให้ AssetLoader decode ก่อน build atlas)"""
+        requests: List[ImageRequest] = []
+        for enemy_id in self.enemy_ids if enemy_ids is None else enemy_ids:
+            requests.extend(EnemyNode.image_requests(resources, enemy_id))
+        return requests
+
+
+def build_manifest(level: LevelData | str, resources: ResourceManager) -> LevelManifest:
+    level_data = load_level(level) if isinstance(level, str) else level
+    images: List[ImageRequest] = [(f"tiles/{level_data.tileset}", None)]
+
+    enemy_ids = sorted({s.get("type") for s in (level_data.enemy_spawns or []) if s.get("type")})
+
+    item_ids = sorted({s["item_id"] for s in (level_data.item_spawns or []) if s.get("item_id")})
+    for item_id in item_ids:
+        images.extend(ItemNode.image_requests(resources, item_id))
+
+    for spawn in getattr(level_data, "decor_spawns", None) or []:
+        if spawn.get("image"):
+            images.append((spawn["image"], None))
+
+    for effect_id in EFFECT_IDS:
+        images.extend((rel_path, None) for rel_path in resources.frame_sequence(f"effects/{effect_id}"))
+    images.extend(SHARED_IMAGES)
+
+    # ตัดตัวซ้ำ (คงลำดับ)
+    images = list(dict.fromkeys(images))
+    sounds = list(ENEMY_SOUNDS) if enemy_ids else []
+    return LevelManifest(level_data.id, images, enemy_ids, sounds)
+
+
+# ---------- diff กับของที่อยู่ใน cache ----------
+def missing_images(manifest: LevelManifest, resources: ResourceManager) -> List[ImageRequest]:
+    return [(path, scale) for path, scale in manifest.images if not resources.has_image(path, scale)]
+
+
+def missing_enemies(manifest: LevelManifest, resources: ResourceManager) -> List[str]:
+    return [e for e in manifest.enemy_ids if not resources.has_atlas(EnemyNode.atlas_id(e))]
+
+
+def missing_requests(manifest: LevelManifest, resources: ResourceManager) -> tuple[List[str], List[ImageRequest]]:
+    """(ศัตรูที่ยังไม่มี atlas, รูปที่ต้อง decode) = ส่วนต่างระหว่าง manifest กับของที่อยู่ใน cache"""
+    enemies = missing_enemies(manifest, resources)
+    return enemies, missing_images(manifest, resources) + manifest.enemy_frame_requests(resources, enemies)
+
+
+def release_unused(resources: ResourceManager, old: LevelManifest, new: LevelManifest) -> int:
+    """ปล่อย asset ของด่านเก่าที่ด่านใหม่ไม่ใช้ออกจาก cache (คืนจำนวนที่ปล่อย)"""
+    count = 0
+    for path, scale in set(old.images) - set(new.images):
+        resources.release_image(path, scale)
+        count += 1
+    for atlas_id in old.atlas_ids - new.atlas_ids:
+        resources.release_atlas(atlas_id)
+        count += 1
+    for sound in set(old.sounds) - set(new.sounds):
+        resources.release_sound(sound)
+        count += 1
+    return count
+
+
+def switch_level(game, manifest: LevelManifest) -> int:
+    """ปล่อยของด่านก่อน (game.level_manifest) ที่ manifest นี้ไม่ใช้ แล้วจำ manifest นี้ไว้แทน"""
+    previous: LevelManifest | None = getattr(game, "level_manifest", None)
+    released = 0
+    if previous is not None and previous.level_id != manifest.level_id:
+        released = release_unused(game.resources, previous, manifest)
+        # node ที่รออยู่ใน pool มาจากด่านก่อน ทิ้งไปด้วย (ด่านใหม่สร้าง / เติม pool ใหม่เอง)
+        pool = game_pool(game)
+        if pool is not None:
+            pool.clear()
+    game.level_manifest = manifest
+    return released
+
+
+def preload_level(game, manifest: LevelManifest, workers: int | None = None) -> None:
+    """
+    เตรียม asset ของด่านให้ครบแบบ block (ใช้ตอนเปลี่ยนด่านใน GameScene)
+    - ปล่อยของด่านก่อน (game.level_manifest) ที่ด่านนี้ไม่ใช้
+    - decode เฉพาะรูปที่ยังไม่มีใน cache บน thread pool แล้ว build atlas ของศัตรูที่ยังไม่มี
+    """
+    resources: ResourceManager = game.resources
+    switch_level(game, manifest)
+
+    enemies, requests = missing_requests(manifest, resources)
+    if requests:
+        loader = AssetLoader(resources, max_workers=workers)
+        try:
+            loader.submit(requests)
+            loader.wait()
+        finally:
+            loader.shutdown()
+        for rel_path, ex in loader.failed:
+            print(f"[WARN] preload decode failed: {rel_path}: {ex}")
+
+    for path, scale in manifest.images:
+        try:
+            resources.load_image(path, scale_override=scale)
+        except Exception as e:
+            print(f"[WARN] preload image failed: {path}: {e}")
+    for enemy_id in enemies:
+        try:
+            EnemyNode.build_atlas(resources, enemy_id)
+        except Exception as e:
+            print(f"[WARN] preload enemy assets failed for '{enemy_id}': {e}")
+    for sound in manifest.sounds:
+        try:
+            resources.load_sound(sound)
+        except Exception as e:
+            print(f"[WARN] preload sound failed: {sound}: {e}")
+
+    # เฟรมที่ decode ไว้แต่ไม่มีใครหยิบ (เช่นเฟรมที่เลขไม่ต่อกัน) ไม่ต้องค้างไว้
+    resources.clear_staged()
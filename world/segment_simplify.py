@@ -0,0 +1,184 @@
+# world/segment_simplify.py
+"""
+ลดจำนวน collision segments ที่ได้จาก marching-squares
+
+marching-squares จะให้ segment สั้น ๆ ทีละครึ่ง cell ทำให้กำแพงตรง ๆ
+กลายเป็น segment หลายร้อยเส้นเรียงต่อกัน โมดูลนี้จะ
+
+1) ต่อ segment ที่ปลายชนกันให้เป็น polyline (chain)
+2) รวมจุดที่อยู่บนเส้นตรงเดียวกัน (collinear) -> เหลือ segment ยาวเส้นเดียว
+3) (optional) ลดจุดเพิ่มด้วย Douglas–Peucker ตาม tolerance (px)
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import pygame
+
+Segment = Tuple[pygame.Vector2, pygame.Vector2]
+_Key = Tuple[float, float]
+
+# ค่าคลาดเคลื่อนสำหรับเช็คจุดซ้ำ / collinear (px)
+_EPS = 1e-6
+
+
+def _key(p: pygame.Vector2) -> _Key:
+    return (round(p.x, 6), round(p.y, 6))
+
+
+def _build_chains(segments: List[Segment]) -> List[Tuple[List[pygame.Vector2], bool]]:
+    """
+    ต่อ segment เป็น polyline
+    คืน list ของ (points, closed) โดย closed=True ถ้าเป็นวงปิด
+    """
+    points: Dict[_Key, pygame.Vector2] = {}
+    adjacency: Dict[_Key, List[int]] = {}
+    ends: List[Tuple[_Key, _Key]] = []
+
+    for i, (a, b) in enumerate(segments):
+        ka, kb = _key(a), _key(b)
+        points.setdefault(ka, a)
+        points.setdefault(kb, b)
+        adjacency.setdefault(ka, []).append(i)
+        adjacency.setdefault(kb, []).append(i)
+        ends.append((ka, kb))
+
+    used = [False] * len(segments)
+
+    def walk(start_key: _Key, seg_index: int) -> List[_Key]:
+        """เดินจาก start_key ไปตาม segment ต่อกันจนสุดทาง (หรือแยกทาง)"""
+        path = [start_key]
+        current = start_key
+        idx = seg_index
+        while True:
+            used[idx] = True
+            ka, kb = ends[idx]
+            nxt = kb if ka == current else ka
+            path.append(nxt)
+            current = nxt
+
+            # ต่อได้เฉพาะจุดที่มีแค่ 2 segment (ไม่ใช่ทางแยก)
+            links = adjacency[current]
+            if len(links) != 2:
+                break
+            idx = links[0] if links[1] == idx else links[1]
+            if used[idx]:
+                break
+        return path
+
+    chains: List[Tuple[List[pygame.Vector2], bool]] = []
+
+    # 1) เริ่มจากปลายเปิด / ทางแยกก่อน (polyline ที่ไม่ใช่วงปิด)
+    for key, links in adjacency.items():
+        if len(links) == 2:
+            continue
+        for idx in links:
+            if used[idx]:
+                continue
+            path = walk(key, idx)
+            chains.append(([points[k] for k in path], False))
+
+    # 2) ที่เหลือเป็นวงปิดทั้งหมด
+    for idx in range(len(segments)):
+        if used[idx]:
+            continue
+        start = ends[idx][0]
+        path = walk(start, idx)
+        closed = len(path) > 2 and path[0] == path[-1]
+        chains.append(([points[k] for k in path], closed))
+
+    return chains
+
+
+def _is_collinear(prev: pygame.Vector2, p: pygame.Vector2, nxt: pygame.Vector2) -> bool:
+    d1 = p - prev
+    d2 = nxt - p
+    cross = d1.x * d2.y - d1.y * d2.x
+    # ต้องอยู่บนเส้นเดียวกัน และไปทางเดียวกัน (ไม่ย้อนกลับ)
+    return abs(cross) <= _EPS and d1.dot(d2) > 0
+
+
+def _merge_collinear(pts: List[pygame.Vector2], closed: bool) -> List[pygame.Vector2]:
+    if len(pts) < 3:
+        return pts
+
+    if closed:
+        # pts[0] == pts[-1] : หมุนให้เริ่มที่ "มุม" จริง เพื่อไม่ให้ตัดกลางเส้นตรง
+        ring = pts[:-1]
+        n = len(ring)
+        start = 0
+        for i in range(n):
+            if not _is_collinear(ring[i - 1], ring[i], ring[(i + 1) % n]):
+                start = i
+                break
+        else:
+            return pts  # ทุกจุดอยู่บนเส้นเดียวกัน (ไม่ควรเกิด)
+        pts = ring[start:] + ring[:start] + [ring[start]]
+
+    merged = [pts[0]]
+    for i in range(1, len(pts) - 1):
+        if _is_collinear(merged[-1], pts[i], pts[i + 1]):
+            continue
+        merged.append(pts[i])
+    merged.append(pts[-1])
+    return merged
+
+
+def _point_line_distance(p: pygame.Vector2, a: pygame.Vector2, b: pygame.Vector2) -> float:
+    ab = b - a
+    length_sq = ab.length_squared()
+    if length_sq == 0:
+        return (p - a).length()
+    cross = ab.x * (p.y - a.y) - ab.y * (p.x - a.x)
+    return abs(cross) / (length_sq ** 0.5)
+
+
+def _douglas_peucker(pts: List[pygame.Vector2], tolerance: float) -> List[pygame.Vector2]:
+    """Douglas–Peucker แบบ iterative (กัน recursion ลึกบนกำแพงยาว ๆ)"""
+    n = len(pts)
+    if n < 3:
+        return pts
+
+    keep = [False] * n
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        a, b = pts[first], pts[last]
+        max_dist = -1.0
+        index = -1
+        for i in range(first + 1, last):
+            d = _point_line_distance(pts[i], a, b)
+            if d > max_dist:
+                max_dist = d
+                index = i
+        if index != -1 and max_dist > tolerance:
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+
+    return [p for p, k in zip(pts, keep) if k]
+
+
+def simplify_segments(segments: List[Segment], tolerance: float = 0.0) -> List[Segment]:
+    """
+    รวม segment ที่ต่อกันเป็นเส้นตรงเดียวกันให้เป็นเส้นยาว
+
+    tolerance:
+        0    = รวมเฉพาะจุดที่ collinear จริง (รูปทรงกำแพงไม่เปลี่ยน)
+        > 0  = ใช้ Douglas–Peucker ลดจุดเพิ่ม โดยกำแพงขยับได้ไม่เกิน tolerance px
+    """
+    if not segments:
+        return []
+
+    result: List[Segment] = []
+    for pts, closed in _build_chains(segments):
+        pts = _merge_collinear(pts, closed)
+        if tolerance > 0:
+            pts = _douglas_peucker(pts, tolerance)
+        for i in range(len(pts) - 1):
+            a, b = pts[i], pts[i + 1]
+            if (b - a).length_squared() > 0:
+                result.append((pygame.Vector2(a), pygame.Vector2(b)))
+    return result
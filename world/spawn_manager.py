@@ -7,6 +7,7 @@ from typing import Any, Dict, List
 
 from entities.enemy_node import EnemyNode
 from entities.born_effect_node import BornEffectNode
+from core.rng import game_stream
 from world.level_data import LevelData
 
 
@@ -23,8 +24,8 @@ class SpawnManager:
         # ✅ เก็บเอฟเฟ็กต์ที่กำลังเล่นอยู่ แยกตาม spawn_id
         self._active_effects: dict[int, BornEffectNode] = {}
 
-        import random  # Import at top or here if needed (better at top, but for replacing block here works)
-        
+        rng = game_stream(game, "spawn")
+
         spawn_id = 0
 
         for spawn in level_data.enemy_spawns:
@@ -45,8 +46,8 @@ class SpawnManager:
                     pos = base_pos
                 else:
                     # offset +/- 16 pixels
-                    ox = random.randint(-16, 16)
-                    oy = random.randint(-16, 16)
+                    ox = rng.randint(-16, 16)
+                    oy = rng.randint(-16, 16)
                     pos = (base_pos[0] + ox, base_pos[1] + oy)
 
                 # ถ้ากำหนดเวลาเกิด (>0) -> มี born_effect ก่อน
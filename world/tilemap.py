@@ -19,11 +19,15 @@ convention:
 
 from __future__ import annotations
 
-from typing import List
+import math
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
 import pygame
 
 from .level_data import LevelData
+from .segment_simplify import simplify_segments
+from combat.wall_collision import segments_to_arrays
 from core.resource_manager import ResourceManager
 
 
@@ -42,9 +46,44 @@ class TileMap:
     # ลำดับการวาดเลเยอร์หลัก (จากหลังมาหน้า)
     DEFAULT_DRAW_ORDER = ["ground", "detail", "decor"]
 
-    def __init__(self, level_data: LevelData, resources: ResourceManager) -> None:
+    # ขนาด bucket (px) ของ spatial index สำหรับ collision_segments
+    SEGMENT_BUCKET_SIZE = 64
+
+    # รวม segment marching-squares ที่อยู่บนเส้นตรงเดียวกันตอนโหลดแมพ
+    MERGE_COLLISION_SEGMENTS = True
+    # tolerance (px) ของ Douglas–Peucker (0 = ปิด, รวมแค่ collinear จริง)
+    SEGMENT_SIMPLIFY_TOLERANCE = 0.0
+
+    # ---------- chunk cache ของเลเยอร์ static ----------
+    # ขนาด chunk (px) ที่ bake tile หลายเลเยอร์รวมเป็น surface เดียว
+    CHUNK_SIZE = 256
+    # จำนวน chunk สูงสุดที่เก็บไว้ (LRU) – จอ 1440x800 ใช้ราว 4–9 chunk ต่อกลุ่มเลเยอร์
+    MAX_CACHED_CHUNKS = 48
+
+    def __init__(
+        self,
+        level_data: LevelData,
+        resources: ResourceManager,
+        merge_segments: bool | None = None,
+        simplify_tolerance: float | None = None,
+        use_chunk_cache: bool = True,
+    ) -> None:
+        """
+        merge_segments     : รวม segment ที่ collinear (None = ใช้ MERGE_COLLISION_SEGMENTS)
+        simplify_tolerance : tolerance ของ Douglas–Peucker เป็น px
+                             (None = ใช้ SEGMENT_SIMPLIFY_TOLERANCE)
+        use_chunk_cache    : วาดจาก chunk ที่ bake ไว้แทนการ blit ทีละ tile
+        """
         self.level_data = level_data
         self.resources = resources
+        self.use_chunk_cache = use_chunk_cache
+
+        self.merge_segments = (
+            self.MERGE_COLLISION_SEGMENTS if merge_segments is None else merge_segments
+        )
+        self.simplify_tolerance = (
+            self.SEGMENT_SIMPLIFY_TOLERANCE if simplify_tolerance is None else simplify_tolerance
+        )
 
         self.tile_size = level_data.tile_size
 
@@ -70,6 +109,11 @@ class TileMap:
         self.tiles_per_col = self.tileset.get_height() // self.tile_size
         self.num_tiles = self.tiles_per_row * self.tiles_per_col
 
+        # tile ที่หั่นไว้แล้ว (แชร์ผ่าน ResourceManager) -> วาดด้วยการ lookup list ตรง ๆ
+        self.tiles: List[pygame.Surface] = self.resources.load_tile_table(
+            f"tiles/{level_data.tileset}", self.tile_size
+        )
+
         # surface ของ map ทั้งแผ่น (เพื่อความเข้ากันได้กับโค้ดเก่า)
         self.surface = pygame.Surface(
             (self.pixel_width, self.pixel_height),
@@ -83,9 +127,25 @@ class TileMap:
         # list[tuple[pygame.Vector2, pygame.Vector2]]
         self.collision_segments: list[tuple[pygame.Vector2, pygame.Vector2]] = []
 
+        # spatial index ของ segments: (bx, by) -> index ใน collision_segments
+        # สร้างครั้งเดียวตอนโหลด (segment ไม่เปลี่ยนระหว่างเล่น)
+        self._segment_buckets: Dict[Tuple[int, int], List[int]] = {}
+
+        # segment ในรูป numpy array (S, 2) สำหรับ batch resolver (combat.wall_collision)
+        self.segment_a, self.segment_b = segments_to_arrays([])
+
+        # จำนวน segment ก่อน/หลังรวมเส้น (เอาไว้ดูผลของ simplification)
+        self.segment_count_raw = 0
+        self.segment_count = 0
+
         # เก็บ reference ไปที่เลเยอร์ทั้งหมด
         self.layers = self.level_data.layers
 
+        # chunk ที่ bake แล้ว: (layer_names, cx, cy) -> Surface (เรียงตามการใช้งานล่าสุด)
+        # เลเยอร์ที่วาดไม่เปลี่ยนระหว่างเล่น จึงไม่ต้อง invalidate เอง
+        self.chunk_tiles = max(1, self.CHUNK_SIZE // self.tile_size)
+        self.chunk_pixels = self.chunk_tiles * self.tile_size
+        self._chunk_cache: "OrderedDict[Tuple[Tuple[str, ...], int, int], pygame.Surface]" = OrderedDict()
 
         # สร้างลิสต์ลำดับการวาดจาก DEFAULT_DRAW_ORDER + เลเยอร์อื่น ๆ
         self.draw_order: List[str] = []
@@ -109,41 +169,40 @@ class TileMap:
         - ถ้า index น้อยกว่า 0 หรือมากเกินจำนวน tile จะ fallback ไป tile 0
           หรือ return None ถ้าไม่มี tile เลย
         """
-        if self.num_tiles <= 0:
+        tiles = self.tiles
+        if not tiles:
             return None
 
-        if tile_index < 0 or tile_index >= self.num_tiles:
+        if tile_index < 0 or tile_index >= len(tiles):
             # ป้องกัน index เกิน: ใช้ tile แรกแทน
             tile_index = 0
 
-        col = tile_index % self.tiles_per_row
-        row = tile_index // self.tiles_per_row
-        x = col * self.tile_size
-        y = row * self.tile_size
-        rect = pygame.Rect(x, y, self.tile_size, self.tile_size)
-        return self.tileset.subsurface(rect)
+        return tiles[tile_index]
 
     def _build_layer_to_surface(self, layer_name: str) -> None:
         """
         วาดทั้งเลเยอร์ลง self.surface (ใช้ครั้งเดียวตอน _build)
         """
         grid = self.layers.get(layer_name)
-        if not grid:
+        tiles = self.tiles
+        if not grid or not tiles:
             return
 
-        for y, row in enumerate(grid):
-            for x, value in enumerate(row):
-                # convention:
-                #   < 0  = ช่องว่าง ไม่วาด
-                #   >= 0 = index ของ tile (0-based)
-                if value < 0:
-                    continue
-
-                tile_image = self._get_tile_image(value)
-                if tile_image is None:
-                    continue
+        num_tiles = len(tiles)
+        tile_size = self.tile_size
 
-                self.surface.blit(tile_image, (x * self.tile_size, y * self.tile_size))
+        # convention:
+        #   < 0  = ช่องว่าง ไม่วาด
+        #   >= 0 = index ของ tile (0-based) (เกินจำนวน tile -> ใช้ tile แรก)
+        self.surface.blits(
+            [
+                (tiles[value] if value < num_tiles else tiles[0], (x * tile_size, y * tile_size))
+                for y, row in enumerate(grid)
+                for x, value in enumerate(row)
+                if value >= 0
+            ],
+            doreturn=False,
+        )
 
     def _draw_layer(
         self,
@@ -155,13 +214,15 @@ class TileMap:
         วาดเลเยอร์ชื่อ layer_name ลงบน surface ตามตำแหน่งกล้อง (camera_offset)
         """
         grid = self.layers.get(layer_name)
-        if not grid:
+        tiles = self.tiles
+        if not grid or not tiles:
             return
 
         if camera_offset is None:
             camera_offset = pygame.Vector2(0, 0)
 
         tile_size = self.tile_size
+        num_tiles = len(tiles)
 
         # ใช้ขนาดจริงของเลเยอร์นี้ (กัน list index out of range)
         map_height = len(grid)
@@ -175,23 +236,119 @@ class TileMap:
         end_x = min(int((camera_offset.x + screen_w) // tile_size) + 1, map_width)
         end_y = min(int((camera_offset.y + screen_h) // tile_size) + 1, map_height)
 
+        # รวม (tile, ตำแหน่ง) ของทั้งเลเยอร์แล้วส่ง blits() ครั้งเดียว
+        ox = camera_offset.x
+        oy = camera_offset.y
+        blit_list = []
+        append = blit_list.append
         for y in range(start_y, end_y):
             row = grid[y]
-            
+            draw_y = y * tile_size - oy
+
             for x in range(start_x, end_x):
                 value = row[x]
 
                 if value < 0:
                     continue
 
-                tile_image = self._get_tile_image(value)
-                if tile_image is None:
-                    continue
+                tile_image = tiles[value] if value < num_tiles else tiles[0]
+                append((tile_image, (x * tile_size - ox, draw_y)))
+
+        surface.blits(blit_list, doreturn=False)
+
+    # ---------- chunk cache ----------
 
-                draw_x = x * tile_size - camera_offset.x
-                draw_y = y * tile_size - camera_offset.y
+    def _bake_chunk(self, layer_names: Tuple[str, ...], cx: int, cy: int) -> pygame.Surface:
+        """
+        วาด tile ของทุกเลเยอร์ใน layer_names (ตามลำดับ) ที่อยู่ใน chunk (cx, cy)
+        ลง surface ขนาด chunk_pixels x chunk_pixels
+        """
+        tile_size = self.tile_size
+        size = self.chunk_pixels
+        chunk = pygame.Surface((size, size), pygame.SRCALPHA)
+
+        tiles = self.tiles
+        num_tiles = len(tiles)
+        if not tiles:
+            return chunk
+
+        start_x = cx * self.chunk_tiles
+        start_y = cy * self.chunk_tiles
+
+        for layer_name in layer_names:
+            grid = self.layers.get(layer_name)
+            if not grid:
+                continue
+
+            map_height = len(grid)
+            map_width = len(grid[0]) if map_height > 0 else 0
+            end_x = min(start_x + self.chunk_tiles, map_width)
+            end_y = min(start_y + self.chunk_tiles, map_height)
+
+            blit_list = []
+            for y in range(start_y, end_y):
+                row = grid[y]
+                local_y = (y - start_y) * tile_size
+                for x in range(start_x, end_x):
+                    value = row[x]
+                    if value < 0:
+                        continue
+
+                    tile_image = tiles[value] if value < num_tiles else tiles[0]
+                    blit_list.append((tile_image, ((x - start_x) * tile_size, local_y)))
+            chunk.blits(blit_list, doreturn=False)
+
+        # แปลงเป็น pixel format ของจอ (blit เร็วขึ้น) ถ้ามีจอแล้ว
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert_alpha()
+        return chunk
+
+    def _get_chunk(self, layer_names: Tuple[str, ...], cx: int, cy: int) -> pygame.Surface:
+        """ดึง chunk จาก cache (bake ตอนเห็นครั้งแรก) และไล่ตัวที่ไม่ได้ใช้นานสุดออก"""
+        key = (layer_names, cx, cy)
+        cache = self._chunk_cache
+
+        chunk = cache.get(key)
+        if chunk is not None:
+            cache.move_to_end(key)
+            return chunk
+
+        chunk = self._bake_chunk(layer_names, cx, cy)
+        cache[key] = chunk
+        while len(cache) > self.MAX_CACHED_CHUNKS:
+            cache.popitem(last=False)
+        return chunk
+
+    def _draw_chunks(
+        self,
+        surface: pygame.Surface,
+        layer_names: Tuple[str, ...],
+        camera_offset: pygame.Vector2,
+    ) -> None:
+        """วาดเฉพาะ chunk ที่อยู่ในจอ (ปกติ 4–9 ชิ้น)"""
+        size = self.chunk_pixels
+        screen_w, screen_h = surface.get_size()
+
+        max_cx = (self.width - 1) // self.chunk_tiles
+        max_cy = (self.height - 1) // self.chunk_tiles
+
+        start_cx = max(int(camera_offset.x // size), 0)
+        start_cy = max(int(camera_offset.y // size), 0)
+        end_cx = min(int((camera_offset.x + screen_w) // size), max_cx)
+        end_cy = min(int((camera_offset.y + screen_h) // size), max_cy)
+
+        surface.blits(
+            [
+                (self._get_chunk(layer_names, cx, cy), (cx * size - camera_offset.x, cy * size - camera_offset.y))
+                for cy in range(start_cy, end_cy + 1)
+                for cx in range(start_cx, end_cx + 1)
+            ],
+            doreturn=False,
+        )
 
-                surface.blit(tile_image, (draw_x, draw_y))
+    def clear_chunk_cache(self) -> None:
+        """ล้าง chunk ที่ bake ไว้ทั้งหมด (เช่น ถ้าแก้ไข layers ระหว่างเล่น)"""
+        self._chunk_cache.clear()
 
     # จัดการกับการชน ทั้ง rect และ segment
     def _build_collision(self) -> None:
@@ -275,19 +432,54 @@ class TileMap:
                     segments.append((pts_only[0], pts_only[1]))
                     segments.append((pts_only[2], pts_only[3]))
 
-        self.collision_segments = segments
+        self.segment_count_raw = len(segments)
+
+        # ---------- 3) (optional) รวม segment ที่อยู่บนเส้นตรงเดียวกัน ----------
+        if self.merge_segments:
+            segments = simplify_segments(segments, tolerance=self.simplify_tolerance)
+            print(
+                f"[TileMap] {self.level_data.id}: collision segments "
+                f"{self.segment_count_raw} -> {len(segments)}"
+            )
 
+        self.segment_count = len(segments)
+        self.collision_segments = segments
 
+    def _build_segment_index(self) -> None:
+        """
+        แบ่ง collision_segments ลง bucket แบบ uniform grid (broad-phase)
+        - segment หนึ่งเส้นจะอยู่ในทุก bucket ที่ AABB ของมันทับ
+        - ใช้กับ segments_near() ตอนชนแบบ circle vs segment
+        """
+        self._segment_buckets.clear()
+        self.segment_a, self.segment_b = segments_to_arrays(self.collision_segments)
+
+        inv = 1.0 / self.SEGMENT_BUCKET_SIZE
+        buckets = self._segment_buckets
+
+        for i, (a, b) in enumerate(self.collision_segments):
+            min_bx = math.floor(min(a.x, b.x) * inv)
+            max_bx = math.floor(max(a.x, b.x) * inv)
+            min_by = math.floor(min(a.y, b.y) * inv)
+            max_by = math.floor(max(a.y, b.y) * inv)
+            for by in range(min_by, max_by + 1):
+                for bx in range(min_bx, max_bx + 1):
+                    bucket = buckets.get((bx, by))
+                    if bucket is None:
+                        buckets[(bx, by)] = [i]
+                    else:
+                        bucket.append(i)
 
     def _build(self) -> None:
         """
         ทำงานครั้งเดียวตอนสร้าง TileMap
         - วาด layer "ground" ลง self.surface (เพื่อความเข้ากันได้กับโค้ดเดิม)
-        - สร้าง collision_rects
+        - สร้าง collision_rects / collision_segments + spatial index ของ segments
         """
         if "ground" in self.layers:
             self._build_layer_to_surface("ground")
         self._build_collision()
+        self._build_segment_index()
 
     # ---------- public API ----------
 
@@ -302,6 +494,10 @@ class TileMap:
         if camera_offset is None:
             camera_offset = pygame.Vector2(0, 0)
 
+        if self.use_chunk_cache:
+            self._draw_chunks(surface, tuple(self.draw_order), camera_offset)
+            return
+
         for layer_name in self.draw_order:
             self._draw_layer(surface, layer_name, camera_offset)
 
@@ -318,7 +514,42 @@ class TileMap:
             camera_offset = pygame.Vector2(0, 0)
 
         if "foreground" in self.layers:
-            self._draw_layer(surface, "foreground", camera_offset)
+            if self.use_chunk_cache:
+                self._draw_chunks(surface, ("foreground",), camera_offset)
+            else:
+                self._draw_layer(surface, "foreground", camera_offset)
+
+    def segments_near(
+        self,
+        center: pygame.Vector2,
+        radius: float,
+    ) -> list[tuple[pygame.Vector2, pygame.Vector2]]:
+        """
+        คืน collision_segments ที่อาจชนกับวงกลม (center, radius)
+        (broad-phase จาก bucket: ผู้เรียกยังต้องเช็คชนจริงเอง)
+
+        ลำดับของผลลัพธ์เหมือนใน collision_segments เพื่อให้ผลการดันออกจากกำแพง
+        เหมือนกับการวนทุกเส้นแบบเดิม
+        """
+        buckets = self._segment_buckets
+        if not buckets:
+            return []
+
+        inv = 1.0 / self.SEGMENT_BUCKET_SIZE
+        min_bx = math.floor((center.x - radius) * inv)
+        max_bx = math.floor((center.x + radius) * inv)
+        min_by = math.floor((center.y - radius) * inv)
+        max_by = math.floor((center.y + radius) * inv)
+
+        found: set[int] = set()
+        for by in range(min_by, max_by + 1):
+            for bx in range(min_bx, max_bx + 1):
+                bucket = buckets.get((bx, by))
+                if bucket:
+                    found.update(bucket)
+
+        segments = self.collision_segments
+        return [segments[i] for i in sorted(found)]
 
     def get_world_size(self) -> tuple[int, int]:
         """